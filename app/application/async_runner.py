@@ -0,0 +1,149 @@
+# app/application/async_runner.py
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Optional, Dict, Any, List
+
+from app.domain.models import DEFAULT_OWNER
+from app.application.ports import AsyncIO, Calendar
+from app.workflows.schedule.state_ops import initial_state, resume_with_answer
+
+
+class AsyncSchedulerRunner:
+    """
+    Async counterpart of SchedulerRunner: same flow, but the graph runs via
+    graph.ainvoke and the user is reached through an AsyncIO port, so one
+    event loop can hold many conversations that are waiting on the model or
+    on a human.
+
+    Calendar calls stay synchronous; they are in-process index lookups.
+    """
+
+    def __init__(self, graph, io: AsyncIO, calendar: Calendar, tz: str = "America/Chicago",
+                 owner: str = DEFAULT_OWNER):
+        """
+        Args:
+            graph: compiled LangGraph (must expose .ainvoke(state) -> state)
+            io: async UI port (CLI/web/service session)
+            calendar: Calendar port
+            tz: IANA timezone string used for display and time anchoring
+            owner: whose calendar to check and book (user or resource id)
+        """
+        self.graph = graph
+        self.io = io
+        self.calendar = calendar
+        self.tz = tz
+        self.owner = owner
+
+    def _session(self) -> Optional[Dict[str, Any]]:
+        """LangGraph config for one conversation when the graph checkpoints; None otherwise."""
+        if getattr(self.graph, "checkpointer", None) is None:
+            return None
+        return {"configurable": {"thread_id": uuid.uuid4().hex}}
+
+    async def schedule(self, user_text: str, *, max_clarify: int = 3) -> Dict[str, Any]:
+        """Run the scheduling flow; see SchedulerRunner.schedule for the steps."""
+        state = initial_state(user_text, self.tz, owner=self.owner)
+        config = self._session()
+        tries = 0
+
+        # ---- Clarify loop ----
+        try:
+            while True:
+                result = await self.graph.ainvoke(state, config)
+
+                if result.get("clarify") and not result.get("meeting"):
+                    tries += 1
+                    answer = await self.io.ask(f"🤔 {result['clarify']}")
+                    if not answer or answer.lower() in {"q", "quit", "cancel"}:
+                        await self.io.info("Aborted by user.")
+                        return result
+
+                    patch = resume_with_answer(answer)
+                    state = patch if config else {**result, **patch}
+
+                    if tries >= max_clarify:
+                        await self.io.warn("Too many clarification attempts. Try rephrasing your request.")
+                        return result
+                    continue
+                break
+        finally:
+            if config is not None:
+                await self.graph.checkpointer.adelete_thread(config["configurable"]["thread_id"])
+
+        meeting = result.get("meeting")
+        conflict = result.get("conflict")
+        errors = result.get("errors")
+
+        # ---- No meeting extracted → report and exit ----
+        if not meeting:
+            await self.io.warn("Could not extract a valid meeting.")
+            if result.get("clarify"):
+                await self.io.info(f"Clarify: {result['clarify']}")
+            if errors:
+                await self.io.info("Errors:")
+                for e in errors:
+                    await self.io.info(f"  {str(e)[:500]}")
+            return result
+
+        summary = result.get("review")
+        if not summary:
+            raise RuntimeError("Graph invariant violated: meeting present but review missing")
+
+        # The graph holds the slot when it's free; commit on yes, release otherwise
+        hold_id = result.get("hold")
+        try:
+            # ---- Conflict present → offer free slots; book only if one is picked ----
+            if conflict:
+                await self.io.warn(f"Conflict detected:\n  {conflict}")
+                await self.io.review_summary(summary)
+                picked = await self._offer_slots(self.calendar.free_slots(meeting, owner=self.owner))
+                if picked is None:
+                    await self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
+                    return result
+                meeting = meeting.model_copy(update={"starts_at": picked})
+                h = self.calendar.hold(meeting, owner=self.owner)
+                if h.conflict:
+                    await self.io.warn(f"That slot was just taken:\n  {h.conflict}")
+                    return {**result, "conflict": h.conflict}
+                hold_id = h.id
+                summary = {**summary, "when": picked.astimezone(ZoneInfo(self.tz)).isoformat(timespec="minutes")}
+                result = {**result, "meeting": meeting, "review": summary, "conflict": None, "hold": hold_id}
+
+            # ---- Confirm before booking ----
+            await self.io.review_summary(summary)
+            if await self.io.confirm("Book this on the calendar?"):
+                lost = self.calendar.commit_hold(hold_id, owner=self.owner)
+                hold_id = None   # committed, or already gone
+                if lost:
+                    await self.io.warn(f"Slot was booked by someone else meanwhile:\n  {lost}")
+                    result = {**result, "conflict": lost}
+                else:
+                    await self.io.info("📅 Event created.")
+            else:
+                await self.io.info("Okay — not booked.")
+        finally:
+            if hold_id:
+                self.calendar.release_hold(hold_id, owner=self.owner)
+
+        await self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
+        return result
+
+    async def _offer_slots(self, slots: List[datetime]) -> Optional[datetime]:
+        """Ask the user to pick one of the suggested free slots. None = keep nothing."""
+        if not slots:
+            await self.io.info("No free slot found in the next two weeks.")
+            return None
+        tzinfo = ZoneInfo(self.tz)
+        await self.io.info("Free slots:")
+        for i, slot in enumerate(slots, start=1):
+            await self.io.info(f"  {i}) {slot.astimezone(tzinfo).isoformat(timespec='minutes')}")
+        answer = await self.io.ask(f"Pick a slot (1-{len(slots)}) or press Enter to skip")
+        if answer.isdigit() and 1 <= int(answer) <= len(slots):
+            return slots[int(answer) - 1]
+        return None
+
+    async def list_events(self) -> None:
+        await self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
@@ -0,0 +1,119 @@
+# app/application/batch_runner.py
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional
+
+from app.application.ports import Calendar
+from app.domain.models import DEFAULT_OWNER
+from app.workflows.schedule.state_ops import initial_state
+
+Policy = Literal["dry-run", "auto-book"]
+
+
+class BatchRunner:
+    """
+    Non-interactive counterpart of SchedulerRunner for many requests at once.
+
+      - runs each request through the compiled graph on a bounded thread pool
+      - never asks or confirms: clarify questions and conflicts are reported,
+        and booking follows the policy ("dry-run" never books, "auto-book"
+        books every conflict-free meeting)
+      - yields one JSON-ready dict per request, in input order or as completed
+
+    Only `workers` requests are in flight at once, so a file of thousands of
+    lines is read lazily and memory stays flat.
+    """
+
+    def __init__(self, graph, calendar: Calendar, tz: str = "America/Chicago",
+                 *, policy: Policy = "dry-run", workers: int = 4, owner: str = DEFAULT_OWNER):
+        """
+        Args:
+            graph: compiled LangGraph (must expose .invoke(state) -> state)
+            calendar: Calendar port used for auto-booking
+            tz: IANA timezone string used for time anchoring
+            policy: "dry-run" or "auto-book"
+            workers: maximum number of requests in flight
+            owner: calendar owner for items that don't name one
+        """
+        self.graph = graph
+        self.calendar = calendar
+        self.tz = tz
+        self.policy = policy
+        self.workers = max(1, workers)
+        self.owner = owner
+
+    def run_one(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process a single request dict ({"text": ..., optional "id"/"owner"}) into a result dict.
+        Items the reader flagged with an "error" come back as an error result without running.
+        """
+        t0 = time.perf_counter()
+        owner = item.get("owner") or self.owner
+        out: Dict[str, Any] = {"id": item.get("id"), "owner": owner, "text": item.get("text")}
+        if "error" in item:
+            # The reader could not parse this line; report it and move on
+            out["status"] = "error"
+            out["errors"] = [item["error"]]
+            out["elapsed_ms"] = 0.0
+            return out
+        hold_id: Optional[str] = None
+        try:
+            result = self.graph.invoke(initial_state(item["text"], self.tz, owner=owner))
+            meeting = result.get("meeting")
+            conflict = result.get("conflict")
+            hold_id = result.get("hold")
+            out["fast_path"] = bool(result.get("fast_path"))
+            if not meeting:
+                out["status"] = "clarify" if result.get("clarify") else "invalid"
+                out["clarify"] = result.get("clarify")
+                out["errors"] = [str(e)[:500] for e in result.get("errors") or []]
+            else:
+                out["meeting"] = meeting.model_dump(mode="json")
+                if not conflict and self.policy == "auto-book":
+                    # The graph holds the slot; commit fails if another item booked it first
+                    conflict = self.calendar.commit_hold(hold_id, owner=owner)
+                    hold_id = None
+                if conflict:
+                    out["status"] = "conflict"
+                    out["conflict"] = conflict
+                else:
+                    out["status"] = "booked" if self.policy == "auto-book" else "ok"
+        except Exception as e:
+            out["status"] = "error"
+            out["errors"] = [f"{type(e).__name__}: {e}"]
+        finally:
+            if hold_id:
+                self.calendar.release_hold(hold_id, owner=owner)
+        out["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        return out
+
+    def run(self, items: Iterable[Dict[str, Any]], *, ordered: bool = True) -> Iterator[Dict[str, Any]]:
+        """Yield results for `items`, keeping at most `workers` requests in flight."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending: deque[Future] = deque()
+            it = iter(items)
+            exhausted = False
+
+            def fill() -> bool:
+                while len(pending) < self.workers:
+                    item = next(it, None)
+                    if item is None:
+                        return True
+                    pending.append(pool.submit(self.run_one, item))
+                return False
+
+            while True:
+                if not exhausted:
+                    exhausted = fill()
+                if not pending:
+                    return
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        pending.remove(fut)
+                        yield fut.result()
@@ -0,0 +1,96 @@
+# app/application/ics_transfer.py
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO as TextIO, Callable, Iterable, Iterator, Optional
+
+from app.application.ports import Calendar
+from app.domain.models import DEFAULT_OWNER, Meeting
+from app.infra.calendar.ics import Skipped, ics_lines, read_ics
+
+
+@dataclass
+class TransferStats:
+    events: int = 0           # exported, or read from the file on import
+    stored: int = 0           # import: rows the calendar kept (rules with no occurrence store nothing)
+    skipped: int = 0          # import: VEVENTs that could not become a Meeting
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {"events": self.events, "stored": self.stored, "skipped": self.skipped,
+                "batches": self.batches, "seconds": round(self.seconds, 3), "per_s": round(self.rate)}
+
+
+Progress = Callable[[TransferStats], None]
+
+
+def import_ics(calendar: Calendar, stream: Iterable[str], *, tz: str, owner: str = DEFAULT_OWNER,
+               batch_size: int = 5000, progress: Optional[Progress] = None,
+               on_skip: Optional[Callable[[Skipped], None]] = None) -> TransferStats:
+    """
+    Load an .ics stream into the owner's calendar, `batch_size` events per
+    create_events call (one lock acquisition or transaction each). Only one
+    batch of Meetings is alive at a time. Calendars with a `bulk_load()`
+    context (SQLite) defer their index build to the end of the load.
+
+    Imported events are not conflict-checked. `progress` is called after
+    every batch, `on_skip` for every VEVENT that was left out.
+    """
+    stats = TransferStats()
+    t0 = time.perf_counter()
+
+    def meetings() -> Iterator[Meeting]:
+        for item in read_ics(stream, tz=tz):
+            if isinstance(item, Skipped):
+                stats.skipped += 1
+                if on_skip is not None:
+                    on_skip(item)
+                continue
+            stats.events += 1
+            yield item
+
+    items = meetings()
+    bulk = getattr(calendar, "bulk_load", None)
+    with bulk() if bulk is not None else nullcontext():
+        while True:
+            batch = list(islice(items, max(1, batch_size)))
+            if not batch:
+                break
+            stats.stored += calendar.create_events(batch, owner=owner)
+            stats.batches += 1
+            stats.seconds = time.perf_counter() - t0
+            if progress is not None:
+                progress(stats)
+    stats.seconds = time.perf_counter() - t0
+    return stats
+
+
+def export_ics(calendar: Calendar, stream: TextIO, *, tz: str, owner: str = DEFAULT_OWNER,
+               every: int = 10_000, progress: Optional[Progress] = None) -> TransferStats:
+    """
+    Write the owner's calendar (one-offs plus one VEVENT with an RRULE per
+    series) as iCalendar, streaming from list_all() as it is read.
+    `progress` is called every `every` events.
+    """
+    stats = TransferStats()
+    t0 = time.perf_counter()
+
+    def counted(events: Iterable) -> Iterator:
+        for e in events:
+            yield e
+            stats.events += 1
+            if progress is not None and stats.events % every == 0:
+                stats.seconds = time.perf_counter() - t0
+                progress(stats)
+
+    stream.writelines(ics_lines(counted(calendar.list_all(owner=owner)), owner=owner, tz=tz))
+    stats.seconds = time.perf_counter() - t0
+    return stats
@@ -1,6 +1,8 @@
 # app/application/ports.py
-from typing import Protocol, Iterable, Optional
-from app.domain.models import Meeting
+from datetime import datetime
+from typing import Protocol, Iterable, Optional, List, Tuple
+from app.domain.models import Meeting, DEFAULT_OWNER
+from app.domain.holds import Hold
 
 class IO(Protocol):
     """UI-agnostic input/output."""
@@ -11,8 +13,37 @@ class IO(Protocol):
     def list_events(self, events: Iterable, tz: str) -> None: ...
     def review_summary(self, summary: dict) -> None: ...
 
+class AsyncIO(Protocol):
+    """Async twin of IO, for UIs where asking the user is itself a wait (web, chat, service)."""
+    async def ask(self, prompt: str) -> str: ...
+    async def info(self, msg: str) -> None: ...
+    async def warn(self, msg: str) -> None: ...
+    async def confirm(self, prompt: str) -> bool: ...
+    async def list_events(self, events: Iterable, tz: str) -> None: ...
+    async def review_summary(self, summary: dict) -> None: ...
+
 class Calendar(Protocol):
-    """Minimal calendar port (in-memory today; Google/Outlook later)."""
-    def first_conflict(self, meeting: Meeting) -> Optional[str]: ...
-    def create_event(self, meeting: Meeting) -> None: ...
-    def list_all(self) -> Iterable: ...
+    """
+    Minimal calendar port (in-memory today; Google/Outlook later).
+    Every call is scoped to one owner: the user or resource whose calendar it is.
+
+    Booking goes check → hold → commit: `hold` places a short TTL reservation
+    when the slot is free, `commit_hold` books it (returning a conflict message
+    if the slot was lost meanwhile) and `release_hold` drops it on abort.
+
+    Attendees are owners too: conflict checks, holds and free_slots also
+    consult each attendee's calendar, and `busy` exposes one owner's
+    free/busy as sorted (start, end) UTC epoch-second intervals.
+
+    `create_events` is the bulk path (imports): one lock or transaction per
+    call and no conflict checks; it returns how many entries were stored.
+    """
+    def first_conflict(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]: ...
+    def create_event(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> None: ...
+    def create_events(self, meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int: ...
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, owner: str = DEFAULT_OWNER) -> List[datetime]: ...
+    def list_all(self, *, owner: str = DEFAULT_OWNER) -> Iterable: ...
+    def busy(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]: ...
+    def hold(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = 120.0) -> Hold: ...
+    def commit_hold(self, hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]: ...
+    def release_hold(self, hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None: ...
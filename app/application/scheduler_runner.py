@@ -1,12 +1,14 @@
 # app/application/scheduler_runner.py
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
+from app.domain.models import DEFAULT_OWNER
 from app.application.ports import IO, Calendar
-from app.workflows.schedule.state_ops import prepare_retry_patch
+from app.workflows.schedule.state_ops import initial_state, resume_with_answer
 
 
 class SchedulerRunner:
@@ -20,33 +22,35 @@ class SchedulerRunner:
     This class has no printing/input logic of its own; it delegates to IO.
     """
 
-    def __init__(self, graph, io: IO, calendar: Calendar, tz: str = "America/Chicago"):
+    def __init__(self, graph, io: IO, calendar: Calendar, tz: str = "America/Chicago",
+                 owner: str = DEFAULT_OWNER):
         """
         Args:
             graph: compiled LangGraph (must expose .invoke(state) -> state)
             io: UI-agnostic I/O port (CLI/web/etc.)
             calendar: Calendar port (in-memory today; swappable later)
             tz: IANA timezone string used for display and time anchoring
+            owner: whose calendar to check and book (user or resource id)
         """
         self.graph = graph
         self.io = io
         self.calendar = calendar
         self.tz = tz
+        self.owner = owner
 
     def _initial_state(self, user_text: str) -> Dict[str, Any]:
         """Build a fresh ScheduleState dict."""
-        now = datetime.now(ZoneInfo(self.tz))
-        return {
-            "user_text": user_text,
-            "now": now,
-            "tz": self.tz,
-            "draft": None,
-            "meeting": None,
-            "errors": [],
-            "attempts": 0,
-            "conflict": None,
-            "clarify": None,
-        }
+        return initial_state(user_text, self.tz, owner=self.owner)
+
+    def _session(self) -> Optional[Dict[str, Any]]:
+        """LangGraph config for one conversation when the graph checkpoints; None otherwise."""
+        if getattr(self.graph, "checkpointer", None) is None:
+            return None
+        return {"configurable": {"thread_id": uuid.uuid4().hex}}
+
+    def _end_session(self, config: Optional[Dict[str, Any]]) -> None:
+        if config is not None:
+            self.graph.checkpointer.delete_thread(config["configurable"]["thread_id"])
 
     def schedule(self, user_text: str, *, max_clarify: int = 3) -> Dict[str, Any]:
         """
@@ -55,36 +59,45 @@ class SchedulerRunner:
 
         Flow:
           1) invoke graph
-          2) if clarify question present (and no meeting), ask user, update state, retry
-          3) once we have a meeting, check conflict (graph already set it)
-          4) if no conflict, ask to confirm; create event only on yes
+          2) if clarify question present (and no meeting), ask user, resume the graph
+             with the answer (it fills the asked-about field and re-validates)
+          3) once we have a meeting, check conflict (graph already set it and,
+             if the slot was free, placed a short hold on it)
+          4) if no conflict, ask to confirm; commit the hold only on yes
+             (commit fails if someone else booked the slot meanwhile), else
+             release it
         """
         state = self._initial_state(user_text)
+        config = self._session()
         tries = 0
 
         # ---- Clarify loop ----
-        while True:
-            result = self.graph.invoke(state)
-
-            # Need clarification? Ask and retry.
-            if result.get("clarify") and not result.get("meeting"):
-                tries += 1
-                question = result["clarify"]
-                answer = self.io.ask(f"🤔 {question}")
-                if not answer or answer.lower() in {"q", "quit", "cancel"}:
-                    self.io.info("Aborted by user.")
-                    return result
-
-                patch = prepare_retry_patch(state["user_text"], answer)
-                state = {**state, **patch}
-
-                if tries >= max_clarify:
-                    self.io.warn("Too many clarification attempts. Try rephrasing your request.")
-                    return result
-                continue
-
-            # No clarification requested → proceed
-            break
+        try:
+            while True:
+                result = self.graph.invoke(state, config)
+
+                # Need clarification? Ask and resume.
+                if result.get("clarify") and not result.get("meeting"):
+                    tries += 1
+                    question = result["clarify"]
+                    answer = self.io.ask(f"🤔 {question}")
+                    if not answer or answer.lower() in {"q", "quit", "cancel"}:
+                        self.io.info("Aborted by user.")
+                        return result
+
+                    # A checkpointed graph keeps its own state; otherwise hand it all back
+                    patch = resume_with_answer(answer)
+                    state = patch if config else {**result, **patch}
+
+                    if tries >= max_clarify:
+                        self.io.warn("Too many clarification attempts. Try rephrasing your request.")
+                        return result
+                    continue
+
+                # No clarification requested → proceed
+                break
+        finally:
+            self._end_session(config)
 
         meeting = result.get("meeting")
         conflict = result.get("conflict")
@@ -106,25 +119,60 @@ class SchedulerRunner:
             # Hard fail is fine for a greenfield project; it protects the invariant.
             raise RuntimeError("Graph invariant violated: meeting present but review missing")
 
-        # ---- Conflict present → show summary + events; do not book ----
-        if conflict:
-            self.io.warn(f"Conflict detected:\n  {conflict}")
+        # The graph holds the slot when it's free; commit on yes, release otherwise
+        hold_id = result.get("hold")
+        try:
+            # ---- Conflict present → offer free slots; book only if one is picked ----
+            if conflict:
+                self.io.warn(f"Conflict detected:\n  {conflict}")
+                self.io.review_summary(summary)
+                picked = self._offer_slots(self.calendar.free_slots(meeting, owner=self.owner))
+                if picked is None:
+                    self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
+                    return result
+                meeting = meeting.model_copy(update={"starts_at": picked})
+                h = self.calendar.hold(meeting, owner=self.owner)
+                if h.conflict:
+                    self.io.warn(f"That slot was just taken:\n  {h.conflict}")
+                    return {**result, "conflict": h.conflict}
+                hold_id = h.id
+                summary = {**summary, "when": picked.astimezone(ZoneInfo(self.tz)).isoformat(timespec="minutes")}
+                result = {**result, "meeting": meeting, "review": summary, "conflict": None, "hold": hold_id}
+
+            # ---- Confirm before booking ----
             self.io.review_summary(summary)
-            self.io.list_events(self.calendar.list_all(), self.tz)
-            return result
-
-        # ---- Confirm before booking ----
-        self.io.review_summary(summary)
-        if self.io.confirm("Book this on the calendar?"):
-            self.calendar.create_event(meeting)
-            self.io.info("📅 Event created.")
-        else:
-            self.io.info("Okay — not booked.")
+            if self.io.confirm("Book this on the calendar?"):
+                lost = self.calendar.commit_hold(hold_id, owner=self.owner)
+                hold_id = None   # committed, or already gone
+                if lost:
+                    self.io.warn(f"Slot was booked by someone else meanwhile:\n  {lost}")
+                    result = {**result, "conflict": lost}
+                else:
+                    self.io.info("📅 Event created.")
+            else:
+                self.io.info("Okay — not booked.")
+        finally:
+            if hold_id:
+                self.calendar.release_hold(hold_id, owner=self.owner)
 
         # Show current calendar (for CLI UX)
-        self.io.list_events(self.calendar.list_all(), self.tz)
+        self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
         return result
 
+    def _offer_slots(self, slots: List[datetime]) -> Optional[datetime]:
+        """Ask the user to pick one of the suggested free slots. None = keep nothing."""
+        if not slots:
+            self.io.info("No free slot found in the next two weeks.")
+            return None
+        tzinfo = ZoneInfo(self.tz)
+        self.io.info("Free slots:")
+        for i, slot in enumerate(slots, start=1):
+            self.io.info(f"  {i}) {slot.astimezone(tzinfo).isoformat(timespec='minutes')}")
+        answer = self.io.ask(f"Pick a slot (1-{len(slots)}) or press Enter to skip")
+        if answer.isdigit() and 1 <= int(answer) <= len(slots):
+            return slots[int(answer) - 1]
+        return None
+
     def list_events(self) -> None:
         """Convenience for the CLI 'list' command."""
-        self.io.list_events(self.calendar.list_all(), self.tz)
+        self.io.list_events(self.calendar.list_all(owner=self.owner), self.tz)
@@ -17,3 +17,7 @@ class MeetingRequest(BaseModel):
     location: Optional[str] = None
     attendees: List[AttendeeIn] = []
     priority: Literal["low", "normal", "high"] = "normal"
+    recurrence: Optional[str] = Field(
+        default=None,
+        description="RRULE for repeating meetings, e.g. 'FREQ=WEEKLY;BYDAY=MO' for every Monday; omit for one-off",
+    )
@@ -0,0 +1,27 @@
+# app/domain/holds.py
+# A slot hold as the Calendar port hands it out; the stores that place and
+# commit holds live in app.infra.calendar.holds. Kept out of models.py so
+# entry points can use it without importing pydantic.
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional
+import time
+
+if TYPE_CHECKING:
+    from app.domain.models import Meeting
+
+@dataclass
+class Hold:
+    id: Optional[str]          # None when the hold was refused (see `conflict`)
+    owner: str
+    starts_at: int             # UTC epoch seconds
+    ends_at: int               # UTC epoch seconds
+    version: int               # calendar version the slot was checked against
+    expires_at: float = 0.0    # time.monotonic() deadline
+    meeting: Optional[Meeting] = field(default=None, repr=False, compare=False)
+    conflict: Optional[str] = None
+    # attendee owner id → the hold placed in that attendee's calendar alongside this one
+    attendee_holds: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.monotonic()) >= self.expires_at
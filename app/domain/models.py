@@ -1,9 +1,38 @@
 # app/domain/models.py
 from typing import Optional, List, Literal
-from datetime import datetime
+from datetime import datetime, timezone
+import re
 from pydantic import BaseModel, ConfigDict, field_validator, ValidationInfo
-from zoneinfo import ZoneInfo
-from dateutil import parser as dateparse
+from dateutil.rrule import rrulestr
+from app.domain.temporal import resolve
+from app.domain.owners import DEFAULT_OWNER  # noqa: F401  (re-exported)
+
+# UNTIL as a date (20261231) or a floating date-time (20261231T170000), optionally already in UTC
+_UNTIL_RX = re.compile(r"UNTIL=(\d{8})(T\d{6})?Z?(?=;|$)")
+
+def _utc_until(m: re.Match) -> str:
+    return f"UNTIL={m.group(1)}{m.group(2) or 'T235959'}Z"
+
+def clean_rrule(v) -> Optional[str]:
+    """
+    Normalize an RRULE body: accept "RRULE:FREQ=..." or "freq=...", return
+    the bare upper-case body, or None for an empty one. Series are expanded
+    from a tz-aware start, which dateutil only accepts with a UTC UNTIL, so a
+    date-only UNTIL becomes that day's end in UTC and a floating one is read
+    as UTC. Raises ValueError on anything dateutil can't expand, and on
+    DTSTART (the series is anchored at the meeting's own start).
+    """
+    if v is None or (isinstance(v, str) and not v.strip()):
+        return None
+    rule = str(v).strip()
+    if rule.upper().startswith("RRULE:"):
+        rule = rule[6:]
+    rule = rule.upper().replace(" ", "")
+    if "DTSTART" in rule or "\n" in rule:
+        raise ValueError("recurrence must be a single RRULE without DTSTART")
+    rule = _UNTIL_RX.sub(_utc_until, rule)
+    rrulestr(rule, dtstart=datetime(2000, 1, 1, tzinfo=timezone.utc))
+    return rule
 
 class Attendee(BaseModel):
     name: str
@@ -17,35 +46,23 @@ class Meeting(BaseModel):
     location: Optional[str] = None
     attendees: List[Attendee] = []
     priority: Literal["low", "normal", "high"] = "normal"
+    recurrence: Optional[str] = None   # RRULE body, e.g. "FREQ=WEEKLY;BYDAY=MO"
 
     @field_validator("starts_at", mode="before")
     @classmethod
     def parse_human_time(cls, v, info: ValidationInfo):
         """
-        Parse human time strings anchored to 'now'/'tz', but:
-        - use a midnight baseline so unspecified fields don't inherit current mm:ss.us
+        Parse human time strings anchored to 'now'/'tz' (see app.domain.temporal):
+        - ISO fast path, cached grammar for common phrasings, dateparser/dateutil fallback
+        - midnight baseline so unspecified fields don't inherit current mm:ss.us
         - force tz
         - zero out seconds/microseconds for clean scheduling slots
         """
         ctx = info.context or {}
-        tzname = ctx.get("tz", "America/Chicago")
-        now = ctx.get("now") or datetime.now(ZoneInfo(tzname))
-        tz = ZoneInfo(tzname)
-
-        raw = str(v)
+        return resolve(v, now=ctx.get("now"), tz=ctx.get("tz", "America/Chicago"))
 
-        # 1) Midnight baseline prevents leaking current minutes/seconds into the result
-        baseline = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # 2) Parse with dateutil (still accepts e.g. "12pm", "next Tue 9:30" if supported)
-        dt = dateparse.parse(raw, default=baseline, fuzzy=True)
-
-        # 3) Ensure timezone
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=tz)
-        else:
-            dt = dt.astimezone(tz)
-
-        # 4) Normalize to minute precision (drop seconds/microseconds)
-        dt = dt.replace(second=0, microsecond=0)
-        return dt
+    @field_validator("recurrence", mode="before")
+    @classmethod
+    def normalize_rrule(cls, v):
+        """Store the bare upper-case RRULE body with a UTC UNTIL (see clean_rrule)."""
+        return clean_rrule(v)
@@ -0,0 +1,4 @@
+# app/domain/owners.py
+# Calendar owner (user or resource id) when a deployment has a single user.
+# Kept out of models.py so entry points can use it without importing pydantic.
+DEFAULT_OWNER = "default"
@@ -0,0 +1,186 @@
+# app/domain/temporal.py
+"""
+Resolve human time expressions ("tomorrow 1pm", "next Tue 9:30", "in 2 hours",
+"2026-10-20T13:00") to tz-aware datetimes.
+
+Tiers, cheapest first:
+  1) strict ISO-8601 via datetime.fromisoformat
+  2) a compiled grammar for common relative phrasings; results are cached in
+     an LRU keyed on (normalized text, anchor date in tz) and the zone is
+     attached afterwards
+  3) dateparser for relative phrases the grammar doesn't know ("3 days from
+     now"), else dateutil's fuzzy parser — the historical behaviour
+"""
+from __future__ import annotations
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+import re
+
+from zoneinfo import ZoneInfo
+from dateutil import parser as dateparse
+
+WEEKDAYS = {"mon": 0, "tue": 1, "wed": 2, "thu": 3, "fri": 4, "sat": 5, "sun": 6}
+
+DATE_RX = re.compile(
+    r"\b(?:on\s+)?(?:(?P<rel>today|tomorrow)|(?P<next>next\s+)?(?P<wd>mon|tue|wed|thu|fri|sat|sun)"
+    r"(?:day|s|sday|nesday|rsday|urday)?\.?|(?P<iso>\d{4}-\d{2}-\d{2}))(?![\w-])",
+    re.IGNORECASE,
+)
+TIME_RX = re.compile(
+    r"\b(?:at\s+)?(?:(?P<h12>\d{1,2})(?::(?P<m12>\d{2}))?\s*(?P<ampm>am|pm|a\.m\.|p\.m\.)|"
+    r"(?P<h24>\d{1,2}):(?P<m24>\d{2})|(?P<noon>noon|midday)|(?P<midnight>midnight))(?!\w)",
+    re.IGNORECASE,
+)
+_OFFSET_RX = re.compile(
+    r"^in\s+(?P<n>\d+|an?|one|half\s+an?)\s+(?P<unit>minutes?|mins?|hours?|hrs?|days?|weeks?)$",
+    re.IGNORECASE,
+)
+_FILLER_RX = re.compile(r"\b(?:at|on)\b|[,\s]+", re.IGNORECASE)
+# dateparser only sees text with one of these; it reads bare numbers ("the 5th",
+# "9") as months, where dateutil's day-of-month reading is the one people mean
+_RELATIVE_RX = re.compile(
+    r"\b(?:ago|from\s+now|later|next|last|this|coming|today|tonight|tomorrow|yesterday|"
+    r"(?:minute|min|hour|hr|day|week|fortnight|month|year)s?)\b",
+    re.IGNORECASE,
+)
+
+_Resolution = Union[Tuple[str, datetime], Tuple[str, timedelta], None]
+
+
+def clock(m: re.Match) -> Optional[Tuple[int, int]]:
+    """(hour, minute) from a TIME_RX match; None if out of range."""
+    if m.group("noon"):
+        return 12, 0
+    if m.group("midnight"):
+        return 0, 0
+    if m.group("ampm"):
+        h, mi = int(m.group("h12")), int(m.group("m12") or 0)
+        if not 1 <= h <= 12:
+            return None
+        h = h % 12 + (12 if m.group("ampm").lower().startswith("p") else 0)
+    else:
+        h, mi = int(m.group("h24")), int(m.group("m24"))
+    return (h, mi) if h < 24 and mi < 60 else None
+
+
+def day(m: re.Match, today: date) -> Optional[date]:
+    """
+    Calendar date from a DATE_RX match. Weekdays mean the next one after
+    today; "next <weekday>" the one a week after that.
+    """
+    if m.group("rel"):
+        return today if m.group("rel").lower() == "today" else today + timedelta(days=1)
+    if m.group("wd"):
+        ahead = (WEEKDAYS[m.group("wd").lower()] - today.weekday()) % 7 or 7
+        if m.group("next"):
+            ahead += 7
+        return today + timedelta(days=ahead)
+    try:
+        return date.fromisoformat(m.group("iso"))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _offset(m: re.Match) -> timedelta:
+    n = m.group("n").lower()
+    qty = 0.5 if n.startswith("half") else 1 if n in ("a", "an", "one") else int(n)
+    unit = m.group("unit").lower()
+    if unit.startswith("h"):
+        return timedelta(hours=qty)
+    if unit.startswith("d"):
+        return timedelta(days=qty)
+    if unit.startswith("w"):
+        return timedelta(weeks=qty)
+    return timedelta(minutes=qty)
+
+
+@lru_cache(maxsize=4096)
+def _grammar(text: str, anchor: date) -> _Resolution:
+    """
+    Cached grammar parse. Returns ("abs", naive local datetime), ("rel", offset
+    from now) or None when the text isn't fully covered by the grammar.
+    """
+    m = _OFFSET_RX.match(text)
+    if m:
+        return "rel", _offset(m)
+
+    dm = DATE_RX.search(text)
+    tm = TIME_RX.search(text)
+    if not dm and not tm:
+        return None
+    rest = text
+    for mm in sorted((x for x in (dm, tm) if x), key=lambda x: x.start(), reverse=True):
+        rest = rest[:mm.start()] + " " + rest[mm.end():]
+    if _FILLER_RX.sub("", rest):
+        return None     # something we don't understand is left over
+
+    d = day(dm, anchor) if dm else anchor
+    hm = clock(tm) if tm else (0, 0)
+    if d is None or hm is None:
+        return None
+    return "abs", datetime.combine(d, time(*hm))
+
+
+def _fallback(raw: str, baseline: datetime, tz: ZoneInfo) -> datetime:
+    dt = None
+    if _RELATIVE_RX.search(raw):
+        import dateparser  # heavy import; only paid for relative phrases the grammar misses
+
+        dt = dateparser.parse(raw, settings={
+            "RELATIVE_BASE": baseline.replace(tzinfo=None),
+            "PREFER_DATES_FROM": "future",
+            "TIMEZONE": tz.key,
+            "RETURN_AS_TIMEZONE_AWARE": False,
+        })
+    if dt is None:
+        try:
+            dt = dateparse.parse(raw, default=baseline, fuzzy=True)
+        except OverflowError as e:
+            raise ValueError(f"Date out of range: {raw!r}") from e
+    return dt
+
+
+def resolve(value: Union[str, datetime], *, now: Optional[datetime] = None,
+            tz: str = "America/Chicago") -> datetime:
+    """
+    Resolve `value` to an aware datetime in `tz`, anchored to `now`, at minute
+    precision. Unspecified fields come from a midnight baseline so the current
+    mm:ss never leaks into the result. Raises ValueError when nothing parses.
+    """
+    zone = _zone(tz)
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        raw = str(value).strip()
+        dt = None
+        # 1) Strict ISO-8601
+        try:
+            dt = datetime.fromisoformat(raw)
+        except ValueError:
+            pass
+        if dt is None:
+            now = now or datetime.now(zone)
+            now_local = now.astimezone(zone) if now.tzinfo else now.replace(tzinfo=zone)
+            # 2) Grammar (cached per text + anchor day)
+            hit = _grammar(" ".join(raw.lower().split()), now_local.date())
+            if hit is not None:
+                kind, v = hit
+                dt = now_local + v if kind == "rel" else v
+            else:
+                # 3) dateparser / dateutil
+                baseline = now_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                dt = _fallback(raw, baseline, zone)
+
+    dt = dt.replace(tzinfo=zone) if dt.tzinfo is None else dt.astimezone(zone)
+    return dt.replace(second=0, microsecond=0)
+
+
+def cache_info():
+    """Grammar LRU statistics (hits/misses/size)."""
+    return _grammar.cache_info()
@@ -1,14 +1,76 @@
 # app/infra/calendar/adapters.py
-from typing import Iterable, Optional
-from app.domain.models import Meeting
+from __future__ import annotations
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
+from app.domain.owners import DEFAULT_OWNER
+from app.domain.holds import Hold
 from app.infra.calendar import service as cal_service
+from app.infra.calendar.holds import DEFAULT_TTL_S
+from app.infra.calendar.sqlite_store import SQLiteCalendar
+
+if TYPE_CHECKING:
+    from app.domain.models import Meeting
 
 class InMemoryCalendarAdapter:
-    def first_conflict(self, meeting: Meeting) -> Optional[str]:
-        return cal_service.first_conflict(meeting)
+    def first_conflict(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        return cal_service.first_conflict(meeting, owner=owner)
+
+    def create_event(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> None:
+        cal_service.create_event(meeting, owner=owner)
+
+    def create_events(self, meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int:
+        return cal_service.create_events(meetings, owner=owner)
+
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, owner: str = DEFAULT_OWNER) -> List[datetime]:
+        return cal_service.free_slots(meeting, limit=limit, owner=owner)
+
+    def list_all(self, *, owner: str = DEFAULT_OWNER) -> Iterable:
+        return cal_service.list_all(owner=owner)
+
+    def busy(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]:
+        return cal_service.busy(start, end, owner=owner)
+
+    def hold(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        return cal_service.hold(meeting, owner=owner, ttl_s=ttl_s)
+
+    def commit_hold(self, hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        return cal_service.commit_hold(hold_id, owner=owner)
+
+    def release_hold(self, hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None:
+        cal_service.release_hold(hold_id, owner=owner)
+
+class SQLiteCalendarAdapter:
+    """Persistent Calendar port backed by a SQLite file (survives restarts)."""
+    def __init__(self, path: Union[str, Path]):
+        self.store = SQLiteCalendar(path)
+
+    def first_conflict(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        return self.store.first_conflict(meeting, owner=owner)
+
+    def create_event(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> None:
+        self.store.create_event(meeting, owner=owner)
+
+    def create_events(self, meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int:
+        return self.store.create_events(meetings, owner=owner)
+
+    def bulk_load(self):
+        return self.store.bulk_load()
+
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, owner: str = DEFAULT_OWNER) -> List[datetime]:
+        return self.store.free_slots(meeting, limit=limit, owner=owner)
+
+    def list_all(self, *, owner: str = DEFAULT_OWNER) -> Iterable:
+        return self.store.list_all(owner=owner)
+
+    def busy(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]:
+        return self.store.busy(start, end, owner=owner)
+
+    def hold(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        return self.store.hold(meeting, owner=owner, ttl_s=ttl_s)
 
-    def create_event(self, meeting: Meeting) -> None:
-        cal_service.create_event(meeting)
+    def commit_hold(self, hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        return self.store.commit_hold(hold_id, owner=owner)
 
-    def list_all(self) -> Iterable:
-        return cal_service.list_all()
+    def release_hold(self, hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None:
+        self.store.release_hold(hold_id, owner=owner)
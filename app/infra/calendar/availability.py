@@ -0,0 +1,123 @@
+# app/infra/calendar/availability.py
+"""
+Free/busy across several calendars: the organizer's plus one per attendee.
+
+Each calendar yields its busy intervals over a window, sorted by start. They
+are combined with a k-way heap merge, so every operation here costs
+O(N log k) for N intervals over k calendars:
+
+  - union()          coalesced busy time of everyone
+  - free_windows()   complement of a busy stream inside a window
+  - first_clash()    sweep of the meeting's own spans against every
+                     attendee's busy intervals, reporting who clashes
+
+Intervals are (start, end) UTC epoch seconds, half-open. An attendee's
+calendar is the one whose owner id is their e-mail, or their name if there
+is none, lower-cased (see attendee_owner).
+"""
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+import heapq
+
+from app.infra.calendar.recurrence import meeting_spans
+from app.infra.calendar.slots import find_free_slots
+
+if TYPE_CHECKING:
+    from app.domain.models import Attendee, Meeting
+
+Interval = Tuple[int, int]
+# busy_for(owner, start, end) → that owner's busy intervals overlapping [start, end), sorted by start
+BusyFn = Callable[[str, datetime, datetime], Iterable[Interval]]
+
+def attendee_owner(a: Attendee) -> str:
+    return (a.email or a.name).strip().lower()
+
+def attendee_owners(meeting: Meeting, organizer: str) -> Dict[str, str]:
+    """owner id → display name for the meeting's attendees, minus the organizer."""
+    out: Dict[str, str] = {}
+    for a in meeting.attendees:
+        key = attendee_owner(a)
+        if key and key != organizer.lower():
+            out.setdefault(key, a.name)
+    return out
+
+def union(streams: Iterable[Iterable[Interval]]) -> Iterator[Interval]:
+    """Coalesced union of sorted interval streams (k-way merge)."""
+    cur_s = cur_e = None
+    for s, e in heapq.merge(*streams):
+        if cur_e is not None and s <= cur_e:
+            if e > cur_e:
+                cur_e = e
+            continue
+        if cur_e is not None:
+            yield cur_s, cur_e
+        cur_s, cur_e = s, e
+    if cur_e is not None:
+        yield cur_s, cur_e
+
+def free_windows(busy: Iterable[Interval], start: int, end: int, min_len: int = 0) -> Iterator[Interval]:
+    """Gaps of at least min_len seconds in a coalesced busy stream, clipped to [start, end)."""
+    t = start
+    for s, e in busy:
+        if s >= end:
+            break
+        if s - t >= max(min_len, 1):
+            yield t, s
+        t = max(t, e)
+    if end - t >= max(min_len, 1):
+        yield t, end
+
+def _tagged(name: str, intervals: Iterable[Interval]) -> Iterator[Tuple[int, int, str]]:
+    for s, e in intervals:
+        yield s, e, name
+
+def first_clash(spans: Iterable[Interval], busy: Mapping[str, Iterable[Interval]]) -> Optional[Tuple[str, int, int]]:
+    """
+    (name, start, end) of the earliest busy interval that overlaps any of the
+    meeting's spans, or None. `spans` are sorted and disjoint.
+    """
+    spans = list(spans)
+    if not spans:
+        return None
+    i, n = 0, len(spans)
+    for s, e, name in heapq.merge(*(_tagged(name, it) for name, it in busy.items())):
+        while i < n and spans[i][1] <= s:
+            i += 1
+        if i == n:
+            return None
+        if spans[i][0] < e:
+            return name, s, e
+    return None
+
+def _epoch_spans(meeting: Meeting) -> List[Interval]:
+    return [(int(s.timestamp()), int(e.timestamp()))
+            for s, e in meeting_spans(meeting.starts_at, meeting.duration_min, meeting.recurrence)]
+
+def attendee_conflict(busy_for: BusyFn, meeting: Meeting, *, organizer: str) -> Optional[str]:
+    """Conflict message naming the first attendee who is busy during the meeting, if any."""
+    people = attendee_owners(meeting, organizer)
+    spans = _epoch_spans(meeting)
+    if not people or not spans:
+        return None
+    lo = datetime.fromtimestamp(spans[0][0], tz=timezone.utc)
+    hi = datetime.fromtimestamp(spans[-1][1], tz=timezone.utc)
+    clash = first_clash(spans, {name: busy_for(key, lo, hi) for key, name in people.items()})
+    if clash is None:
+        return None
+    name, s, e = clash
+    return (
+        f"Attendee {name} is busy "
+        f"{datetime.fromtimestamp(s, tz=timezone.utc).isoformat()}–"
+        f"{datetime.fromtimestamp(e, tz=timezone.utc).isoformat()} UTC"
+    )
+
+def common_free_slots(busy_for: BusyFn, meeting: Meeting, *, organizer: str, limit: int = 3,
+                      horizon_days: int = 14) -> List[datetime]:
+    """Next start times (one per gap) free for the organizer and every attendee."""
+    start = meeting.starts_at
+    end = start + timedelta(days=horizon_days)
+    owners = [organizer, *attendee_owners(meeting, organizer)]
+    busy = union(busy_for(o, start, end) for o in owners)
+    return find_free_slots(busy, start=start, duration_min=meeting.duration_min,
+                           limit=limit, horizon_days=horizon_days)
@@ -0,0 +1,455 @@
+# app/infra/calendar/columns.py
+"""
+Columnar storage for one calendar's one-off events.
+
+An event is a row across parallel integer columns instead of an object:
+
+    start, end   int64 epoch minutes (UTC)
+    id           int64
+    title        int32 index into an interned string table (location too; -1 = None)
+    zone         int32 index into the tzinfo table the meeting was booked in
+    extra        int32 index into `extras`, -1 for the common case: no
+                 attendees, normal priority, start on a whole minute
+
+That is 44 bytes per row plus each distinct string once, against a
+dataclass with two datetimes and a pydantic Meeting per event. Nothing is
+materialized until asked for: queries return EventView objects, and a
+view builds its datetimes, attendees or Meeting only when read.
+
+Rows are ordered by start minute, then insertion (validated meetings
+always start on a whole minute), in sorted segments. New rows go into
+a small `delta`; once it outgrows ~4·sqrt(n) rows it is merged into `main` in
+one vectorized NumPy pass. Both are array('q'/'i') columns. An insert
+therefore costs O(sqrt n) amortized instead of shifting every column of
+the whole calendar. Bulk loads (add_many) append a batch unsorted and
+fold it into `main` with one sort and the same merge. Window queries
+bisect on `start` from `window start - max_span`; only rows starting
+before the window start need their `end` checked, the rest are sliced out
+whole and zipped into views in C.
+
+Events longer than a day (a sabbatical, a multi-week trip) live in a third,
+small `long` segment that every query scans on its own bound, so max_span
+covers the other rows only: one long event can't widen the search of every
+query into a scan of the whole calendar.
+NumPy is only imported at the first merge, so small calendars never load it.
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone, tzinfo
+from itertools import chain, repeat
+from math import ceil, floor, isqrt
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+import heapq
+
+if TYPE_CHECKING:
+    from app.domain.models import Attendee, Meeting
+
+# (column, array typecode); EventView takes a row in this order
+_COLUMNS = (("start", "q"), ("end", "q"), ("id", "q"), ("title", "i"),
+            ("location", "i"), ("zone", "i"), ("extra", "i"))
+_NAMES = tuple(name for name, _ in _COLUMNS)
+_MIN_DELTA = 1024         # calendars smaller than this never merge (or import NumPy)
+_VECTOR_MIN = 32          # wider busy() scans convert the columns with NumPy
+_LONG_MIN = 24 * 60       # rows spanning more minutes than this go to the `long` segment
+
+Columns = Dict[str, array]
+Extra = Tuple[int, Tuple[Tuple[str, Optional[str]], ...], str]   # (seconds past the minute, attendees, priority)
+
+T = TypeVar("T", bound=Hashable)
+
+class Interner(Generic[T]):
+    """Each distinct value stored once, addressed by a small int (-1 = None)."""
+    __slots__ = ("values", "_index")
+
+    def __init__(self):
+        self.values: List[T] = []
+        self._index: Dict[T, int] = {}
+
+    def add(self, value: Optional[T]) -> int:
+        if value is None:
+            return -1
+        i = self._index.get(value)
+        if i is None:
+            i = self._index[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+    def get(self, i: int) -> Optional[T]:
+        return self.values[i] if i >= 0 else None
+
+class EventView(tuple):
+    """
+    One stored event, read-only. Same fields as service.Event; datetimes,
+    attendees and the Meeting (`raw`) are built on access.
+
+    A view is just (block, row, start minute): `block` is (store, *columns)
+    of the segment the row lives in, so building the views of a window runs
+    no Python per row. Segments a view points into are never changed in
+    place afterwards (see EventStore), so a view stays valid as the store
+    grows and merges.
+    """
+    __slots__ = ()
+    recurrence = None      # series are stored separately
+
+    def _col(self, c: int) -> int:
+        return self[0][c + 1][self[1]]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, EventView) and self[0][0] is other[0][0] and self.id == other.id
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    @property
+    def _store(self) -> "EventStore":
+        return self[0][0]
+
+    @property
+    def id(self) -> int:
+        return self._col(2)
+
+    @property
+    def title(self) -> str:
+        return self._store.strings.values[self._col(3)]
+
+    @property
+    def location(self) -> Optional[str]:
+        return self._store.strings.get(self._col(4))
+
+    @property
+    def owner(self) -> str:
+        return self._store.owner
+
+    def _extra(self) -> Optional[Extra]:
+        x = self._col(6)
+        return self._store.extras[x] if x >= 0 else None
+
+    def _seconds(self, c: int) -> int:
+        extra = self._extra()
+        return self._col(c) * 60 + (extra[0] if extra else 0)
+
+    @property
+    def starts_at(self) -> datetime:
+        return datetime.fromtimestamp(self._seconds(0), tz=timezone.utc)
+
+    @property
+    def ends_at(self) -> datetime:
+        return datetime.fromtimestamp(self._seconds(1), tz=timezone.utc)
+
+    @property
+    def duration_min(self) -> int:
+        return self._col(1) - self._col(0)
+
+    @property
+    def priority(self) -> str:
+        extra = self._extra()
+        return extra[2] if extra else "normal"
+
+    @property
+    def attendees(self) -> List[Attendee]:
+        from app.domain.models import Attendee
+        extra = self._extra()
+        return [Attendee(name=n, email=e) for n, e in extra[1]] if extra else []
+
+    @property
+    def raw(self) -> Meeting:
+        """The booked Meeting, rebuilt in the zone it was booked in."""
+        from app.domain.models import Meeting
+        zone = self._store.zones.get(self._col(5)) or timezone.utc
+        return Meeting.model_construct(
+            title=self.title, starts_at=self.starts_at.astimezone(zone), duration_min=self.duration_min,
+            location=self.location, attendees=self.attendees, priority=self.priority, recurrence=None,
+        )
+
+    def __repr__(self) -> str:
+        return (f"EventView(id={self.id}, title={self.title!r}, starts_at={self.starts_at.isoformat()}, "
+                f"ends_at={self.ends_at.isoformat()}, location={self.location!r})")
+
+_start_key = itemgetter(2)
+
+def _np():
+    import numpy as np
+    return np
+
+def _as_numpy(col: array):
+    """Zero-copy NumPy view of an array column (drop it before the column grows)."""
+    np = _np()
+    return np.frombuffer(col, dtype=np.int64 if col.typecode == "q" else np.int32)
+
+def _empty_columns() -> Columns:
+    return {name: array(code) for name, code in _COLUMNS}
+
+class EventStore:
+    """
+    Sorted columnar rows for one owner; the caller (InMemoryCalendar) does the locking.
+
+    Views point into the live columns. `main` is only ever replaced, never
+    changed in place. `delta` and `long` take inserts in place, so once a
+    query has handed out views into one, the next insert copies it first
+    (copy-on-write; both are small).
+    """
+
+    def __init__(self, owner: str):
+        self.owner = owner
+        self.strings: Interner[str] = Interner()
+        self.zones: Interner[tzinfo] = Interner()
+        self.extras: List[Extra] = []
+        self.max_span = 0              # longest event outside `long`, minutes
+        self.long_span = 0             # longest event in `long`, minutes
+        self.unaligned = 0             # rows whose start has seconds
+        self._main = _empty_columns()     # rebuilt by each merge, never grown in place
+        self._delta = _empty_columns()    # small; takes the inserts
+        self._long = _empty_columns()     # events longer than _LONG_MIN; never merged
+        self._main_block = self._block(self._main)
+        self._delta_block = self._block(self._delta)
+        self._long_block = self._block(self._long)
+        self._delta_shared = False     # views point into the delta: copy before the next insert
+        self._long_shared = False      # likewise for `long`
+
+    def _block(self, seg: Columns) -> tuple:
+        return (self, *(seg[name] for name in _NAMES))
+
+    def __len__(self) -> int:
+        return len(self._main["start"]) + len(self._delta["start"]) + len(self._long["start"])
+
+    # ---- writes ----
+
+    def _row(self, id: int, meeting: Meeting, start_utc: datetime, end_utc: datetime) -> Tuple[int, ...]:
+        """Intern a meeting's strings and extras; the row in _COLUMNS order."""
+        start, offset = divmod(int(start_utc.timestamp()), 60)
+        end = (int(end_utc.timestamp()) - offset) // 60
+        attendees = tuple((a.name, a.email) for a in meeting.attendees or ())
+        extra = -1
+        if offset or attendees or meeting.priority != "normal":
+            extra = len(self.extras)
+            self.extras.append((offset, attendees, meeting.priority))
+            self.unaligned += bool(offset)
+        if end - start > _LONG_MIN:
+            self.long_span = max(self.long_span, end - start)
+        else:
+            self.max_span = max(self.max_span, end - start)
+        return (start, end, id, self.strings.add(meeting.title), self.strings.add(meeting.location),
+                self.zones.add(meeting.starts_at.tzinfo), extra)
+
+    @staticmethod
+    def _insert(seg: Columns, row: Tuple[int, ...]) -> None:
+        # bisect_right keeps events with equal starts in insertion order
+        i = bisect_right(seg["start"], row[0])
+        for name, value in zip(_NAMES, row):
+            seg[name].insert(i, value)
+
+    def _push(self, row: Tuple[int, ...]) -> None:
+        if row[1] - row[0] > _LONG_MIN:
+            if self._long_shared:
+                self._long = {name: col[:] for name, col in self._long.items()}
+                self._long_block = self._block(self._long)
+                self._long_shared = False
+            self._insert(self._long, row)
+            return
+        if self._delta_shared:
+            self._delta = {name: col[:] for name, col in self._delta.items()}
+            self._delta_block = self._block(self._delta)
+            self._delta_shared = False
+        self._insert(self._delta, row)
+        if len(self._delta["start"]) >= max(_MIN_DELTA, 4 * isqrt(len(self._main["start"]))):
+            self._merge()
+
+    def add(self, id: int, meeting: Meeting, start_utc: datetime, end_utc: datetime) -> EventView:
+        row = self._row(id, meeting, start_utc, end_utc)
+        self._push(row)
+        return EventView(((self, *zip(row)), 0, row[0]))
+
+    def add_many(self, entries: Iterable[Tuple[int, Meeting, datetime, datetime]]) -> int:
+        """
+        Bulk insert of (id, meeting, start_utc, end_utc). Rows are appended
+        unsorted and put in order by one sort + merge at the end, instead of
+        a sorted insert each; a batch below _MIN_DELTA rows takes the normal path.
+        Long events go straight to the `long` segment.
+        """
+        batch = _empty_columns()
+        cols = [batch[name] for name in _NAMES]
+        long = 0
+        for entry in entries:
+            row = self._row(*entry)
+            if row[1] - row[0] > _LONG_MIN:
+                self._push(row)
+                long += 1
+                continue
+            for col, value in zip(cols, row):
+                col.append(value)
+        n = len(batch["start"])
+        if n < _MIN_DELTA:
+            for row in zip(*cols):
+                self._push(row)
+        else:
+            self._merge(batch)
+        return n + long
+
+    def _merge(self, batch: Optional[Columns] = None) -> None:
+        """Fold the delta (and an unsorted bulk batch, newer than the delta) into main."""
+        np = _np()
+        delta = {name: _as_numpy(col) for name, col in self._delta.items()}
+        if batch is not None:
+            new = {name: np.concatenate((delta[name], _as_numpy(batch[name]))) for name in _NAMES}
+            # stable: equal starts keep delta-then-batch insertion order
+            order = new["start"].argsort(kind="stable")
+            delta = {name: col[order] for name, col in new.items()}
+        if not len(self._main["start"]):
+            merged = delta
+        else:
+            main = {name: _as_numpy(col) for name, col in self._main.items()}
+            # side="right": delta rows are newer than main rows with the same start
+            pos = main["start"].searchsorted(delta["start"], side="right")
+            merged = {name: np.insert(main[name], pos, delta[name]) for name in _NAMES}
+        self._main = {name: array(code, merged[name].tobytes()) for name, code in _COLUMNS}
+        self._delta = _empty_columns()
+        self._main_block, self._delta_block = self._block(self._main), self._block(self._delta)
+        self._delta_shared = False
+
+    # ---- reads ----
+
+    def _bounds(self, start_utc: datetime, end_utc: datetime) -> Tuple[int, int, int]:
+        """
+        Integer minute keys for [start_utc, end_utc): rows with lo <= start < hi
+        are candidates, and overlap when end > end_above. `long` rows use
+        _long_lo(lo) instead of lo.
+        """
+        s = floor(start_utc.timestamp() / 60)
+        # A row with seconds can end up to a minute later than its `end` column says
+        end_above = s - 1 if self.unaligned else s
+        return s - self.max_span - 1, end_above, ceil(end_utc.timestamp() / 60)
+
+    def _long_lo(self, lo: int) -> int:
+        return lo + self.max_span - self.long_span
+
+    @staticmethod
+    def _span(seg: Columns, lo: int, end_above: int, hi: int) -> Tuple[int, List[int], int, int]:
+        """
+        Candidates of `seg` as (i, rows in [i, k) whose end clears end_above, k, j):
+        every row in [k, j) starts after end_above, so it overlaps without a check.
+        """
+        starts = seg["start"]
+        i, j = bisect_left(starts, lo), bisect_left(starts, hi)
+        if i == j:
+            return i, [], j, j
+        k = bisect_right(starts, end_above, i, j)
+        ends = seg["end"]
+        return i, [r for r in range(i, k) if ends[r] > end_above], k, j
+
+    def _first_row(self, seg: Columns, lo: int, end_above: int, hi: int) -> Optional[int]:
+        starts, ends = seg["start"], seg["end"]
+        for r in range(bisect_left(starts, lo), bisect_left(starts, hi)):
+            if ends[r] > end_above:
+                return r
+        return None
+
+    def _views(self, seg: Columns, block: tuple, lo: int, end_above: int, hi: int) -> Iterator[EventView]:
+        _, head, k, j = self._span(seg, lo, end_above, hi)
+        starts = seg["start"]
+        if head:
+            return map(EventView, zip(repeat(block), chain(head, range(k, j)),
+                                      chain([starts[r] for r in head], starts[k:j])))
+        return map(EventView, zip(repeat(block), range(k, j), starts[k:j]))
+
+    def _exact(self, view: EventView, start_utc: datetime, end_utc: datetime) -> bool:
+        return view._seconds(0) < end_utc.timestamp() and view._seconds(1) > start_utc.timestamp()
+
+    def overlapping(self, start_utc: datetime, end_utc: datetime) -> Iterator[EventView]:
+        """
+        Views of rows overlapping [start_utc, end_utc), in start order (long
+        rows after short ones with the same start); lazy, so next() stops at the first.
+        """
+        lo, end_above, hi = self._bounds(start_utc, end_utc)
+        views = self._views(self._main, self._main_block, lo, end_above, hi)
+        streams = [views]
+        if len(self._delta["start"]):
+            self._delta_shared = True
+            # delta rows are newer: on equal starts main's come first
+            streams.append(self._views(self._delta, self._delta_block, lo, end_above, hi))
+        if len(self._long["start"]):
+            self._long_shared = True
+            streams.append(self._views(self._long, self._long_block, self._long_lo(lo), end_above, hi))
+        if len(streams) > 1:
+            views = heapq.merge(*streams, key=_start_key)
+        if self.unaligned:
+            return (v for v in views if self._exact(v, start_utc, end_utc))
+        return views
+
+    def window(self, start_utc: datetime, end_utc: datetime) -> List[EventView]:
+        """overlapping() as a list: every segment read in full, then one stable C-keyed sort."""
+        lo, end_above, hi = self._bounds(start_utc, end_utc)
+        out = list(self._views(self._main, self._main_block, lo, end_above, hi)) if self._main["start"] else []
+        mixed = False
+        if self._delta["start"]:
+            n = len(out)
+            out.extend(self._views(self._delta, self._delta_block, lo, end_above, hi))
+            if len(out) > n:
+                self._delta_shared = True
+                mixed = n > 0
+        if self._long["start"]:
+            n = len(out)
+            out.extend(self._views(self._long, self._long_block, self._long_lo(lo), end_above, hi))
+            if len(out) > n:
+                self._long_shared = True
+                mixed = mixed or n > 0
+        if mixed:
+            out.sort(key=_start_key)
+        if self.unaligned:
+            return [v for v in out if self._exact(v, start_utc, end_utc)]
+        return out
+
+    def first(self, start_utc: datetime, end_utc: datetime) -> Optional[EventView]:
+        """The earliest-starting row overlapping [start_utc, end_utc)."""
+        if self.unaligned:
+            return next(self.overlapping(start_utc, end_utc), None)
+        lo, end_above, hi = self._bounds(start_utc, end_utc)
+        r = self._first_row(self._main, lo, end_above, hi)
+        best = None if r is None else EventView((self._main_block, r, self._main["start"][r]))
+        if len(self._delta["start"]):
+            r = self._first_row(self._delta, lo, end_above, hi)
+            # main wins ties (its rows are older)
+            if r is not None and (best is None or self._delta["start"][r] < best[2]):
+                self._delta_shared = True
+                best = EventView((self._delta_block, r, self._delta["start"][r]))
+        if len(self._long["start"]):
+            r = self._first_row(self._long, self._long_lo(lo), end_above, hi)
+            if r is not None and (best is None or self._long["start"][r] < best[2]):
+                self._long_shared = True
+                best = EventView((self._long_block, r, self._long["start"][r]))
+        return best
+
+    def busy(self, start_utc: datetime, end_utc: datetime) -> List[Tuple[int, int]]:
+        """(start, end) epoch seconds of rows overlapping the window, sorted by start."""
+        if self.unaligned:
+            # Views are in minute order; rows with seconds need an exact sort
+            return sorted((v._seconds(0), v._seconds(1)) for v in self.overlapping(start_utc, end_utc))
+        lo, end_above, hi = self._bounds(start_utc, end_utc)
+        out = []
+        for seg, seg_lo in ((self._main, lo), (self._delta, lo), (self._long, self._long_lo(lo))):
+            if not seg["start"]:
+                continue
+            starts, ends = seg["start"], seg["end"]
+            _, head, k, j = self._span(seg, seg_lo, end_above, hi)
+            if j - k > _VECTOR_MIN:
+                tail = (_as_numpy(starts)[k:j] * 60).tolist(), (_as_numpy(ends)[k:j] * 60).tolist()
+            else:
+                tail = [x * 60 for x in starts[k:j]], [x * 60 for x in ends[k:j]]
+            rows = [(starts[r] * 60, ends[r] * 60) for r in head] + list(zip(*tail))
+            if rows:
+                out.append(rows)
+        if len(out) > 1:
+            return list(heapq.merge(*out))
+        return out[0] if out else []
+
+    def views(self) -> Iterator[EventView]:
+        """Every row, in start order."""
+        self._delta_shared = self._long_shared = True
+        segments = ((self._main, self._main_block), (self._delta, self._delta_block), (self._long, self._long_block))
+        return heapq.merge(*(map(EventView, zip(repeat(block), range(len(seg["start"])), seg["start"]))
+                             for seg, block in segments),
+                           key=_start_key)
@@ -0,0 +1,85 @@
+# app/infra/calendar/holds.py
+"""
+Short-lived slot holds (reservations) between a conflict check and a booking.
+
+ConflictNode places a hold when the slot is free; the runner commits it once
+the user confirms, or releases it on abort. A hold that outlives its TTL stops
+blocking other sessions; committing it is still allowed if nothing else took
+the slot meanwhile.
+
+Each hold remembers the calendar version it was checked against. Calendars
+bump their version on every insert, so commit is a compare-and-swap: if the
+version is unchanged nothing can have been booked since the check and the
+event is inserted straight away; otherwise the range is re-checked first.
+"""
+from __future__ import annotations
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Optional
+import threading
+import time
+import uuid
+
+from app.domain.holds import Hold
+
+if TYPE_CHECKING:
+    from app.domain.models import Meeting
+
+DEFAULT_TTL_S = 120.0
+# Expired holds stop blocking at once but stay committable for this long
+_STALE_S = 3600.0
+
+def refused(owner: str, conflict: str) -> Hold:
+    return Hold(id=None, owner=owner, starts_at=0, ends_at=0, version=-1, conflict=conflict)
+
+def _held_message(h: Hold) -> str:
+    until = datetime.fromtimestamp(h.starts_at, tz=timezone.utc).isoformat()
+    return f"Slot starting {until} UTC is on hold for another booking in progress"
+
+class HoldTable:
+    """
+    Live holds of one calendar. Holds are few (one per session between check
+    and confirm), so overlap checks are a scan over the live set.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._holds: Dict[str, Hold] = {}
+
+    def _blocking(self, start: int, end: int, now: float, exclude: Optional[str]) -> Optional[Hold]:
+        """A live hold overlapping [start, end). Caller holds the lock; drops stale holds."""
+        found = None
+        for hid, h in list(self._holds.items()):
+            if h.expired(now - _STALE_S):
+                del self._holds[hid]
+            elif (found is None and hid != exclude and not h.expired(now)
+                  and h.starts_at < end and h.ends_at > start):
+                found = h
+        return found
+
+    def place(self, meeting: Meeting, *, owner: str, start: int, end: int, version: int,
+              ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        """Hold [start, end) unless another live hold overlaps it."""
+        now = time.monotonic()
+        with self._lock:
+            other = self._blocking(start, end, now, None)
+            if other is not None:
+                return refused(owner, _held_message(other))
+            h = Hold(id=uuid.uuid4().hex, owner=owner, starts_at=start, ends_at=end,
+                     version=version, expires_at=now + ttl_s, meeting=meeting)
+            self._holds[h.id] = h
+            return h
+
+    def get(self, hold_id: str) -> Optional[Hold]:
+        with self._lock:
+            return self._holds.get(hold_id)
+
+    def blocking(self, start: int, end: int, *, exclude: Optional[str] = None) -> Optional[str]:
+        """Conflict message for a live hold (other than `exclude`) overlapping [start, end)."""
+        with self._lock:
+            other = self._blocking(start, end, time.monotonic(), exclude)
+        return _held_message(other) if other is not None else None
+
+    def release(self, hold_id: Optional[str]) -> None:
+        if hold_id:
+            with self._lock:
+                self._holds.pop(hold_id, None)
@@ -0,0 +1,286 @@
+# app/infra/calendar/ics.py
+"""
+Streaming iCalendar (RFC 5545) reader and writer.
+
+Both sides are generators over lines, so a file of any size goes through in
+constant memory: read_ics() unfolds continuation lines and yields one
+Meeting per VEVENT as soon as its END line is read; ics_lines() yields the
+folded lines of one event at a time from any iterable of events.
+
+Supported on import:
+  DTSTART / DTEND / DURATION   UTC ("...Z"), TZID=<IANA zone>, floating
+                               (the import zone) and all-day VALUE=DATE
+  SUMMARY, LOCATION, RRULE, PRIORITY, ATTENDEE (CN + mailto:)
+Components other than VEVENT (VTIMEZONE, VTODO, nested VALARM, ...) are
+skipped. A TZID that isn't an IANA zone falls back to the import zone.
+Events that can't be booked as a Meeting (no DTSTART, a rule dateutil
+rejects, RECURRENCE-ID overrides, STATUS:CANCELLED) come out as Skipped
+with the line they started on, so one bad event doesn't stop a load.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+import re
+
+from app.domain.models import Attendee, Meeting, clean_rrule
+
+PRODID = "-//scheduler//ics export//EN"
+
+_PARAM_RX = re.compile(r';([^=;:]+)=("[^"]*"|[^;:]*)')
+_DURATION_RX = re.compile(
+    r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_UNESCAPE_RX = re.compile(r"\\([\\;,nN])")
+_ESCAPE_RX = re.compile(r"([\\;,])")
+# iCalendar PRIORITY: 1-4 high, 5 medium, 6-9 low, 0 undefined
+_PRIORITY_OUT = {"high": 1, "low": 9}
+_MAX_OCTETS = 75
+
+# ---- reading ----
+
+@dataclass
+class Skipped:
+    """A VEVENT that could not be imported."""
+    line: int       # where its BEGIN:VEVENT was
+    reason: str
+
+Property = Tuple[Dict[str, str], str]   # (parameters, raw value)
+
+def unfold(stream: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Logical content lines as (line number, text); folded continuations are joined."""
+    start, parts = 0, []
+    for lineno, line in enumerate(stream, start=1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            parts.append(line[1:])
+            continue
+        if parts:
+            yield start, "".join(parts)
+        start, parts = lineno, [line]
+    if parts:
+        yield start, "".join(parts)
+
+def _split(line: str) -> Tuple[str, str, str]:
+    """(NAME, ";params" part, value) of one content line."""
+    colon = line.find(":")
+    if colon < 0:
+        return line.upper(), "", ""
+    quote = line.find('"', 0, colon)
+    if quote >= 0:
+        # A quoted parameter value may contain ':'; the value starts at the first one outside quotes
+        inside = False
+        for colon, ch in enumerate(line):
+            if ch == '"':
+                inside = not inside
+            elif ch == ":" and not inside:
+                break
+    head, value = line[:colon], line[colon + 1:]
+    semi = head.find(";")
+    if semi < 0:
+        return head.upper(), "", value
+    return head[:semi].upper(), head[semi:], value
+
+def _params(raw: str) -> Dict[str, str]:
+    return {k.upper(): v.strip('"') for k, v in _PARAM_RX.findall(raw)}
+
+def _text(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _UNESCAPE_RX.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+@lru_cache(maxsize=256)
+def _zone(tzid: str) -> Optional[tzinfo]:
+    try:
+        return ZoneInfo(tzid)
+    except (ValueError, KeyError, OSError):
+        return None
+
+def _datetime(params: Dict[str, str], value: str, default_tz: tzinfo) -> Tuple[datetime, bool]:
+    """(aware datetime, is an all-day date) for a DTSTART/DTEND value."""
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        d = date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+        return datetime(d.year, d.month, d.day, tzinfo=default_tz), True
+    dt = datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                  int(value[9:11]), int(value[11:13]), int(value[13:15] or 0))
+    if value.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc), False
+    tzid = params.get("TZID")
+    return dt.replace(tzinfo=(_zone(tzid) if tzid else None) or default_tz), False
+
+def _duration(value: str) -> timedelta:
+    m = _DURATION_RX.match(value.strip().upper())
+    if m is None:
+        raise ValueError(f"bad DURATION {value!r}")
+    sign, w, d, h, mi, s = m.groups()
+    td = timedelta(weeks=int(w or 0), days=int(d or 0), hours=int(h or 0),
+                   minutes=int(mi or 0), seconds=int(s or 0))
+    return -td if sign == "-" else td
+
+def _priority(value: str) -> str:
+    try:
+        p = int(value)
+    except ValueError:
+        return "normal"
+    if 1 <= p <= 4:
+        return "high"
+    return "low" if p >= 6 else "normal"
+
+def _attendee(params: Dict[str, str], value: str) -> Attendee:
+    email = value[7:] if value[:7].lower() == "mailto:" else None
+    return Attendee(name=params.get("CN") or email or value, email=email)
+
+def _meeting(props: Dict[str, Property], attendees: List[Property], default_tz: tzinfo) -> Meeting:
+    if "DTSTART" not in props:
+        raise ValueError("no DTSTART")
+    if "RECURRENCE-ID" in props:
+        raise ValueError("overrides of single occurrences (RECURRENCE-ID) are not supported")
+    if props.get("STATUS", ({}, ""))[1].upper() == "CANCELLED":
+        raise ValueError("cancelled")
+    start, all_day = _datetime(*props["DTSTART"], default_tz)
+    if "DTEND" in props:
+        end = _datetime(*props["DTEND"], default_tz)[0]
+        duration = end - start
+    elif "DURATION" in props:
+        duration = _duration(props["DURATION"][1])
+    else:
+        # RFC 5545 3.6.1: a date lasts one day, a date-time takes no time
+        duration = timedelta(days=1) if all_day else timedelta(0)
+    if duration < timedelta(0):
+        raise ValueError("ends before it starts")
+    # Meeting's own normalizer, since model_construct skips validation: a
+    # date-only UNTIL (all-day series) becomes UTC, and bad rules raise ValueError
+    rule = clean_rrule(props.get("RRULE", ({}, ""))[1])
+    return Meeting.model_construct(
+        title=_text(props.get("SUMMARY", ({}, ""))[1]) or "(no title)",
+        starts_at=start,
+        duration_min=int(duration.total_seconds() // 60),
+        location=_text(props["LOCATION"][1]) if "LOCATION" in props else None,
+        attendees=[_attendee(*a) for a in attendees],
+        priority=_priority(props["PRIORITY"][1]) if "PRIORITY" in props else "normal",
+        recurrence=rule,
+    )
+
+# Properties read from a VEVENT; anything else is skipped without parsing its parameters
+_WANTED = frozenset(("DTSTART", "DTEND", "DURATION", "SUMMARY", "LOCATION", "RRULE",
+                     "PRIORITY", "STATUS", "RECURRENCE-ID"))
+
+def read_ics(stream: Iterable[str], *, tz: Union[str, tzinfo]) -> Iterator[Union[Meeting, Skipped]]:
+    """
+    Yield a Meeting (or Skipped) per VEVENT, in file order. Floating and
+    all-day times are taken in `tz`.
+    """
+    default_tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+    depth = 0               # nesting inside the VEVENT (VALARM etc.)
+    begin = 0               # line of the current BEGIN:VEVENT, 0 when outside one
+    props: Dict[str, Property] = {}
+    attendees: List[Property] = []
+    for lineno, line in unfold(stream):
+        name, raw_params, value = _split(line)
+        if name == "BEGIN":
+            if begin:
+                depth += 1
+            elif value.strip().upper() == "VEVENT":
+                begin, props, attendees = lineno, {}, []
+            continue
+        if not begin:
+            continue
+        if name == "END":
+            if depth:
+                depth -= 1
+                continue
+            try:
+                yield _meeting(props, attendees, default_tz)
+            except (ValueError, IndexError) as e:
+                yield Skipped(begin, str(e) or type(e).__name__)
+            begin = 0
+        elif depth:
+            continue
+        elif name == "ATTENDEE":
+            attendees.append((_params(raw_params), value))
+        elif name in _WANTED and name not in props:
+            props[name] = (_params(raw_params) if raw_params else {}, value)
+
+# ---- writing ----
+
+def _escape(text: str) -> str:
+    return _ESCAPE_RX.sub(r"\\\1", text).replace("\r\n", "\\n").replace("\n", "\\n")
+
+def _fold(line: str) -> str:
+    """Fold at 75 octets (RFC 5545 3.1) without splitting a UTF-8 sequence."""
+    if len(line) <= _MAX_OCTETS and line.isascii():
+        return line + "\r\n"
+    out, chunk, size = [], [], 0
+    limit = _MAX_OCTETS
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            out.append("".join(chunk))
+            chunk, size, limit = [], 0, _MAX_OCTETS - 1   # continuation lines start with a space
+        chunk.append(ch)
+        size += n
+    out.append("".join(chunk))
+    return "\r\n ".join(out) + "\r\n"
+
+def _utc(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+def _series_start(e, default_tz: tzinfo) -> str:
+    """DTSTART of a series in a named zone, so the rule keeps its local time across DST."""
+    raw = getattr(e, "raw", None)
+    zone = getattr(raw.starts_at, "tzinfo", None) if raw is not None else None
+    if getattr(zone, "key", None) is None:
+        zone = default_tz
+    local = e.starts_at.astimezone(zone)
+    key = getattr(zone, "key", None)
+    if key is None:
+        return "DTSTART:" + _utc(local)
+    return f"DTSTART;TZID={key}:{local.strftime('%Y%m%dT%H%M%S')}"
+
+def _details(e) -> Tuple[list, str]:
+    """(attendees, priority) from whatever the listing exposes (views have both, stored rows may not)."""
+    if hasattr(e, "priority"):
+        return e.attendees, e.priority
+    raw = getattr(e, "raw", None)
+    if raw is not None:
+        return raw.attendees, raw.priority
+    return [], "normal"
+
+def _event_lines(e, owner: str, stamp: str, default_tz: tzinfo) -> Iterator[str]:
+    yield "BEGIN:VEVENT"
+    # Series and one-off ids are separate sequences in the SQLite store
+    yield f"UID:{'series-' if e.recurrence else ''}{e.id}-{owner}@scheduler"
+    yield "DTSTAMP:" + stamp
+    if e.recurrence:
+        yield _series_start(e, default_tz)
+        yield f"DURATION:PT{int((e.ends_at - e.starts_at).total_seconds() // 60)}M"
+        yield "RRULE:" + e.recurrence
+    else:
+        yield "DTSTART:" + _utc(e.starts_at)
+        yield "DTEND:" + _utc(e.ends_at)
+    yield "SUMMARY:" + _escape(e.title)
+    if e.location:
+        yield "LOCATION:" + _escape(e.location)
+    attendees, priority = _details(e)
+    if priority in _PRIORITY_OUT:
+        yield f"PRIORITY:{_PRIORITY_OUT[priority]}"
+    for a in attendees:
+        cn = a.name.replace('"', "'")
+        yield f'ATTENDEE;CN="{cn}":mailto:{a.email}' if a.email else f'ATTENDEE;CN="{cn}":{_escape(a.name)}'
+    yield "END:VEVENT"
+
+def ics_lines(events: Iterable, *, owner: str, tz: Union[str, tzinfo],
+              now: Optional[datetime] = None) -> Iterator[str]:
+    """
+    Folded, CRLF-terminated lines of a VCALENDAR holding `events` (anything
+    listed by a calendar: Event, EventView). One-offs are written in UTC;
+    series keep a TZID so their rule expands in local time.
+    """
+    default_tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+    stamp = _utc(now or datetime.now(timezone.utc))
+    yield from map(_fold, ("BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:" + PRODID, "CALSCALE:GREGORIAN"))
+    for e in events:
+        yield from map(_fold, _event_lines(e, owner, stamp, default_tz))
+    yield _fold("END:VCALENDAR")
@@ -0,0 +1,118 @@
+# app/infra/calendar/recurrence.py
+"""
+Lazy expansion of recurring events (RFC 5545 RRULE bodies such as
+"FREQ=WEEKLY;BYDAY=MO").
+
+A series is stored once, with two pieces of index metadata: its first start
+and, for bounded rules (COUNT/UNTIL), the end of its last occurrence.
+Calendars use them to skip series that can't touch a window. For the rest,
+occurrences are generated lazily and generation stops at the window end. An
+open-ended weekly standup costs nothing until someone asks about a week it
+falls in.
+
+Rules expand in the series' own zone, so "every Monday at 9" stays at 9:00
+local time across DST changes.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+import re
+
+from dateutil.rrule import rrule, rrulestr
+
+_BOUNDED = ("COUNT=", "UNTIL=")
+_UNTIL_RX = re.compile(r"UNTIL=(\d{8}T\d{6})Z")
+# Bounded rules with more occurrences than this are not walked at insert
+_WALK_MAX = 1000
+# How far ahead a new recurring meeting is checked for conflicts
+CHECK_HORIZON = timedelta(days=90)
+
+@lru_cache(maxsize=1024)
+def compile_rule(rule: str, dtstart: datetime) -> rrule:
+    return rrulestr(rule, dtstart=dtstart)
+
+def is_bounded(rule_text: str) -> bool:
+    upper = rule_text.upper()
+    return any(k in upper for k in _BOUNDED)
+
+def occurrences(rule: rrule, dtstart: datetime, duration: timedelta, start_utc: datetime,
+                end_utc: datetime) -> Iterator[Tuple[datetime, datetime]]:
+    """Yield UTC (start, end) of occurrences overlapping [start_utc, end_utc), in order."""
+    try:
+        lo = start_utc - duration
+    except OverflowError:
+        lo = None
+    # Occurrences starting after `lo` are the first that can still overlap the window
+    it = rule.xafter(lo.astimezone(dtstart.tzinfo), inc=False) if lo is not None and lo > dtstart else iter(rule)
+    for occ in it:
+        s = occ.astimezone(timezone.utc)
+        if s >= end_utc:
+            return
+        yield s, s + duration
+
+@dataclass
+class Series:
+    """Index entry for one recurring event."""
+    first: datetime                 # UTC start of the first occurrence
+    last_end: Optional[datetime]    # UTC end of the last occurrence; None = open-ended
+    duration: timedelta
+    dtstart: datetime = field(repr=False)
+    rule: rrule = field(repr=False)
+    event: object = field(repr=False, default=None)
+
+    def may_overlap(self, start_utc: datetime, end_utc: datetime) -> bool:
+        return self.first < end_utc and (self.last_end is None or self.last_end > start_utc)
+
+    def occurrences(self, start_utc: datetime, end_utc: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        if not self.may_overlap(start_utc, end_utc):
+            return iter(())
+        return occurrences(self.rule, self.dtstart, self.duration, start_utc, end_utc)
+
+def _last_end(rule: rrule, rule_text: str, duration: timedelta) -> Optional[datetime]:
+    """
+    UTC end of a bounded rule's last occurrence, walking at most _WALK_MAX of
+    them. Past that, UNTIL itself bounds the last start (an over-estimate is
+    only a looser index entry); a long COUNT is indexed as open-ended.
+    """
+    head = list(islice(rule, _WALK_MAX + 1))
+    if len(head) <= _WALK_MAX:
+        return (head[-1] + duration).astimezone(timezone.utc)
+    m = _UNTIL_RX.search(rule_text.upper())
+    if m is None:
+        return None
+    until = datetime.strptime(m.group(1), "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+    return until + duration
+
+def make_series(rule_text: str, starts_at: datetime, duration_min: int, event=None) -> Optional[Series]:
+    """Index a rule anchored at starts_at (tz-aware); None if it has no occurrences."""
+    rule = compile_rule(rule_text, starts_at)
+    duration = timedelta(minutes=duration_min)
+    first = rule.after(starts_at, inc=True)
+    if first is None:
+        return None
+    last_end = _last_end(rule, rule_text, duration) if is_bounded(rule_text) else None
+    return Series(
+        first=first.astimezone(timezone.utc),
+        last_end=last_end,
+        duration=duration,
+        dtstart=starts_at,
+        rule=rule,
+        event=event,
+    )
+
+def meeting_spans(starts_at: datetime, duration_min: int, rule_text: Optional[str] = None,
+                  horizon: timedelta = CHECK_HORIZON) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    UTC (start, end) spans a meeting would occupy: one for a one-off, the
+    occurrences within `horizon` of the first one for a series.
+    """
+    if not rule_text:
+        s = starts_at.astimezone(timezone.utc)
+        yield s, s + timedelta(minutes=duration_min)
+        return
+    series = make_series(rule_text, starts_at, duration_min)
+    if series is not None:
+        yield from series.occurrences(series.first, series.first + horizon)
@@ -1,12 +1,24 @@
 # app/infra/calendar/service.py
 from __future__ import annotations
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import heapq
 import itertools
-import threading
+import zlib
 
-from app.domain.models import Meeting
+from app.domain.owners import DEFAULT_OWNER
+from app.domain.holds import Hold
+from app.infra.calendar.availability import attendee_conflict, attendee_owners, common_free_slots
+from app.infra.calendar.columns import EventStore, EventView
+from app.infra.calendar.holds import DEFAULT_TTL_S, HoldTable, refused
+from app.infra.calendar.locks import RWLock
+from app.infra.calendar.recurrence import Series, make_series, meeting_spans
+from app.infra.calendar.slots import find_free_slots
+
+if TYPE_CHECKING:
+    from app.domain.models import Meeting
 
 def _to_utc(dt: datetime) -> datetime:
     """Convert any datetime (naive or aware) to aware UTC."""
@@ -15,7 +27,7 @@ def _to_utc(dt: datetime) -> datetime:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     id: int
     title: str
@@ -23,60 +35,400 @@ class Event:
     ends_at: datetime     # always UTC (tz-aware)
     location: Optional[str] = None
     raw: Meeting = field(repr=False, compare=False, default=None)
+    owner: str = DEFAULT_OWNER
+    recurrence: Optional[str] = None   # RRULE; set on a series and on each of its occurrences
+
+# What listings return: stored one-offs are columnar views, series rows are Events
+AnyEvent = Union[Event, EventView]
 
 class InMemoryCalendar:
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._seq = itertools.count(start=1)
-        self._events: List[Event] = []
+    """
+    One-off events live in an EventStore (app.infra.calendar.columns):
+    sorted integer columns with interned strings, read back as EventViews.
+    An event overlapping [start, end) must start before `end` and no earlier
+    than `start - longest duration seen`, so window and conflict queries only
+    search into that slice instead of scanning the whole calendar.
+
+    Recurring events are stored once, as Series sorted by first occurrence
+    (_series_starts / _series). Window queries only expand series whose
+    first start / last end bracket the window, and only inside it; the
+    occurrences are merged lazily with the one-off events by start time.
+
+    Reads (conflict checks, listings) share an RWLock; only inserts take it
+    exclusively. Every insert bumps `version`, which hold commits use as a
+    compare-and-swap guard (see app.infra.calendar.holds).
+    """
+
+    def __init__(self, owner: str = DEFAULT_OWNER, seq: Optional[Iterator[int]] = None):
+        self.owner = owner
+        self._lock = RWLock()
+        self._seq = seq if seq is not None else itertools.count(start=1)
+        self._store = EventStore(owner)
+        self._series_starts: List[datetime] = []
+        self._series: List[Series] = []
+        self.version = 0
+        self._holds = HoldTable()
+
+    @staticmethod
+    def _expand(series: Series, start_utc: datetime, end_utc: datetime) -> Iterator[Event]:
+        for s, e in series.occurrences(start_utc, end_utc):
+            yield replace(series.event, starts_at=s, ends_at=e)
+
+    def _series_streams(self, start_utc: datetime, end_utc: datetime) -> List[Iterator[Event]]:
+        hi = bisect_left(self._series_starts, end_utc)
+        return [self._expand(s, start_utc, end_utc) for s in self._series[:hi]
+                if s.may_overlap(start_utc, end_utc)]
 
-    def list_events(self, start: datetime, end: datetime) -> List[Event]:
+    def _overlapping(self, start_utc: datetime, end_utc: datetime) -> Iterator[AnyEvent]:
+        """Yield events overlapping [start_utc, end_utc) in start order. Caller holds the lock."""
+        streams = self._series_streams(start_utc, end_utc)
+        if not streams:
+            yield from self._store.overlapping(start_utc, end_utc)
+            return
+        yield from heapq.merge(self._store.overlapping(start_utc, end_utc), *streams, key=lambda e: e.starts_at)
+
+    def list_events(self, start: datetime, end: datetime) -> List[AnyEvent]:
         start_utc = _to_utc(start)
         end_utc = _to_utc(end)
-        with self._lock:
-            return [
-                e for e in self._events
-                if not (e.ends_at <= start_utc or e.starts_at >= end_utc)
-            ]
+        with self._lock.read():
+            streams = self._series_streams(start_utc, end_utc) if self._series else None
+            if not streams:
+                return self._store.window(start_utc, end_utc)
+            return list(heapq.merge(self._store.window(start_utc, end_utc), *streams, key=lambda e: e.starts_at))
+
+    def busy(self, start: datetime, end: datetime) -> List[Tuple[int, int]]:
+        """Busy (start, end) epoch-second pairs overlapping [start, end), sorted by start."""
+        start_utc, end_utc = _to_utc(start), _to_utc(end)
+        with self._lock.read():
+            pairs = self._store.busy(start_utc, end_utc)
+            streams = self._series_streams(start_utc, end_utc)
+            if not streams:
+                return pairs
+            occurrences = ((int(e.starts_at.timestamp()), int(e.ends_at.timestamp()))
+                           for e in heapq.merge(*streams, key=lambda e: e.starts_at))
+            return list(heapq.merge(pairs, occurrences, key=lambda p: p[0]))
+
+    def list_all(self) -> List[AnyEvent]:
+        """Every stored entry: one-off events plus one row per series (not its occurrences)."""
+        with self._lock.read():
+            return list(heapq.merge(self._store.views(), (s.event for s in self._series),
+                                    key=lambda e: e.starts_at))
 
-    def create_event(self, meeting: Meeting) -> Event:
+    def _insert(self, meeting: Meeting, start_utc: datetime, end_utc: datetime) -> AnyEvent:
+        """Caller holds the write lock."""
+        if not meeting.recurrence:
+            self.version += 1
+            return self._store.add(next(self._seq), meeting, start_utc, end_utc)
+        ev = Event(
+            id=next(self._seq),
+            title=meeting.title,
+            starts_at=start_utc,
+            ends_at=end_utc,
+            location=meeting.location,
+            raw=meeting,
+            owner=self.owner,
+            recurrence=meeting.recurrence,
+        )
+        series = make_series(meeting.recurrence, meeting.starts_at, meeting.duration_min, ev)
+        if series is not None:
+            ev.starts_at, ev.ends_at = series.first, series.first + series.duration
+            i = bisect_right(self._series_starts, series.first)
+            self._series_starts.insert(i, series.first)
+            self._series.insert(i, series)
+            self.version += 1
+        return ev
+
+    def create_event(self, meeting: Meeting) -> AnyEvent:
         start_utc = _to_utc(meeting.starts_at)
         end_utc = start_utc + timedelta(minutes=meeting.duration_min)
-        with self._lock:
-            ev = Event(
-                id=next(self._seq),
-                title=meeting.title,
-                starts_at=start_utc,
-                ends_at=end_utc,
-                location=meeting.location,
-                raw=meeting,
-            )
-            self._events.append(ev)
-            return ev
+        with self._lock.write():
+            return self._insert(meeting, start_utc, end_utc)
+
+    def create_events(self, meetings: Iterable[Meeting]) -> int:
+        """
+        Book many meetings under one write lock, without conflict checks (an
+        import is taken as given). One-offs go to the store as one sorted
+        bulk merge; series are indexed one by one. Returns how many were
+        stored (a rule with no occurrences stores nothing).
+        """
+        def one_offs() -> Iterator[Tuple[int, Meeting, datetime, datetime]]:
+            for m in meetings:
+                start_utc = _to_utc(m.starts_at)
+                end_utc = start_utc + timedelta(minutes=m.duration_min)
+                if m.recurrence:
+                    self._insert(m, start_utc, end_utc)
+                else:
+                    yield next(self._seq), m, start_utc, end_utc
+
+        with self._lock.write():
+            series = len(self._series)
+            added = self._store.add_many(one_offs())
+            self.version += 1
+            return added + len(self._series) - series
+
+    def _first_hit(self, start_utc: datetime, end_utc: datetime) -> Optional[AnyEvent]:
+        """Caller holds the lock."""
+        if self._series:
+            return next(self._overlapping(start_utc, end_utc), None)
+        return self._store.first(start_utc, end_utc)
+
+    def _conflict_for(self, meeting: Meeting) -> Optional[str]:
+        """
+        First clash over every span the meeting would occupy (a series: its
+        next occurrences), all checked under one read lock.
+        """
+        spans = list(meeting_spans(meeting.starts_at, meeting.duration_min, meeting.recurrence))
+        with self._lock.read():
+            for s, end in spans:
+                e = self._first_hit(s, end)
+                if e is not None:
+                    break
+            else:
+                return None
+        return (
+            f"Conflicts with event #{e.id} “{e.title}” "
+            f"{e.starts_at.isoformat()}–{e.ends_at.isoformat()} UTC"
+        )
 
     def first_conflict(self, meeting: Meeting) -> Optional[str]:
+        return self._conflict_for(meeting)
+
+    # ---- holds ----
+
+    def hold(self, meeting: Meeting, *, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        """Check the slot and, if free, hold it for ttl_s seconds (hold.conflict says why not)."""
         start_utc = _to_utc(meeting.starts_at)
         end_utc = start_utc + timedelta(minutes=meeting.duration_min)
-        with self._lock:
-            for e in self._events:
-                if start_utc < e.ends_at and e.starts_at < end_utc:
-                    return (
-                        f"Conflicts with event #{e.id} “{e.title}” "
-                        f"{e.starts_at.isoformat()}–{e.ends_at.isoformat()} UTC"
-                    )
+        version = self.version     # read before the check: a later insert forces a re-check
+        conflict = self._conflict_for(meeting)
+        if conflict:
+            return refused(self.owner, conflict)
+        return self._holds.place(meeting, owner=self.owner, start=int(start_utc.timestamp()),
+                                 end=int(end_utc.timestamp()), version=version, ttl_s=ttl_s)
+
+    def get_hold(self, hold_id: str) -> Optional[Hold]:
+        return self._holds.get(hold_id)
+
+    def check_hold(self, hold_id: str) -> Optional[str]:
+        """The message commit_hold would refuse with right now, or None if it would book."""
+        h = self._holds.get(hold_id)
+        if h is None:
+            return "Hold not found: it was already committed or released"
+        if h.expired():
+            conflict = self._holds.blocking(h.starts_at, h.ends_at, exclude=h.id)
+            if conflict:
+                return conflict
+        return None if self.version == h.version else self._conflict_for(h.meeting)
+
+    def commit_hold(self, hold_id: str) -> Optional[str]:
+        """Book a held slot. Returns a conflict message instead if the slot was lost."""
+        h = self._holds.get(hold_id)
+        if h is None:
+            return "Hold not found: it was already committed or released"
+        try:
+            if h.expired():
+                conflict = self._holds.blocking(h.starts_at, h.ends_at, exclude=h.id)
+                if conflict:
+                    return conflict
+            start_utc = _to_utc(h.meeting.starts_at)
+            end_utc = start_utc + timedelta(minutes=h.meeting.duration_min)
+            version = h.version
+            while True:
+                if self.version != version:
+                    # Something was booked since the check: re-check outside the write lock
+                    version = self.version
+                    conflict = self._conflict_for(h.meeting)
+                    if conflict:
+                        return conflict
+                with self._lock.write():
+                    if self.version == version:
+                        self._insert(h.meeting, start_utc, end_utc)
+                        return None
+        finally:
+            self._holds.release(hold_id)
+
+    def release_hold(self, hold_id: Optional[str]) -> None:
+        self._holds.release(hold_id)
+
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, horizon_days: int = 14) -> List[datetime]:
+        """Next free start times (one per gap) that fit the meeting, from its requested start."""
+        start_utc = _to_utc(meeting.starts_at)
+        return find_free_slots(
+            self.busy(start_utc, start_utc + timedelta(days=horizon_days)),
+            start=meeting.starts_at,
+            duration_min=meeting.duration_min,
+            limit=limit,
+            horizon_days=horizon_days,
+        )
+
+class ShardedCalendar:
+    """
+    One InMemoryCalendar per owner (a user or a resource such as a room),
+    spread over a fixed number of shards by a stable hash of the owner id.
+
+    A shard's RWLock only guards its owner → calendar map, so looking up a
+    calendar is a shared read and creating one is a brief exclusive write.
+    Queries then run under that owner's own RWLock: different owners never
+    contend, and readers of one owner run in parallel.
+
+    Event ids come from one sequence shared by every owner's calendar, so an
+    id names one event across the whole service.
+    """
+
+    def __init__(self, shards: int = 16):
+        self._shards: List[Dict[str, InMemoryCalendar]] = [{} for _ in range(max(1, shards))]
+        self._locks = [RWLock() for _ in self._shards]
+        self._seq = itertools.count(start=1)   # next() on a count is atomic under the GIL
+
+    def _shard(self, owner: str) -> int:
+        return zlib.crc32(owner.encode("utf-8")) % len(self._shards)
+
+    def get(self, owner: str = DEFAULT_OWNER) -> Optional[InMemoryCalendar]:
+        """The owner's calendar, or None if nothing was ever booked for them."""
+        i = self._shard(owner)
+        with self._locks[i].read():
+            return self._shards[i].get(owner)
+
+    def calendar(self, owner: str = DEFAULT_OWNER) -> InMemoryCalendar:
+        """The owner's calendar, created on first use."""
+        cal = self.get(owner)
+        if cal is not None:
+            return cal
+        i = self._shard(owner)
+        with self._locks[i].write():
+            cal = self._shards[i].get(owner)
+            if cal is None:
+                cal = self._shards[i][owner] = InMemoryCalendar(owner, self._seq)
+            return cal
+
+    def owners(self) -> List[str]:
+        out: List[str] = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock.read():
+                out.extend(shard)
+        return sorted(out)
+
+    # Reads never create a calendar; an unknown owner simply has no events.
+
+    def busy(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]:
+        cal = self.get(owner)
+        return cal.busy(start, end) if cal is not None else []
+
+    def _busy_for(self, owner: str, start: datetime, end: datetime) -> List[Tuple[int, int]]:
+        return self.busy(start, end, owner=owner)
+
+    def first_conflict(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        cal = self.get(owner)
+        conflict = cal.first_conflict(meeting) if cal is not None else None
+        return conflict or attendee_conflict(self._busy_for, meeting, organizer=owner)
+
+    def create_event(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> AnyEvent:
+        return self.calendar(owner).create_event(meeting)
+
+    def create_events(self, meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int:
+        return self.calendar(owner).create_events(meetings)
+
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, owner: str = DEFAULT_OWNER) -> List[datetime]:
+        """Slots free for the owner and every attendee."""
+        return common_free_slots(self._busy_for, meeting, organizer=owner, limit=limit)
+
+    def hold(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        """
+        Hold the slot in the owner's calendar and in every attendee's, so two
+        organizers can't both hold one attendee. Refused if anyone is busy or
+        already held there.
+        """
+        conflict = attendee_conflict(self._busy_for, meeting, organizer=owner)
+        if conflict:
+            return refused(owner, conflict)
+        taken: Dict[str, str] = {}
+        for key, name in attendee_owners(meeting, owner).items():
+            h = self.calendar(key).hold(meeting, ttl_s=ttl_s)
+            if h.conflict:
+                self._release_attendees(taken)
+                return refused(owner, f"Attendee {name} is unavailable: {h.conflict}")
+            taken[key] = h.id
+        h = self.calendar(owner).hold(meeting, ttl_s=ttl_s)
+        if h.conflict:
+            self._release_attendees(taken)
+        else:
+            h.attendee_holds = taken
+        return h
+
+    def _release_attendees(self, holds: Dict[str, str]) -> None:
+        for key, hold_id in holds.items():
+            self.release_hold(hold_id, owner=key)
+
+    def commit_hold(self, hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        """
+        Book a held slot for the owner and a copy for every attendee. All the
+        holds are checked before anything is inserted, so a lost attendee slot
+        books nobody. Returns the first conflict message instead.
+        """
+        cal = self.calendar(owner)
+        h = cal.get_hold(hold_id)
+        attendees = h.attendee_holds if h is not None else {}
+        conflict = cal.check_hold(hold_id)
+        if conflict is None:
+            names = attendee_owners(h.meeting, owner)
+            for key, aid in attendees.items():
+                lost = self.calendar(key).check_hold(aid)
+                if lost:
+                    conflict = f"Attendee {names.get(key, key)} is unavailable: {lost}"
+                    break
+        if conflict is None:
+            conflict = cal.commit_hold(hold_id)
+        if conflict is not None:
+            cal.release_hold(hold_id)
+            self._release_attendees(attendees)
+            return conflict
+        for key, aid in attendees.items():
+            # Checked above; only an unchecked create_event in between can still take the slot
+            self.calendar(key).commit_hold(aid)
         return None
 
+    def release_hold(self, hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None:
+        cal = self.get(owner)
+        if cal is not None:
+            h = cal.get_hold(hold_id) if hold_id else None
+            cal.release_hold(hold_id)
+            if h is not None:
+                self._release_attendees(h.attendee_holds)
+
+    def list_events(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[AnyEvent]:
+        cal = self.get(owner)
+        return cal.list_events(start, end) if cal is not None else []
+
+    def list_all(self, *, owner: str = DEFAULT_OWNER) -> List[AnyEvent]:
+        cal = self.get(owner)
+        return cal.list_all() if cal is not None else []
+
 # Singleton + helpers
-_CAL = InMemoryCalendar()
+_CAL = ShardedCalendar()
+
+def first_conflict(meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+    return _CAL.first_conflict(meeting, owner=owner)
+
+def create_event(meeting: Meeting, *, owner: str = DEFAULT_OWNER):
+    return _CAL.create_event(meeting, owner=owner)
+
+def create_events(meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int:
+    return _CAL.create_events(meetings, owner=owner)
+
+def free_slots(meeting: Meeting, *, limit: int = 3, owner: str = DEFAULT_OWNER) -> List[datetime]:
+    return _CAL.free_slots(meeting, limit=limit, owner=owner)
+
+def hold(meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+    return _CAL.hold(meeting, owner=owner, ttl_s=ttl_s)
+
+def commit_hold(hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+    return _CAL.commit_hold(hold_id, owner=owner)
 
-def first_conflict(meeting: Meeting) -> Optional[str]:
-    return _CAL.first_conflict(meeting)
+def release_hold(hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None:
+    _CAL.release_hold(hold_id, owner=owner)
 
-def create_event(meeting: Meeting):
-    return _CAL.create_event(meeting)
+def busy(start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]:
+    return _CAL.busy(start, end, owner=owner)
 
-def list_all() -> List[Event]:
-    return _CAL.list_events(
-        datetime.min.replace(tzinfo=timezone.utc),
-        datetime.max.replace(tzinfo=timezone.utc),
-    )
+def list_all(*, owner: str = DEFAULT_OWNER) -> List[AnyEvent]:
+    return _CAL.list_all(owner=owner)
@@ -0,0 +1,102 @@
+# app/infra/calendar/slots.py
+"""
+Free-slot search over an occupancy bitmap.
+
+The horizon is cut into fixed-size cells (5 minutes by default). Busy
+intervals are painted into a difference array and prefix-summed, working
+hours become a second mask, and the free cells are scanned for runs long
+enough to hold the meeting. Everything after collecting the busy spans is
+vectorized, so months-long horizons cost a few array passes.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, time
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+import math
+
+# numpy is imported on first search, not at import: listing events never needs it
+if TYPE_CHECKING:
+    import numpy as np
+
+@dataclass(frozen=True, slots=True)
+class WorkingHours:
+    start: time = time(9, 0)
+    end: time = time(17, 0)
+    weekdays: Tuple[int, ...] = (0, 1, 2, 3, 4)   # Mon..Fri
+
+def _work_mask(t0: int, cells: int, res_s: int, tzinfo, hours: WorkingHours) -> np.ndarray:
+    """Boolean mask of cells inside working hours (computed per local day, DST-safe)."""
+    import numpy as np
+
+    mask = np.zeros(cells, dtype=bool)
+    day = datetime.fromtimestamp(t0, tz=timezone.utc).astimezone(tzinfo).date()
+    t_end = t0 + cells * res_s
+    while True:
+        open_at = datetime.combine(day, hours.start, tzinfo=tzinfo).timestamp()
+        if open_at >= t_end:
+            break
+        if day.weekday() in hours.weekdays:
+            close_at = datetime.combine(day, hours.end, tzinfo=tzinfo).timestamp()
+            lo = max(0, math.ceil((open_at - t0) / res_s))
+            hi = min(cells, math.floor((close_at - t0) / res_s))
+            if hi > lo:
+                mask[lo:hi] = True
+        day += timedelta(days=1)
+    return mask
+
+def find_free_slots(
+    busy: Iterable[Tuple[int, int]],
+    *,
+    start: datetime,
+    duration_min: int,
+    limit: int = 3,
+    horizon_days: int = 14,
+    resolution_min: int = 5,
+    hours: WorkingHours = WorkingHours(),
+) -> List[datetime]:
+    """
+    Return up to `limit` start times at or after `start`, one per free gap that
+    fits `duration_min` inside working hours.
+
+    Args:
+        busy: (start, end) UTC epoch-second pairs; only those overlapping the
+              horizon matter, extra ones are clipped away
+        start: earliest acceptable start (tz-aware; its tz defines working hours)
+        duration_min: meeting length
+        limit: number of gaps to return
+        horizon_days: how far ahead to search
+        resolution_min: bitmap cell size in minutes
+    """
+    import numpy as np
+
+    tzinfo = start.tzinfo or timezone.utc
+    res_s = resolution_min * 60
+    t0 = math.ceil(start.timestamp() / res_s) * res_s
+    cells = horizon_days * 24 * 60 // resolution_min
+    need = math.ceil(duration_min / resolution_min)
+
+    spans = np.fromiter(
+        (v for pair in busy for v in pair), dtype=np.int64
+    ).reshape(-1, 2)
+    diff = np.zeros(cells + 1, dtype=np.int32)
+    if len(spans):
+        # floor starts / ceil ends so partially-covered cells count as busy
+        lo = np.clip((spans[:, 0] - t0) // res_s, 0, cells)
+        hi = np.clip(-((t0 - spans[:, 1]) // res_s), 0, cells)
+        keep = hi > lo
+        np.add.at(diff, lo[keep], 1)
+        np.add.at(diff, hi[keep], -1)
+    busy_mask = np.cumsum(diff[:-1]) > 0
+
+    free = ~busy_mask & _work_mask(t0, cells, res_s, tzinfo, hours)
+
+    # Runs of free cells: +1 where a run opens, -1 where it closes
+    edges = np.diff(np.concatenate(([0], free.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    fits = run_starts[(run_ends - run_starts) >= need][:limit]
+
+    return [
+        datetime.fromtimestamp(int(t0 + i * res_s), tz=timezone.utc).astimezone(tzinfo)
+        for i in fits
+    ]
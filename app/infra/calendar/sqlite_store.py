@@ -0,0 +1,489 @@
+# app/infra/calendar/sqlite_store.py
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+import heapq
+import sqlite3
+import threading
+
+from app.domain.owners import DEFAULT_OWNER
+from app.domain.holds import Hold
+from app.infra.calendar.availability import attendee_conflict, attendee_owners, common_free_slots
+from app.infra.calendar.holds import DEFAULT_TTL_S, HoldTable, refused
+from app.infra.calendar.recurrence import Series, make_series, meeting_spans
+from app.infra.calendar.service import Event, _to_utc
+
+if TYPE_CHECKING:
+    from app.domain.models import Meeting
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner     TEXT    NOT NULL DEFAULT 'default',   -- user or resource id
+    title     TEXT    NOT NULL,
+    starts_at INTEGER NOT NULL,   -- UTC epoch seconds
+    ends_at   INTEGER NOT NULL,   -- UTC epoch seconds
+    location  TEXT,
+    raw       TEXT                -- Meeting JSON, only read on demand
+);
+CREATE TABLE IF NOT EXISTS series (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner        TEXT    NOT NULL,
+    title        TEXT    NOT NULL,
+    dtstart      TEXT    NOT NULL,   -- ISO start with offset; the rule expands from here
+    tz           TEXT,               -- IANA zone of dtstart (NULL: fixed offset)
+    first_at     INTEGER NOT NULL,   -- UTC epoch seconds of the first occurrence
+    last_end     INTEGER,            -- UTC epoch end of the last one; NULL = open-ended
+    duration_min INTEGER NOT NULL,
+    rrule        TEXT    NOT NULL,
+    location     TEXT,
+    raw          TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Covering index for overlap queries: one owner's range scan on starts_at can
+# test ends_at and return the rowid without touching the table.
+_INDEX = """
+CREATE INDEX IF NOT EXISTS ix_events_owner_span ON events (owner, starts_at, ends_at);
+DROP INDEX IF EXISTS ix_events_span;
+CREATE INDEX IF NOT EXISTS ix_series_owner_first ON series (owner, first_at, last_end);
+"""
+
+_FETCH_CHUNK = 1000
+
+def _epoch(dt: datetime) -> int:
+    return int(_to_utc(dt).timestamp())
+
+def _from_epoch(ts: int) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+def _row_to_event(row) -> Event:
+    return Event(
+        id=row[0],
+        title=row[1],
+        starts_at=_from_epoch(row[2]),
+        ends_at=_from_epoch(row[3]),
+        location=row[4],
+        owner=row[5],
+    )
+
+class SQLiteCalendar:
+    """
+    Durable calendar on a single SQLite file.
+
+    Overlap queries use the same bound as InMemoryCalendar: a clashing event
+    starts before `end` and no earlier than `start - max_span`, where
+    max_span (longest stored duration) is kept in the meta table. That turns
+    "starts_at < end AND ends_at > start" into a bounded index range scan.
+
+    Events belong to an owner (user or resource); every query is scoped to
+    one owner through the (owner, starts_at, ends_at) index.
+
+    Recurring meetings go to the `series` table, one row per rule, with the
+    first start and last end (NULL when open-ended) as indexed metadata.
+    Queries pick the series that can touch the window from that index and
+    expand them lazily, inside the window only (see recurrence.py).
+
+    Each owner has a version counter in the meta table, bumped by every
+    insert; hold commits compare it inside the insert transaction instead of
+    locking between check and confirm. Holds themselves live in this process.
+
+    Writes go through WAL with synchronous=NORMAL. create_event commits
+    immediately unless it runs inside `batch()`, which groups inserts into
+    one transaction; create_events inserts a whole list in one, and
+    `bulk_load()` defers the span index to the end of a large import.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        cols = {r[1] for r in self._conn.execute("PRAGMA table_info(events)")}
+        if "owner" not in cols:
+            # Files created before calendars were per-owner
+            self._conn.execute("ALTER TABLE events ADD COLUMN owner TEXT NOT NULL DEFAULT 'default'")
+        self._conn.executescript(_INDEX)
+        self._in_batch = False
+        self._holds: Dict[str, HoldTable] = {}
+        self._series_cache: Dict[int, Series] = {}   # rows are immutable; compiled rules are reused
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'max_span'").fetchone()
+        self._max_span = row[0] if row else 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---- writes ----
+
+    @contextmanager
+    def batch(self):
+        """Group every create_event inside the block into one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._in_batch = True
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._in_batch = False
+                self._conn.execute("ROLLBACK")
+                self._reload_max_span()
+            raise
+        with self._lock:
+            self._in_batch = False
+            self._conn.execute("COMMIT")
+
+    def _reload_max_span(self) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'max_span'").fetchone()
+        self._max_span = row[0] if row else 0
+
+    def _bump_version(self, owner: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1",
+            ("version:" + owner,),
+        )
+
+    def _widen_span(self, span: int) -> None:
+        if span > self._max_span:
+            self._max_span = span
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('max_span', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (self._max_span,),
+            )
+
+    def _insert_series(self, meeting: Meeting, owner: str) -> Event:
+        series = make_series(meeting.recurrence, meeting.starts_at, meeting.duration_min)
+        first = series.first if series is not None else _to_utc(meeting.starts_at)
+        ev = Event(id=0, title=meeting.title, starts_at=first,
+                   ends_at=first + timedelta(minutes=meeting.duration_min),
+                   location=meeting.location, raw=meeting, owner=owner, recurrence=meeting.recurrence)
+        if series is None:
+            return ev   # the rule never fires; nothing to store
+        cur = self._conn.execute(
+            "INSERT INTO series (owner, title, dtstart, tz, first_at, last_end, duration_min, rrule, location, raw) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (owner, meeting.title, meeting.starts_at.isoformat(), getattr(meeting.starts_at.tzinfo, "key", None),
+             _epoch(series.first), _epoch(series.last_end) if series.last_end else None,
+             meeting.duration_min, meeting.recurrence, meeting.location, meeting.model_dump_json()),
+        )
+        self._bump_version(owner)
+        ev.id = cur.lastrowid
+        return ev
+
+    def _insert(self, meeting: Meeting, owner: str) -> Event:
+        if meeting.recurrence:
+            return self._insert_series(meeting, owner)
+        start = _epoch(meeting.starts_at)
+        end = start + meeting.duration_min * 60
+        cur = self._conn.execute(
+            "INSERT INTO events (owner, title, starts_at, ends_at, location, raw) VALUES (?, ?, ?, ?, ?, ?)",
+            (owner, meeting.title, start, end, meeting.location, meeting.model_dump_json()),
+        )
+        self._bump_version(owner)
+        self._widen_span(end - start)
+        return Event(
+            id=cur.lastrowid,
+            title=meeting.title,
+            starts_at=_from_epoch(start),
+            ends_at=_from_epoch(end),
+            location=meeting.location,
+            raw=meeting,
+            owner=owner,
+        )
+
+    def create_event(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Event:
+        with self._lock:
+            if self._in_batch:
+                return self._insert(meeting, owner)
+            self._conn.execute("BEGIN")
+            try:
+                ev = self._insert(meeting, owner)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._reload_max_span()
+                raise
+            self._conn.execute("COMMIT")
+            return ev
+
+    def _insert_many(self, meetings: Iterable[Meeting], owner: str) -> int:
+        """Caller holds the lock inside a transaction."""
+        series = 0
+        longest = 0
+
+        def rows():
+            nonlocal series, longest
+            for m in meetings:
+                if m.recurrence:
+                    series += self._insert_series(m, owner).id != 0
+                    continue
+                start = _epoch(m.starts_at)
+                longest = max(longest, m.duration_min * 60)
+                yield owner, m.title, start, start + m.duration_min * 60, m.location, m.model_dump_json()
+
+        cur = self._conn.executemany(
+            "INSERT INTO events (owner, title, starts_at, ends_at, location, raw) VALUES (?, ?, ?, ?, ?, ?)",
+            rows(),
+        )
+        if cur.rowcount > 0:
+            self._bump_version(owner)
+        self._widen_span(longest)
+        return max(cur.rowcount, 0) + series
+
+    def create_events(self, meetings: Iterable[Meeting], *, owner: str = DEFAULT_OWNER) -> int:
+        """
+        Insert many meetings in one transaction (or into the open batch()),
+        without conflict checks: one executemany for the one-offs and one
+        version bump. Returns how many rows were stored.
+        """
+        with self._lock:
+            if self._in_batch:
+                return self._insert_many(meetings, owner)
+            self._conn.execute("BEGIN")
+            try:
+                n = self._insert_many(meetings, owner)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                self._reload_max_span()
+                raise
+            self._conn.execute("COMMIT")
+            return n
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Large imports: drop the span index for the duration of the block and
+        build it once at the end, instead of updating it row by row. Overlap
+        queries inside the block still work, as full scans.
+        """
+        with self._lock:
+            self._conn.execute("DROP INDEX IF EXISTS ix_events_owner_span")
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._conn.executescript(_INDEX)
+
+    # ---- holds ----
+
+    def _version(self, owner: str) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", ("version:" + owner,)).fetchone()
+        return row[0] if row else 0
+
+    def _hold_table(self, owner: str) -> HoldTable:
+        with self._lock:
+            return self._holds.setdefault(owner, HoldTable())
+
+    def hold(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER, ttl_s: float = DEFAULT_TTL_S) -> Hold:
+        """Check the slot and, if free, hold it for ttl_s seconds (hold.conflict says why not)."""
+        start = _epoch(meeting.starts_at)
+        end = start + meeting.duration_min * 60
+        with self._lock:
+            version = self._version(owner)
+            conflict = self._conflict_for(owner, meeting)
+        conflict = conflict or attendee_conflict(self._busy_for, meeting, organizer=owner)
+        if conflict:
+            return refused(owner, conflict)
+        return self._hold_table(owner).place(meeting, owner=owner, start=start, end=end,
+                                             version=version, ttl_s=ttl_s)
+
+    def commit_hold(self, hold_id: str, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        """
+        Book a held slot for the owner and a copy for every attendee, in one
+        transaction that re-checks the attendees. Returns a conflict message
+        instead if any slot was lost.
+        """
+        table = self._hold_table(owner)
+        h = table.get(hold_id)
+        if h is None:
+            return "Hold not found: it was already committed or released"
+        try:
+            if h.expired():
+                conflict = table.blocking(h.starts_at, h.ends_at, exclude=h.id)
+                if conflict:
+                    return conflict
+            with self._lock:
+                if not self._in_batch:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Compare-and-swap on the owner's version; re-check only if it moved
+                    conflict = None
+                    if self._version(owner) != h.version:
+                        conflict = self._conflict_for(owner, h.meeting)
+                    # Attendees were only checked at hold time: another organizer may have booked them since
+                    people = attendee_owners(h.meeting, owner)
+                    for key, name in people.items() if conflict is None else ():
+                        lost = self._conflict_for(key, h.meeting)
+                        if lost:
+                            conflict = f"Attendee {name} is unavailable: {lost}"
+                            break
+                    if conflict is None:
+                        self._insert(h.meeting, owner)
+                        for key in people:
+                            self._insert(h.meeting, key)
+                except BaseException:
+                    if not self._in_batch:
+                        self._conn.execute("ROLLBACK")
+                        self._reload_max_span()
+                    raise
+                if not self._in_batch:
+                    self._conn.execute("COMMIT")
+            return conflict
+        finally:
+            table.release(hold_id)
+
+    def release_hold(self, hold_id: Optional[str], *, owner: str = DEFAULT_OWNER) -> None:
+        self._hold_table(owner).release(hold_id)
+
+    # ---- reads ----
+
+    def _series(self, owner: str, start: Optional[int], end: Optional[int]) -> List[Series]:
+        """Series that can touch [start, end) by their indexed bounds, by first start. Caller holds the lock."""
+        sql = ("SELECT id, title, dtstart, tz, duration_min, rrule, location FROM series "
+               "WHERE owner = ?")
+        args: list = [owner]
+        if start is not None:
+            sql += " AND first_at < ? AND (last_end IS NULL OR last_end > ?)"
+            args += [end, start]
+        out: List[Series] = []
+        for sid, title, dtstart, tz, duration_min, rule, location in self._conn.execute(sql + " ORDER BY first_at", args):
+            series = self._series_cache.get(sid)
+            if series is None:
+                anchor = datetime.fromisoformat(dtstart)
+                if tz:
+                    anchor = anchor.astimezone(ZoneInfo(tz))
+                series = make_series(rule, anchor, duration_min)
+                series.event = Event(id=sid, title=title, starts_at=series.first,
+                                     ends_at=series.first + series.duration, location=location,
+                                     owner=owner, recurrence=rule)
+                self._series_cache[sid] = series
+            out.append(series)
+        return out
+
+    @staticmethod
+    def _expand(series: Series, start: datetime, end: datetime) -> Iterator[Event]:
+        for s, e in series.occurrences(start, end):
+            yield replace(series.event, starts_at=s, ends_at=e)
+
+    def _conflict(self, owner: str, start: int, end: int) -> Optional[str]:
+        """Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT id, title, starts_at, ends_at FROM events "
+            "WHERE owner = ? AND starts_at >= ? AND starts_at < ? AND ends_at > ? "
+            "ORDER BY starts_at LIMIT 1",
+            (owner, start - self._max_span, end, start),
+        ).fetchone()
+        hit = (row[0], row[1], _from_epoch(row[2]), _from_epoch(row[3])) if row else None
+        s_dt, e_dt = _from_epoch(start), _from_epoch(end)
+        for series in self._series(owner, start, end):
+            occ = next(series.occurrences(s_dt, e_dt), None)
+            if occ is not None and (hit is None or occ[0] < hit[2]):
+                hit = (series.event.id, series.event.title, occ[0], occ[1])
+        if hit is None:
+            return None
+        return (
+            f"Conflicts with event #{hit[0]} “{hit[1]}” "
+            f"{hit[2].isoformat()}–{hit[3].isoformat()} UTC"
+        )
+
+    def _conflict_for(self, owner: str, meeting: Meeting) -> Optional[str]:
+        """First clash over every span the meeting would occupy. Caller holds the lock."""
+        for s, e in meeting_spans(meeting.starts_at, meeting.duration_min, meeting.recurrence):
+            conflict = self._conflict(owner, _epoch(s), _epoch(e))
+            if conflict:
+                return conflict
+        return None
+
+    def first_conflict(self, meeting: Meeting, *, owner: str = DEFAULT_OWNER) -> Optional[str]:
+        """The owner's first clash, else the first attendee who is busy."""
+        with self._lock:
+            conflict = self._conflict_for(owner, meeting)
+        return conflict or attendee_conflict(self._busy_for, meeting, organizer=owner)
+
+    def busy(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Tuple[int, int]]:
+        """Busy (start, end) epoch-second pairs overlapping [start, end), sorted by start."""
+        s, e = _epoch(start), _epoch(end)
+        with self._lock:
+            spans = self._conn.execute(
+                "SELECT starts_at, ends_at FROM events "
+                "WHERE owner = ? AND starts_at >= ? AND starts_at < ? AND ends_at > ? ORDER BY starts_at",
+                (owner, s - self._max_span, e, s),
+            ).fetchall()
+            series = self._series(owner, s, e)
+        if not series:
+            return spans
+        s_dt, e_dt = _from_epoch(s), _from_epoch(e)
+        occ = ([(_epoch(a), _epoch(b)) for a, b in x.occurrences(s_dt, e_dt)] for x in series)
+        return list(heapq.merge(spans, *occ))
+
+    def _busy_for(self, owner: str, start: datetime, end: datetime) -> List[Tuple[int, int]]:
+        return self.busy(start, end, owner=owner)
+
+    def _iter_rows(self, s: int, e: int, owner: str) -> Iterator[Event]:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT id, title, starts_at, ends_at, location, owner FROM events "
+                "WHERE owner = ? AND starts_at >= ? AND starts_at < ? AND ends_at > ? "
+                "ORDER BY starts_at, id",
+                (owner, s - self._max_span, e, s),
+            )
+        while True:
+            with self._lock:
+                rows = cur.fetchmany(_FETCH_CHUNK)
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_event(row)
+
+    def iter_events(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> Iterator[Event]:
+        """
+        Stream the owner's events overlapping [start, end) in start order, a chunk
+        at a time, with recurring occurrences expanded inside the window.
+        """
+        s, e = _epoch(start), _epoch(end)
+        with self._lock:
+            series = self._series(owner, s, e)
+        rows = self._iter_rows(s, e, owner)
+        if not series:
+            return rows
+        start_utc, end_utc = _to_utc(start), _to_utc(end)
+        return heapq.merge(rows, *(self._expand(x, start_utc, end_utc) for x in series),
+                           key=lambda ev: ev.starts_at)
+
+    def list_events(self, start: datetime, end: datetime, *, owner: str = DEFAULT_OWNER) -> List[Event]:
+        return list(self.iter_events(start, end, owner=owner))
+
+    def list_all(self, *, owner: str = DEFAULT_OWNER) -> Iterator[Event]:
+        """Every stored entry: one-off events plus one row per series (not its occurrences)."""
+        with self._lock:
+            heads = [x.event for x in self._series(owner, None, None)]
+        rows = self._iter_rows(_epoch(datetime.min.replace(tzinfo=timezone.utc)),
+                               _epoch(datetime.max.replace(tzinfo=timezone.utc)), owner)
+        return heapq.merge(rows, heads, key=lambda ev: ev.starts_at)
+
+    def free_slots(self, meeting: Meeting, *, limit: int = 3, horizon_days: int = 14,
+                   owner: str = DEFAULT_OWNER) -> List[datetime]:
+        """Next free start times (one per gap) for the owner and every attendee, from the requested start."""
+        return common_free_slots(self._busy_for, meeting, organizer=owner, limit=limit,
+                                 horizon_days=horizon_days)
+
+    def get_meeting(self, event_id: int) -> Optional[Meeting]:
+        """Rehydrate the stored Meeting for one event (not loaded by listings)."""
+        with self._lock:
+            row = self._conn.execute("SELECT raw FROM events WHERE id = ?", (event_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        from app.domain.models import Meeting
+        return Meeting.model_validate_json(row[0])
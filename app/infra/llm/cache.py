@@ -0,0 +1,344 @@
+# app/infra/llm/cache.py
+"""
+Content-addressed response cache around any LLMClient.
+
+Key = sha256 over (model, temperature, system prompt, composed human message,
+schema), so two calls share an entry only if the model would see the exact
+same input. Lookups go memory LRU → optional SQLite disk tier (with TTL and
+a size cap) → the wrapped client. Concurrent misses on one key are coalesced
+(singleflight): the first caller talks to the model, the others wait for its
+answer.
+
+The client's lock only covers the memory LRU, the in-flight table and the
+stats. Disk reads and writes run outside it (on a worker thread for async
+callers), so a slow disk never stalls memory hits or the event loop.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from app.infra.llm.types import LLMClient, ExtractOptions
+from app.infra.llm.messages import _compose_human, _compose_repair, _minify_schema
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0        # callers that waited on an in-flight identical request
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.coalesced + self.misses
+        return (total - self.misses) / total if total else 0.0
+
+
+class _LRU:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str) -> int:
+        """Insert and return how many entries were evicted."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        evicted = 0
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            evicted += 1
+        return evicted
+
+
+class _DiskTier:
+    """
+    Responses in a SQLite file; entries older than ttl_s are ignored and purged.
+    One connection per thread (WAL), so readers don't queue behind each other
+    or behind a writer.
+    """
+
+    def __init__(self, path: Union[str, Path], *, ttl_s: Optional[float], max_entries: int):
+        self.path = str(path)
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_created ON responses (created)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, isolation_level=None)
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        conn = self._conn()
+        row = conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if self.ttl_s is not None and time.time() - row[1] > self.ttl_s:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        return row[0]
+
+    def put(self, key: str, value: str) -> int:
+        """Insert and return how many entries were evicted (expired or over the cap)."""
+        now = time.time()
+        conn = self._conn()
+        # IMMEDIATE: take the write lock up front so concurrent writers wait instead of failing
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, now),
+            )
+            evicted = 0
+            if self.ttl_s is not None:
+                evicted += conn.execute(
+                    "DELETE FROM responses WHERE created < ?", (now - self.ttl_s,)
+                ).rowcount
+            evicted += conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return evicted
+
+
+class _Call:
+    """One in-flight request that other callers with the same key can wait on."""
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class CachingLLMClient:
+    """
+    LLMClient wrapper adding an LRU + optional disk cache with singleflight.
+
+    Args:
+        inner: the real client (e.g. OllamaClient)
+        maxsize: memory LRU capacity (entries)
+        disk_path: SQLite file for the persistent tier (None = memory only)
+        ttl_s: disk entry lifetime in seconds (None = no expiry)
+        disk_max_entries: disk tier capacity; oldest entries are evicted first
+    """
+
+    def __init__(self, inner: LLMClient, *, maxsize: int = 1024,
+                 disk_path: Union[str, Path, None] = None, ttl_s: Optional[float] = 7 * 24 * 3600,
+                 disk_max_entries: int = 100_000):
+        self.inner = inner
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._mem = _LRU(maxsize)
+        self._disk = _DiskTier(disk_path, ttl_s=ttl_s, max_entries=disk_max_entries) if disk_path else None
+        self._inflight: Dict[str, _Call] = {}
+        self._ainflight: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+
+    # ---- keying ----
+
+    def _key(self, kind: str, system: Optional[str], human: str, schema: Dict[str, Any],
+             options: ExtractOptions) -> str:
+        h = hashlib.sha256()
+        for part in (
+            kind,
+            str(getattr(self.inner, "model", "")),
+            repr(getattr(self.inner, "temperature", "")),
+            system or getattr(self.inner, "default_system", "") or "",
+            human,
+            options.schema_json or _minify_schema(schema),
+        ):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    # ---- lookup / singleflight ----
+
+    def _memory_hit(self, key: str) -> Optional[str]:
+        """Caller holds the lock."""
+        hit = self._mem.get(key)
+        if hit is not None:
+            self.stats.memory_hits += 1
+        return hit
+
+    def _disk_hit(self, key: str) -> Optional[str]:
+        """The leader's disk lookup, outside the lock (promoted into memory); a miss here is a real miss."""
+        hit = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if hit is None:
+                self.stats.misses += 1
+            else:
+                self.stats.disk_hits += 1
+                self.stats.evictions += self._mem.put(key, hit)
+        return hit
+
+    def _store_memory(self, key: str, value: str) -> None:
+        with self._lock:
+            self.stats.evictions += self._mem.put(key, value)
+
+    def _store_disk(self, key: str, value: str) -> None:
+        evicted = self._disk.put(key, value)
+        with self._lock:
+            self.stats.evictions += evicted
+
+    def _store(self, key: str, value: str) -> None:
+        self._store_memory(key, value)
+        if self._disk is not None:
+            self._store_disk(key, value)
+
+    def _get_or_call(self, key: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            hit = self._memory_hit(key)
+            if hit is not None:
+                return json.loads(hit)
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Call()
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return json.loads(flight.value)
+
+        try:
+            value = self._disk_hit(key)
+            fresh = value is None
+            if fresh:
+                value = json.dumps(call(), separators=(",", ":"))
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.value = value
+            if fresh:
+                self._store(key, value)
+            return json.loads(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    async def _aget_or_call(self, key: str, acall: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Async singleflight: identical awaits on one event loop share one model call.
+        (Sync and async callers share the cache tiers but not in-flight calls.)
+        If the leader is cancelled, its waiters are released with None and one
+        of them re-issues the call as the new leader.
+        """
+        while True:
+            with self._lock:
+                hit = self._memory_hit(key)
+                if hit is not None:
+                    return json.loads(hit)
+                flight = self._ainflight.get(key)
+                if flight is None:
+                    flight = self._ainflight[key] = asyncio.get_running_loop().create_future()
+                    leader = True
+                else:
+                    self.stats.coalesced += 1
+                    leader = False
+
+            if not leader:
+                value = await asyncio.shield(flight)
+                if value is None:       # leader cancelled: try again, maybe as leader
+                    continue
+                return json.loads(value)
+
+            try:
+                if self._disk is not None:
+                    value = await asyncio.to_thread(self._disk_hit, key)
+                else:
+                    value = self._disk_hit(key)
+                fresh = value is None
+                if fresh:
+                    value = json.dumps(await acall(), separators=(",", ":"))
+            except asyncio.CancelledError:
+                # The leader's caller went away, not the request: don't fail the waiters
+                flight.set_result(None)
+                raise
+            except BaseException as e:
+                flight.set_exception(e)
+                flight.exception()  # mark retrieved: no "never retrieved" warning without waiters
+                raise
+            else:
+                flight.set_result(value)
+                if fresh:
+                    self._store_memory(key, value)
+                    if self._disk is not None:
+                        await asyncio.to_thread(self._store_disk, key, value)
+                return json.loads(value)
+            finally:
+                with self._lock:
+                    if self._ainflight.get(key) is flight:
+                        self._ainflight.pop(key)
+
+    # ---- LLMClient ----
+
+    def structured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                           options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_human(user_text=user_text, schema=schema, opt=options)
+        key = self._key("extract", options.system, human, schema, options)
+        return self._get_or_call(key, lambda: self.inner.structured_extract(
+            user_text=user_text, schema=schema, options=options))
+
+    def repair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                         schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_repair(previous=previous, errors=errors, schema=schema, opt=options)
+        key = self._key("repair", options.system, human, schema, options)
+        return self._get_or_call(key, lambda: self.inner.repair_to_schema(
+            previous=previous, errors=errors, schema=schema, options=options))
+
+    # ---- AsyncLLMClient (falls back to the sync client in a thread) ----
+
+    async def astructured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                                  options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_human(user_text=user_text, schema=schema, opt=options)
+        key = self._key("extract", options.system, human, schema, options)
+        kwargs = dict(user_text=user_text, schema=schema, options=options)
+        if hasattr(self.inner, "astructured_extract"):
+            return await self._aget_or_call(key, lambda: self.inner.astructured_extract(**kwargs))
+        return await self._aget_or_call(key, lambda: asyncio.to_thread(self.inner.structured_extract, **kwargs))
+
+    async def arepair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                                schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_repair(previous=previous, errors=errors, schema=schema, opt=options)
+        key = self._key("repair", options.system, human, schema, options)
+        kwargs = dict(previous=previous, errors=errors, schema=schema, options=options)
+        if hasattr(self.inner, "arepair_to_schema"):
+            return await self._aget_or_call(key, lambda: self.inner.arepair_to_schema(**kwargs))
+        return await self._aget_or_call(key, lambda: asyncio.to_thread(self.inner.repair_to_schema, **kwargs))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**asdict(self.stats), "hit_rate": round(self.stats.hit_rate, 4)}
@@ -0,0 +1,191 @@
+# app/infra/llm/cascade.py
+"""
+Model cascade: an ordered list of LLM clients, cheapest first.
+
+Extraction starts at the first tier and only moves up when the graph says
+the draft failed: route_after_validate sends a fixable draft from a lower
+tier to the "escalate" node (re-extract one tier up) instead of repairing
+it with the same small model. A client error on a lower tier escalates
+immediately. Repair always uses the top tier.
+
+Every tier keeps call/latency statistics and an outcome record (drafts that
+ended up valid vs. drafts that had to be escalated). A tier whose recent
+success rate drops below `skip_below` after `min_samples` outcomes is
+skipped for new requests, except for one probe in every `probe_every`
+requests so it can earn its place back.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+import asyncio
+import threading
+import time
+
+from app.infra.llm.types import LLMClient, ExtractOptions
+
+
+@dataclass
+class TierStats:
+    name: str
+    calls: int = 0
+    errors: int = 0           # client raised; the request moved up a tier
+    accepted: int = 0         # drafts from this tier that validated
+    escalated: int = 0        # drafts from this tier handed to the next one
+    latency_s: float = 0.0    # total over `calls`
+    success: float = 1.0      # recent rate of accepted (1) vs escalated/error (0)
+    skipped: int = 0          # requests that bypassed this tier
+
+    @property
+    def outcomes(self) -> int:
+        return self.accepted + self.escalated + self.errors
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name, "calls": self.calls, "errors": self.errors,
+            "accepted": self.accepted, "escalated": self.escalated, "skipped": self.skipped,
+            "success_rate": round(self.success, 4),
+            "latency_ms_avg": round(self.latency_s / self.calls * 1000, 3) if self.calls else None,
+        }
+
+
+class CascadingLLMClient:
+    def __init__(self, tiers: Sequence[Tuple[str, LLMClient]], *, skip_below: float = 0.2,
+                 min_samples: int = 20, probe_every: int = 10, alpha: float = 0.1):
+        """
+        Args:
+            tiers: (name, client) pairs, cheapest first; the last one is the fallback
+            skip_below: success rate under which a lower tier is bypassed
+            min_samples: outcomes a tier needs before it can be bypassed
+            probe_every: a bypassed tier still gets every probe_every-th request
+            alpha: weight of the newest outcome in the success-rate EWMA
+        """
+        if not tiers:
+            raise ValueError("CascadingLLMClient needs at least one tier")
+        self.clients: List[LLMClient] = [client for _, client in tiers]
+        self.stats: List[TierStats] = [TierStats(name) for name, _ in tiers]
+        self.skip_below = skip_below
+        self.min_samples = min_samples
+        self.probe_every = max(1, probe_every)
+        self.alpha = alpha
+        self._lock = threading.Lock()
+
+    @property
+    def top_tier(self) -> int:
+        return len(self.clients) - 1
+
+    # ---- tier selection ----
+
+    def _usable(self, tier: int) -> bool:
+        """Call with the lock held; counts a bypass (or a probe) of `tier`."""
+        s = self.stats[tier]
+        if tier == self.top_tier or s.outcomes < self.min_samples or s.success >= self.skip_below:
+            return True
+        s.skipped += 1
+        return s.skipped % self.probe_every == 0
+
+    def start_tier(self) -> int:
+        """The first tier a new request should try."""
+        return self.next_tier(-1)
+
+    def next_tier(self, tier: int) -> int:
+        """The tier to escalate to after `tier`; the top tier once nothing else is left."""
+        with self._lock:
+            for t in range(tier + 1, self.top_tier):
+                if self._usable(t):
+                    return t
+        return self.top_tier
+
+    # ---- outcome feedback ----
+
+    def _outcome(self, s: TierStats, ok: bool) -> None:
+        # Plain mean over the first 1/alpha outcomes, then exponentially weighted
+        s.success += max(self.alpha, 1.0 / s.outcomes) * ((1.0 if ok else 0.0) - s.success)
+
+    def record(self, tier: int, valid: bool) -> None:
+        """The draft `tier` produced validated (True) or was escalated (False)."""
+        with self._lock:
+            s = self.stats[tier]
+            if valid:
+                s.accepted += 1
+            else:
+                s.escalated += 1
+            self._outcome(s, valid)
+
+    def _timed(self, tier: int, seconds: float, failed: bool) -> None:
+        with self._lock:
+            s = self.stats[tier]
+            s.calls += 1
+            s.latency_s += seconds
+            if failed:
+                s.errors += 1
+                self._outcome(s, False)
+
+    # ---- tiered calls ----
+
+    def extract_at(self, tier: int, *, user_text: str, schema: Dict[str, Any],
+                   options: ExtractOptions) -> Tuple[Dict[str, Any], int]:
+        """Extract with `tier`; a client error moves up. Returns (draft, tier that produced it)."""
+        while True:
+            t0 = time.perf_counter()
+            try:
+                data = self.clients[tier].structured_extract(user_text=user_text, schema=schema, options=options)
+            except Exception:
+                self._timed(tier, time.perf_counter() - t0, failed=True)
+                if tier >= self.top_tier:
+                    raise
+                tier = self.next_tier(tier)
+                continue
+            self._timed(tier, time.perf_counter() - t0, failed=False)
+            return data, tier
+
+    async def aextract_at(self, tier: int, *, user_text: str, schema: Dict[str, Any],
+                          options: ExtractOptions) -> Tuple[Dict[str, Any], int]:
+        while True:
+            client = self.clients[tier]
+            t0 = time.perf_counter()
+            try:
+                if hasattr(client, "astructured_extract"):
+                    data = await client.astructured_extract(user_text=user_text, schema=schema, options=options)
+                else:
+                    data = await asyncio.to_thread(
+                        client.structured_extract, user_text=user_text, schema=schema, options=options)
+            except Exception:
+                self._timed(tier, time.perf_counter() - t0, failed=True)
+                if tier >= self.top_tier:
+                    raise
+                tier = self.next_tier(tier)
+                continue
+            self._timed(tier, time.perf_counter() - t0, failed=False)
+            return data, tier
+
+    # ---- LLMClient / AsyncLLMClient ----
+
+    def structured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                           options: ExtractOptions) -> Dict[str, Any]:
+        return self.extract_at(self.start_tier(), user_text=user_text, schema=schema, options=options)[0]
+
+    async def astructured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                                  options: ExtractOptions) -> Dict[str, Any]:
+        return (await self.aextract_at(self.start_tier(), user_text=user_text, schema=schema, options=options))[0]
+
+    def repair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                         schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        return self.clients[self.top_tier].repair_to_schema(
+            previous=previous, errors=errors, schema=schema, options=options)
+
+    async def arepair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                                schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        client = self.clients[self.top_tier]
+        kwargs = dict(previous=previous, errors=errors, schema=schema, options=options)
+        if hasattr(client, "arepair_to_schema"):
+            return await client.arepair_to_schema(**kwargs)
+        return await asyncio.to_thread(client.repair_to_schema, **kwargs)
+
+    def cascade_stats(self) -> List[Dict[str, Any]]:
+        """Per-tier stats, cheapest first; tiers behind a CachingLLMClient include its cache stats."""
+        with self._lock:
+            out = [s.as_dict() for s in self.stats]
+        for row, client in zip(out, self.clients):
+            if hasattr(client, "cache_stats"):
+                row["cache"] = client.cache_stats()
+        return out
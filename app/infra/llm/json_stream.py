@@ -0,0 +1,58 @@
+# app/infra/llm/json_stream.py
+from typing import Optional
+
+class JSONObjectScanner:
+    """
+    Incremental scanner that finds the end of the first top-level JSON object
+    in a stream of text chunks.
+
+    It tracks only brace depth and string/escape state, so each character is
+    looked at once no matter how the model splits its tokens. Text before the
+    first "{" (code fences, chatter) is skipped.
+    """
+
+    __slots__ = ("_buf", "_depth", "_in_str", "_esc", "_start", "_pos", "result")
+
+    def __init__(self):
+        self._buf: list[str] = []
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._start: Optional[int] = None
+        self._pos = 0                       # absolute offset of the next char
+        self.result: Optional[str] = None   # the complete object, once found
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far (for a fallback parse if the stream ends early)."""
+        return "".join(self._buf)
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; True once the first top-level object is complete."""
+        if self.result is not None:
+            return True
+        self._buf.append(chunk)
+        for i, ch in enumerate(chunk):
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                if self._depth:
+                    self._in_str = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = self._pos + i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    end = self._pos + i + 1
+                    self.result = self.text[self._start:end]
+                    self._pos += len(chunk)
+                    return True
+        self._pos += len(chunk)
+        return False
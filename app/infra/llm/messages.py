@@ -0,0 +1,47 @@
+# app/infra/llm/messages.py
+"""
+Prompt composition shared by LLM clients and wrappers (no langchain imports).
+"""
+from typing import Dict, Any, List
+import json
+from app.infra.llm.types import ExtractOptions
+
+def _minify_schema(d: Dict[str, Any]) -> str:
+    return json.dumps(d, separators=(",", ":"))
+
+def _human_prefix(opt: ExtractOptions, schema_json: str) -> str:
+    """Everything before the user text; byte-identical across calls for one schema."""
+    parts: List[str] = []
+    if opt.guardrail:
+        parts.append(opt.guardrail.strip())
+    if opt.instructions:
+        parts.append(opt.instructions.strip())
+    if opt.examples:
+        parts.append("EXAMPLES:\n" + "\n".join(opt.examples))
+    parts.append("SCHEMA:\n" + schema_json)
+    parts.append("TEXT:\n")
+    return "\n\n".join(parts)
+
+def _repair_prefix(opt: ExtractOptions, schema_json: str) -> str:
+    """Static part of the repair message; the previous JSON and errors go last."""
+    body = []
+    if opt.guardrail:
+        body.append(opt.guardrail.strip())
+    body.append("Correct the JSON below so it conforms to the following schema (preserve correct fields):")
+    body.append(schema_json)
+    body.append("You previously returned this JSON:\n")
+    return "\n\n".join(body)
+
+def _compose_human(*, user_text: str, schema: Dict[str, Any], opt: ExtractOptions) -> str:
+    prefix = opt.prefix if opt.prefix is not None else _human_prefix(opt, _minify_schema(schema))
+    return prefix + user_text
+
+def _compose_repair(*, previous: Dict[str, Any], errors: List[str],
+                    schema: Dict[str, Any], opt: ExtractOptions) -> str:
+    prefix = opt.repair_prefix if opt.repair_prefix is not None else _repair_prefix(opt, _minify_schema(schema))
+    return (
+        prefix
+        + json.dumps(previous, separators=(",", ":"))
+        + "\n\nValidation errors:\n"
+        + "\n".join(errors)
+    )
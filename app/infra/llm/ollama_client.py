@@ -1,11 +1,12 @@
 from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage, HumanMessage
-from typing import Dict, Any, List, Optional
-import json, re
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio, json, re, time
 from app.infra.llm.types import LLMClient, ExtractOptions
-
-def _minify_schema(d: Dict[str, Any]) -> str:
-    return json.dumps(d, separators=(",", ":"))
+from app.infra.llm.pool import ClientPool, shared_pool
+from app.infra.telemetry.tracing import Telemetry
+from app.infra.llm.messages import _compose_human, _compose_repair
+from app.infra.llm.json_stream import JSONObjectScanner
 
 def _extract_first_json(text: str) -> str:
     t = text.strip()
@@ -17,48 +18,150 @@ def _extract_first_json(text: str) -> str:
         raise ValueError("No JSON object found in model output")
     return m.group(0)
 
-def _compose_human(*, user_text: str, schema: Dict[str, Any], opt: ExtractOptions) -> str:
-    parts: List[str] = []
-    if opt.guardrail:
-        parts.append(opt.guardrail.strip())
-    if opt.instructions:
-        parts.append(opt.instructions.strip())
-    if opt.examples:
-        parts.append("EXAMPLES:\n" + "\n".join(opt.examples))
-    parts.append("SCHEMA:\n" + _minify_schema(schema))
-    parts.append("TEXT:\n" + user_text)
-    return "\n\n".join(parts)
+Usage = Tuple[Optional[int], Optional[int]]   # (prompt tokens, completion tokens)
+
+def _usage(msg) -> Usage:
+    meta = getattr(msg, "usage_metadata", None) or {}
+    return meta.get("input_tokens"), meta.get("output_tokens")
 
 class OllamaClient:
     def __init__(self, default_system: Optional[str] = None,
-                 model: str = "mistral:7b", temperature: float = 0.2):
+                 model: str = "mistral:7b", temperature: float = 0.2, stream: bool = False,
+                 keep_alive: Optional[str] = None, telemetry: Optional[Telemetry] = None,
+                 pool: Optional[ClientPool] = None):
+        """
+        stream=True consumes tokens as they arrive and stops generation as soon
+        as the first top-level JSON object closes (see JSONObjectScanner).
+        keep_alive (e.g. "30m", "-1" = forever) keeps the model loaded in Ollama
+        between calls instead of its default few minutes.
+        telemetry, when given, traces every call with latency and token counts.
+        pool supplies the HTTP connections, the per-model in-flight limit and
+        the call deadline (default: the process-wide shared_pool()).
+        """
         self._default_system = default_system or ""
-        base = ChatOllama(model=model, temperature=temperature)
+        self.model = model
+        self.temperature = temperature
+        self.stream = stream
+        self.keep_alive = keep_alive
+        self.telemetry = telemetry
+        self.pool = pool or shared_pool()
+        self.limiter = self.pool.limiter(model)
+        # One ChatOllama per pool; this client's model and sampling are bound per call
+        base: ChatOllama = self.pool.chat()
+        params: Dict[str, Any] = {"model": model, "options": {"temperature": temperature}}
+        if keep_alive is not None:
+            params["keep_alive"] = keep_alive
         try:
-            self._llm_json = base.bind(format="json")  # prefer JSON mode if available
+            self._llm_json = base.bind(format="json", **params)  # prefer JSON mode if available
         except Exception:
-            self._llm_json = base
+            self._llm_json = base.bind(**params)
 
-    def structured_extract(self, *, user_text: str, schema: Dict[str, Any],
-                           options: ExtractOptions) -> Dict[str, Any]:
+    @property
+    def default_system(self) -> str:
+        return self._default_system
+
+    def _messages(self, options: ExtractOptions, human: str) -> list:
         sys = options.system or self._default_system
-        human = _compose_human(user_text=user_text, schema=schema, opt=options)
-        resp = self._llm_json.invoke([SystemMessage(content=sys), HumanMessage(content=human)])
+        return [SystemMessage(content=sys), HumanMessage(content=human)]
+
+    @staticmethod
+    def _parse(resp) -> Dict[str, Any]:
         raw = getattr(resp, "content", str(resp))
         return json.loads(_extract_first_json(raw))
 
+    @staticmethod
+    def _finish(scanner: JSONObjectScanner) -> Dict[str, Any]:
+        if scanner.result is not None:
+            return json.loads(scanner.result)
+        return json.loads(_extract_first_json(scanner.text))
+
+    @staticmethod
+    def _stream_usage(last, chunks: int) -> Usage:
+        # Ollama reports usage on the final chunk only; a stream we cut short
+        # never sees it, so count chunks (one token each) for the completion
+        prompt, completion = _usage(last)
+        return prompt, completion if completion is not None else chunks
+
+    def _invoke_json(self, messages: list, deadline: Optional[float] = None) -> Tuple[Dict[str, Any], Usage]:
+        if not self.stream:
+            resp = self._llm_json.invoke(messages)   # bounded by the pool's httpx read timeout
+            return self._parse(resp), _usage(resp)
+        scanner = JSONObjectScanner()
+        chunks = self._llm_json.stream(messages)
+        last, n = None, 0
+        try:
+            for last in chunks:
+                n += 1
+                if scanner.feed(getattr(last, "content", "") or ""):
+                    break
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"{self.model} did not finish within {self.pool.timeout_s}s")
+        finally:
+            chunks.close()  # closes the HTTP stream → Ollama stops generating
+        return self._finish(scanner), self._stream_usage(last, n)
+
+    async def _ainvoke_json(self, messages: list) -> Tuple[Dict[str, Any], Usage]:
+        if not self.stream:
+            resp = await self._llm_json.ainvoke(messages)
+            return self._parse(resp), _usage(resp)
+        scanner = JSONObjectScanner()
+        chunks = self._llm_json.astream(messages)
+        last, n = None, 0
+        try:
+            async for last in chunks:
+                n += 1
+                if scanner.feed(getattr(last, "content", "") or ""):
+                    break
+        finally:
+            await chunks.aclose()
+        return self._finish(scanner), self._stream_usage(last, n)
+
+    def _call_json(self, messages: list, op: str) -> Dict[str, Any]:
+        deadline = self.pool.deadline()
+        with self.limiter.slot(self.pool.timeout_s) as queued_s:
+            if self.telemetry is None:
+                return self._invoke_json(messages, deadline)[0]
+            with self.telemetry.span(op, "llm", model=self.model, op=op, stream=self.stream,
+                                     queued_ms=round(queued_s * 1000, 3)) as s:
+                out, (prompt, completion) = self._invoke_json(messages, deadline)
+                s.set(prompt_tokens=prompt, completion_tokens=completion)
+                return out
+
+    async def _acall_slot(self, messages: list, op: str) -> Dict[str, Any]:
+        async with self.limiter.aslot() as queued_s:
+            if self.telemetry is None:
+                return (await self._ainvoke_json(messages))[0]
+            with self.telemetry.span(op, "llm", model=self.model, op=op, stream=self.stream,
+                                     queued_ms=round(queued_s * 1000, 3)) as s:
+                out, (prompt, completion) = await self._ainvoke_json(messages)
+                s.set(prompt_tokens=prompt, completion_tokens=completion)
+                return out
+
+    async def _acall_json(self, messages: list, op: str) -> Dict[str, Any]:
+        # The deadline cancels the queue wait or the request; cancelling closes
+        # the HTTP connection, so Ollama stops generating
+        if self.pool.timeout_s is None:
+            return await self._acall_slot(messages, op)
+        return await asyncio.wait_for(self._acall_slot(messages, op), self.pool.timeout_s)
+
+    def structured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                           options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_human(user_text=user_text, schema=schema, opt=options)
+        return self._call_json(self._messages(options, human), "extract")
+
     def repair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
                          schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
-        sys = options.system or self._default_system
-        body = []
-        if options.guardrail:
-            body.append(options.guardrail.strip())
-        body.append("You previously returned this JSON:")
-        body.append(json.dumps(previous, separators=(",", ":")))
-        body.append("Validation errors:")
-        body.append("\n".join(errors))
-        body.append("Correct it so it conforms to the following schema (preserve correct fields):")
-        body.append(_minify_schema(schema))
-        resp = self._llm_json.invoke([SystemMessage(content=sys), HumanMessage(content="\n\n".join(body))])
-        raw = getattr(resp, "content", str(resp))
-        return json.loads(_extract_first_json(raw))
+        human = _compose_repair(previous=previous, errors=errors, schema=schema, opt=options)
+        return self._call_json(self._messages(options, human), "repair")
+
+    # ---- async (AsyncLLMClient) ----
+
+    async def astructured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                                  options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_human(user_text=user_text, schema=schema, opt=options)
+        return await self._acall_json(self._messages(options, human), "extract")
+
+    async def arepair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                                schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        human = _compose_repair(previous=previous, errors=errors, schema=schema, opt=options)
+        return await self._acall_json(self._messages(options, human), "repair")
@@ -0,0 +1,248 @@
+# app/infra/llm/pool.py
+"""
+Shared Ollama connection pool with per-model in-flight limits.
+
+One ChatOllama (so one httpx client per direction, with keep-alive
+connections) serves every OllamaClient built on the same pool: model and
+temperature are bound per call, not per connection. Each model gets an
+InFlightLimiter: at most `max_in_flight` requests run at once, the rest
+queue in FIFO order (up to `max_waiting`, beyond which callers get
+PoolSaturated instead of piling onto a busy server).
+
+`timeout_s` is a per-call deadline covering the queue wait and the model
+call. Async calls are cancelled at the deadline, which closes the HTTP
+request so Ollama stops generating; sync calls rely on the httpx read
+timeout (and streamed calls also check the deadline between chunks).
+
+warmup() loads models before the first real request so nobody waits for a
+cold model.
+"""
+from __future__ import annotations
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional, Sequence, Union
+import asyncio
+import threading
+import time
+
+
+class PoolSaturated(RuntimeError):
+    """Too many requests already waiting for this model."""
+
+
+@dataclass
+class LimiterStats:
+    acquired: int = 0
+    waited: int = 0           # had to queue before getting a slot
+    rejected: int = 0         # PoolSaturated
+    timed_out: int = 0        # gave up (deadline or cancellation) while queued
+    max_queue: int = 0
+
+
+class _Waiter:
+    __slots__ = ("wake", "granted")
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.granted = False
+
+
+class InFlightLimiter:
+    """A FIFO semaphore usable from threads and event loops alike."""
+
+    def __init__(self, limit: int, max_waiting: Optional[int] = None):
+        self.limit = max(1, limit)
+        self.max_waiting = max_waiting
+        self.stats = LimiterStats()
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _try_enter(self, wake: Callable[[], None]) -> Optional[_Waiter]:
+        """Call with the lock held: take a free slot (None) or join the queue."""
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            self.stats.acquired += 1
+            return None
+        if self.max_waiting is not None and len(self._waiters) >= self.max_waiting:
+            self.stats.rejected += 1
+            raise PoolSaturated(f"{len(self._waiters)} requests already waiting")
+        w = _Waiter(wake)
+        self._waiters.append(w)
+        self.stats.waited += 1
+        self.stats.max_queue = max(self.stats.max_queue, len(self._waiters))
+        return w
+
+    def _abandon(self, w: _Waiter) -> bool:
+        """A queued caller gave up. True if a slot was handed over meanwhile (the caller owns it)."""
+        with self._lock:
+            if w.granted:
+                return True
+            self._waiters.remove(w)
+            self.stats.timed_out += 1
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """Block until a slot is free; returns the seconds spent queued."""
+        t0 = time.perf_counter()
+        event = threading.Event()
+        with self._lock:
+            w = self._try_enter(event.set)
+        if w is None:
+            return 0.0
+        if not event.wait(timeout) and not self._abandon(w):
+            raise TimeoutError(f"no model slot within {timeout}s")
+        return time.perf_counter() - t0
+
+    async def aacquire(self, timeout: Optional[float] = None) -> float:
+        t0 = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(lambda: fut.done() or fut.set_result(None))
+
+        with self._lock:
+            w = self._try_enter(wake)
+        if w is None:
+            return 0.0
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except BaseException:      # deadline or cancellation
+            if self._abandon(w):
+                self.release()
+            raise
+        return time.perf_counter() - t0
+
+    def release(self) -> None:
+        """Hand the slot straight to the longest waiter (no stampede), else free it."""
+        with self._lock:
+            if not self._waiters:
+                self._active -= 1
+                return
+            w = self._waiters.popleft()
+            w.granted = True
+            self.stats.acquired += 1
+        w.wake()
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[float]:
+        waited = self.acquire(timeout)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        waited = await self.aacquire(timeout)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+
+class ClientPool:
+    def __init__(self, *, max_in_flight: int = 4, max_waiting: Optional[int] = None,
+                 timeout_s: Optional[float] = None, base_url: Optional[str] = None,
+                 max_keepalive: int = 16, keepalive_expiry_s: float = 120.0):
+        """
+        Args:
+            max_in_flight: concurrent requests per model (Ollama's OLLAMA_NUM_PARALLEL is a good match)
+            max_waiting: queued requests per model before PoolSaturated (None = unbounded)
+            timeout_s: per-call deadline, queue wait included (None = wait forever)
+            base_url: Ollama server (default: OLLAMA_HOST or localhost)
+            max_keepalive: idle HTTP connections kept open for reuse
+            keepalive_expiry_s: how long an idle connection is kept
+        """
+        self.max_in_flight = max_in_flight
+        self.max_waiting = max_waiting
+        self.timeout_s = timeout_s
+        self.base_url = base_url
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry_s = keepalive_expiry_s
+        self._chat = None
+        self._limiters: Dict[str, InFlightLimiter] = {}
+        self._lock = threading.Lock()
+
+    def chat(self):
+        """The shared ChatOllama; bind model/format/options per client."""
+        with self._lock:
+            if self._chat is None:
+                import httpx
+                from langchain_ollama import ChatOllama
+
+                timeout = httpx.Timeout(self.timeout_s, connect=min(self.timeout_s or 10.0, 10.0))
+                limits = httpx.Limits(max_keepalive_connections=self.max_keepalive,
+                                      keepalive_expiry=self.keepalive_expiry_s)
+                self._chat = ChatOllama(model="", base_url=self.base_url,
+                                        client_kwargs={"timeout": timeout, "limits": limits})
+            return self._chat
+
+    def limiter(self, model: str) -> InFlightLimiter:
+        with self._lock:
+            lim = self._limiters.get(model)
+            if lim is None:
+                lim = self._limiters[model] = InFlightLimiter(self.max_in_flight, self.max_waiting)
+            return lim
+
+    def deadline(self) -> Optional[float]:
+        return time.monotonic() + self.timeout_s if self.timeout_s is not None else None
+
+    # ---- warmup ----
+
+    def warmup(self, models: Sequence[str], keep_alive: Optional[Union[str, float]] = None) -> Dict[str, Any]:
+        """
+        Load each model into Ollama (an empty generate request) and keep it
+        resident for keep_alive. Returns {model: seconds taken or "error: ..."}.
+        """
+        # ChatOllama has no load call; its underlying ollama.Client does
+        client = self.chat()._client
+        out: Dict[str, Any] = {}
+        for model in models:
+            t0 = time.perf_counter()
+            try:
+                client.generate(model=model, keep_alive=keep_alive)
+                out[model] = round(time.perf_counter() - t0, 3)
+            except Exception as e:
+                out[model] = f"error: {type(e).__name__}: {e}"[:300]
+        return out
+
+    async def awarmup(self, models: Sequence[str], keep_alive: Optional[Union[str, float]] = None) -> Dict[str, Any]:
+        client = self.chat()._async_client
+        out: Dict[str, Any] = {}
+        for model in models:
+            t0 = time.perf_counter()
+            try:
+                await client.generate(model=model, keep_alive=keep_alive)
+                out[model] = round(time.perf_counter() - t0, 3)
+            except Exception as e:
+                out[model] = f"error: {type(e).__name__}: {e}"[:300]
+        return out
+
+    def pool_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {model: {**asdict(lim.stats), "in_flight": lim.in_flight, "queued": lim.queued}
+                for model, lim in limiters.items()}
+
+
+_shared: Optional[ClientPool] = None
+_shared_lock = threading.Lock()
+
+def shared_pool() -> ClientPool:
+    """The process-wide default pool (used when a client isn't given one)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ClientPool()
+        return _shared
@@ -1,13 +1,19 @@
 # app/infra/llm/types.py
 from dataclasses import dataclass
-from typing import Optional, List, Protocol, runtime_checkable, Dict, Any
+from typing import Optional, List, Protocol, runtime_checkable, Dict, Any, Sequence
 
 @dataclass(frozen=True, slots=True)
 class ExtractOptions:
     system: Optional[str] = None        # workflow/system prompt (optional override)
     instructions: str = ""              # task prompt (e.g., "extract meeting fields…")
     guardrail: str = ""                 # shared JSON-only fragment
-    examples: Optional[List[str]] = None  # optional few-shot JSON strings
+    examples: Optional[Sequence[str]] = None  # optional few-shot JSON strings
+    # Filled by app.prompts.loader.compile_options at graph-build time:
+    prefix: Optional[str] = None        # static extract message; user text is appended
+    repair_prefix: Optional[str] = None # static repair message; previous JSON + errors appended
+    schema_json: Optional[str] = None   # minified schema the prefixes were built from
+    digest: Optional[str] = None        # sha256 of system + prefixes (diagnostics)
+    prefix_bytes: int = 0               # size of system + extract prefix in bytes
 
 @runtime_checkable
 class LLMClient(Protocol):
@@ -15,3 +21,11 @@ class LLMClient(Protocol):
                            options: ExtractOptions) -> Dict[str, Any]: ...
     def repair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
                          schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]: ...
+
+@runtime_checkable
+class AsyncLLMClient(Protocol):
+    """Async twin of LLMClient; lets one event loop multiplex many sessions."""
+    async def astructured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                                  options: ExtractOptions) -> Dict[str, Any]: ...
+    async def arepair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                                schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]: ...
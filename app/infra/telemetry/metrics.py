@@ -0,0 +1,115 @@
+# app/infra/telemetry/metrics.py
+"""
+Minimal in-process metrics: labelled counters and histograms, rendered in
+the Prometheus text exposition format (version 0.0.4).
+
+No client library: the workflow records a handful of series, and a dict
+keyed on label values behind one lock is all that needs.
+"""
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+import threading
+
+# Seconds; spans sub-millisecond rule-based nodes up to slow model calls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[str, ...]
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _fmt_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+def _num(v: float) -> str:
+    return repr(float(v)) if v != int(v) else str(int(v))
+
+class Counter:
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = ()):
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *values: str, by: float = 1.0) -> None:
+        with self._lock:
+            self._values[values] = self._values.get(values, 0.0) + by
+
+    def value(self, *values: str) -> float:
+        return self._values.get(values, 0.0)
+
+    def render(self) -> List[str]:
+        out = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for values, v in sorted(self._values.items()):
+                out.append(f"{self.name}{_fmt_labels(self.labels, values)} {_num(v)}")
+        return out
+
+class Histogram:
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values → [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *values: str) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            s = self._series.get(values)
+            if s is None:
+                s = self._series[values] = [0] * (len(self.buckets) + 1) + [0.0]
+            s[i] += 1
+            s[-1] += value
+
+    def count(self, *values: str) -> int:
+        s = self._series.get(values)
+        return int(sum(s[:-1])) if s else 0
+
+    def render(self) -> List[str]:
+        out = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for values, s in sorted(self._series.items()):
+                cum = 0
+                for bound, n in zip(self.buckets, s):
+                    cum += n
+                    le = _fmt_labels(self.labels, values, 'le="%s"' % bound)
+                    out.append(f"{self.name}_bucket{le} {cum}")
+                cum += s[len(self.buckets)]
+                le = _fmt_labels(self.labels, values, 'le="+Inf"')
+                out.append(f"{self.name}_bucket{le} {cum}")
+                out.append(f"{self.name}_sum{_fmt_labels(self.labels, values)} {s[-1]!r}")
+                out.append(f"{self.name}_count{_fmt_labels(self.labels, values)} {cum}")
+        return out
+
+class Registry:
+    """Named metrics, created on first use and rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, doc: str, labels: Sequence[str], **kw):
+        with self._lock:
+            m = self._metrics.get(name)
+            if m is None:
+                m = self._metrics[name] = cls(name, doc, labels, **kw)
+            return m
+
+    def counter(self, name: str, doc: str, labels: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, doc, labels)
+
+    def histogram(self, name: str, doc: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, doc, labels, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text snapshot of every metric."""
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,179 @@
+# app/infra/telemetry/tracing.py
+"""
+Spans and workflow metrics for the schedule graph and the LLM client.
+
+A Telemetry object is opt-in: build_graph(..., telemetry=t) wraps every node
+and the compiled graph, and OllamaClient(..., telemetry=t) wraps model calls.
+Without one nothing is wrapped, so a disabled build runs exactly the code it
+ran before.
+
+Each graph invocation is a trace; every node and model call inside it is a
+span whose parent comes from a context variable, so nesting works in threads
+(LangGraph copies the context) and across awaits. Finished spans are logged
+as one JSON object per line on the "scheduler.trace" logger and feed these
+metrics (Registry.render() gives the Prometheus snapshot):
+
+  schedule_graph_seconds{outcome}                  histogram
+  schedule_node_seconds{node}                      histogram
+  schedule_node_calls_total{node, outcome}         ok | invalid | error
+  llm_request_seconds{model, op}                   histogram
+  llm_requests_total{model, op, outcome}
+  llm_prompt_tokens_total{model}, llm_completion_tokens_total{model}
+
+Repair and clarify frequency are schedule_node_calls_total{node="repair"},
+{node="clarify"} (a question was asked) and {node="answer"} (a clarify round
+resumed with the user's answer).
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+import json
+import logging
+import os
+import time
+
+from langchain_core.runnables import RunnableLambda
+
+from app.infra.telemetry.metrics import Registry
+
+log = logging.getLogger("scheduler.trace")
+
+_current: ContextVar[Optional["Span"]] = ContextVar("scheduler_span", default=None)
+
+def _new_id() -> str:
+    return os.urandom(8).hex()
+
+@dataclass
+class Span:
+    name: str
+    kind: str                       # graph | node | llm
+    trace_id: str
+    span_id: str = field(default_factory=_new_id)
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    outcome: str = "ok"
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+def _patch_outcome(patch: Any) -> str:
+    """A node patch carrying errors means the draft didn't validate."""
+    return "invalid" if isinstance(patch, dict) and patch.get("errors") else "ok"
+
+class Telemetry:
+    def __init__(self, registry: Optional[Registry] = None, *, log_spans: bool = True):
+        self.registry = registry or Registry()
+        self.log_spans = log_spans
+        r = self.registry
+        self.graph_seconds = r.histogram("schedule_graph_seconds", "Wall time of one graph invocation", ["outcome"])
+        self.node_seconds = r.histogram("schedule_node_seconds", "Wall time per node call", ["node"])
+        self.node_calls = r.counter("schedule_node_calls_total", "Node calls by outcome", ["node", "outcome"])
+        self.llm_seconds = r.histogram("llm_request_seconds", "Model call latency", ["model", "op"])
+        self.llm_calls = r.counter("llm_requests_total", "Model calls by outcome", ["model", "op", "outcome"])
+        self.prompt_tokens = r.counter("llm_prompt_tokens_total", "Prompt tokens sent", ["model"])
+        self.completion_tokens = r.counter("llm_completion_tokens_total", "Completion tokens received", ["model"])
+
+    # ---- spans ----
+
+    @contextmanager
+    def span(self, name: str, kind: str, **attrs: Any) -> Iterator[Span]:
+        parent = _current.get()
+        s = Span(name=name, kind=kind, trace_id=parent.trace_id if parent else _new_id(),
+                 parent_id=parent.span_id if parent else None, attrs=attrs)
+        token = _current.set(s)
+        t0 = time.perf_counter()
+        try:
+            yield s
+        except BaseException as e:
+            s.outcome = "error"
+            s.set(error=f"{type(e).__name__}: {e}"[:300])
+            raise
+        finally:
+            _current.reset(token)
+            self._finish(s, time.perf_counter() - t0)
+
+    def _finish(self, s: Span, seconds: float) -> None:
+        if s.kind == "node":
+            self.node_seconds.observe(seconds, s.name)
+            self.node_calls.inc(s.name, s.outcome)
+        elif s.kind == "llm":
+            model, op = s.attrs.get("model", ""), s.attrs.get("op", s.name)
+            self.llm_seconds.observe(seconds, model, op)
+            self.llm_calls.inc(model, op, s.outcome)
+            if s.attrs.get("prompt_tokens"):
+                self.prompt_tokens.inc(model, by=s.attrs["prompt_tokens"])
+            if s.attrs.get("completion_tokens"):
+                self.completion_tokens.inc(model, by=s.attrs["completion_tokens"])
+        elif s.kind == "graph":
+            self.graph_seconds.observe(seconds, s.outcome)
+        if self.log_spans and log.isEnabledFor(logging.INFO):
+            log.info(json.dumps({
+                "trace": s.trace_id, "span": s.span_id, "parent": s.parent_id,
+                "kind": s.kind, "name": s.name, "start": round(s.start, 6),
+                "ms": round(seconds * 1000, 3), "outcome": s.outcome, **s.attrs,
+            }, default=str, ensure_ascii=False))
+
+    # ---- wrappers ----
+
+    def wrap_node(self, node, name: str):
+        """
+        Time and count a graph node. Sync-only nodes stay plain functions
+        (LangGraph's own wrapper is lighter than a RunnableLambda); nodes with
+        an async twin (node.acall) keep it.
+        """
+        def call(state):
+            with self.span(name, "node") as s:
+                patch = node(state)
+                s.outcome = _patch_outcome(patch)
+                return patch
+
+        acall = getattr(node, "acall", None)
+        if acall is None:
+            return call
+
+        async def acall_traced(state):
+            with self.span(name, "node") as s:
+                patch = await acall(state)
+                s.outcome = _patch_outcome(patch)
+                return patch
+
+        return RunnableLambda(call, afunc=acall_traced, name=name)
+
+    def wrap_graph(self, graph) -> "TracedGraph":
+        return TracedGraph(graph, self)
+
+    def snapshot(self) -> str:
+        """Prometheus text exposition of everything recorded so far."""
+        return self.registry.render()
+
+class TracedGraph:
+    """A compiled graph whose invoke/ainvoke each open a root "graph" span."""
+
+    def __init__(self, graph, telemetry: Telemetry):
+        self._graph = graph
+        self._telemetry = telemetry
+
+    def __getattr__(self, name: str):
+        return getattr(self._graph, name)
+
+    @staticmethod
+    def _describe(s: Span, result: Dict[str, Any]) -> None:
+        s.set(fast_path=bool(result.get("fast_path")), attempts=result.get("attempts"),
+              clarify=bool(result.get("clarify")), conflict=bool(result.get("conflict")))
+        if not result.get("meeting"):
+            s.outcome = "clarify" if result.get("clarify") else "invalid"
+
+    def invoke(self, state, config=None, **kw):
+        with self._telemetry.span("schedule", "graph", resumed=bool(state.get("answer"))) as s:
+            result = self._graph.invoke(state, config, **kw)
+            self._describe(s, result)
+            return result
+
+    async def ainvoke(self, state, config=None, **kw):
+        with self._telemetry.span("schedule", "graph", resumed=bool(state.get("answer"))) as s:
+            result = await self._graph.ainvoke(state, config, **kw)
+            self._describe(s, result)
+            return result
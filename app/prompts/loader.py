@@ -1,5 +1,13 @@
 # app/prompts/loader.py
+from dataclasses import replace
 from pathlib import Path
+from typing import Any, Dict
+import hashlib
+import json
+
+from app.infra.llm.types import ExtractOptions
+from app.infra.llm.messages import _human_prefix, _repair_prefix
+
 PROMPTS_DIR = Path(__file__).parent
 
 def workflows() -> list[str]:
@@ -14,3 +22,47 @@ def load_prompt(workflow: str, name: str) -> str:
 
 def load_fragment(name: str) -> str:
     return (PROMPTS_DIR / "_fragments" / f"{name}.md").read_text(encoding="utf-8")
+
+def _read_or(read, *args, default: str) -> str:
+    try:
+        return read(*args)
+    except FileNotFoundError:
+        return default
+
+def load_options(workflow: str = "schedule") -> ExtractOptions:
+    """Read a workflow's system/extract prompts + the JSON-only guardrail (independent of cwd)."""
+    return ExtractOptions(
+        system=_read_or(load_prompt, workflow, "system",
+                        default="You are a precise extraction assistant for scheduling."),
+        instructions=_read_or(load_prompt, workflow, "extract",
+                              default="Extract meeting fields per the provided JSON Schema."),
+        guardrail=_read_or(load_fragment, "json_only",
+                           default="Return ONLY a single JSON object that matches the schema; no extra keys."),
+    )
+
+def compile_options(options: ExtractOptions, schema: Dict[str, Any]) -> ExtractOptions:
+    """
+    Freeze options into a build-time artifact: the schema is serialized once
+    (sorted keys, so the bytes don't depend on dict order) and the static
+    system + guardrail + instructions + schema prefix is rendered once. Each
+    call then only appends the user text, keeping the prompt prefix identical
+    so Ollama can reuse its KV cache.
+    """
+    schema_json = json.dumps(schema, separators=(",", ":"), sort_keys=True)
+    base = replace(options, examples=tuple(options.examples) if options.examples else None)
+    prefix = _human_prefix(base, schema_json)
+    repair_prefix = _repair_prefix(base, schema_json)
+    system = options.system or ""
+    digest = hashlib.sha256("\x00".join((system, prefix, repair_prefix)).encode("utf-8")).hexdigest()
+    return replace(
+        base,
+        prefix=prefix,
+        repair_prefix=repair_prefix,
+        schema_json=schema_json,
+        digest=digest,
+        prefix_bytes=len(system.encode("utf-8")) + len(prefix.encode("utf-8")),
+    )
+
+def prompt_info(options: ExtractOptions) -> Dict[str, Any]:
+    """Hash and size of a compiled artifact, for logs/diagnostics."""
+    return {"digest": options.digest, "prefix_bytes": options.prefix_bytes}
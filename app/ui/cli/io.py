@@ -1,6 +1,7 @@
 # app/ui/cli/io.py
+import asyncio
 from typing import Iterable
-from app.application.ports import IO
+from app.application.ports import IO, AsyncIO
 from app.ui.cli.presenter import meeting_summary_lines, print_events
 
 class CLIIO(IO):
@@ -30,4 +31,29 @@ class CLIIO(IO):
         dur_str = f"{dur} min" if dur is not None else "—"
         print(f"  Title:    {title}")
         print(f"  When:     {when}  ({dur_str})")
-        print(f"  Location: {loc}")
\ No newline at end of file
+        print(f"  Location: {loc}")
+        if summary.get("recurrence"):
+            print(f"  Repeats:  {summary['recurrence']}")
+
+class AsyncCLIIO(AsyncIO):
+    """CLIIO for the async runner; blocking input() runs in a worker thread."""
+    def __init__(self):
+        self._io = CLIIO()
+
+    async def ask(self, prompt: str) -> str:
+        return await asyncio.to_thread(self._io.ask, prompt)
+
+    async def info(self, msg: str) -> None:
+        self._io.info(msg)
+
+    async def warn(self, msg: str) -> None:
+        self._io.warn(msg)
+
+    async def confirm(self, prompt: str) -> bool:
+        return await asyncio.to_thread(self._io.confirm, prompt)
+
+    async def list_events(self, events: Iterable, tz: str) -> None:
+        self._io.list_events(events, tz)
+
+    async def review_summary(self, summary: dict) -> None:
+        self._io.review_summary(summary)
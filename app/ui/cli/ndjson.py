@@ -0,0 +1,32 @@
+# app/ui/cli/ndjson.py
+import json
+from typing import IO as TextIO, Any, Dict, Iterator
+
+def read_requests(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily read batch requests, one JSON value per line:
+      {"text": "...", "id": "..."}   or just   "Lunch with Sarah tomorrow 1pm"
+    Blank lines are skipped; items without an id get their line number.
+    A line that is not one of those (bad JSON, null, a number, ...) becomes
+    {"id": <line number>, "error": "..."} so the rest of the batch still runs.
+    """
+    for lineno, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"id": lineno, "error": f"line {lineno}: invalid JSON: {e.msg} (column {e.colno})"}
+            continue
+        if isinstance(obj, str):
+            obj = {"text": obj}
+        elif not isinstance(obj, dict):
+            yield {"id": lineno, "error": f"line {lineno}: expected an object or a string, got {'null' if obj is None else type(obj).__name__}"}
+            continue
+        obj.setdefault("id", lineno)
+        yield obj
+
+def write_result(stream: TextIO, result: Dict[str, Any]) -> None:
+    stream.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+    stream.flush()
@@ -21,4 +21,5 @@ def print_events(events: Iterable, tz: str) -> None:
     for e in evs:
         s = e.starts_at.astimezone(tzinfo).isoformat()
         en = e.ends_at.astimezone(tzinfo).isoformat()
-        print(f"- #{e.id} {e.title} @ {s} – {en} ({e.location or 'no location'})")
+        repeats = f" [repeats {e.recurrence}]" if getattr(e, "recurrence", None) else ""
+        print(f"- #{e.id} {e.title} @ {s} – {en} ({e.location or 'no location'}){repeats}")
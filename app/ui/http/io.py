@@ -0,0 +1,77 @@
+# app/ui/http/io.py
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+from app.application.ports import AsyncIO
+
+# Events listed per response; the rest are counted, not sent
+MAX_EVENTS = 200
+
+def event_json(e) -> Dict[str, Any]:
+    return {
+        "id": e.id,
+        "title": e.title,
+        "starts_at": e.starts_at.isoformat(),
+        "ends_at": e.ends_at.isoformat(),
+        "location": e.location,
+        "recurrence": getattr(e, "recurrence", None),
+    }
+
+class SessionIO(AsyncIO):
+    """
+    AsyncIO for one API session. Output is buffered as messages for the next
+    response; ask/confirm park the runner until the client replies, turning
+    every question into an HTTP round-trip.
+    """
+
+    def __init__(self):
+        self.messages: List[Dict[str, Any]] = []
+        self.prompt: Optional[Dict[str, Any]] = None   # pending question, if any
+        self._answer: Optional[asyncio.Future] = None
+        self.waiting = asyncio.Event()                 # set while a question is pending
+
+    def drain(self) -> List[Dict[str, Any]]:
+        out, self.messages = self.messages, []
+        return out
+
+    def reply(self, answer: str) -> bool:
+        """Deliver the client's answer; False if nothing was asked."""
+        if self._answer is None or self._answer.done():
+            return False
+        self.prompt = None
+        self.waiting.clear()
+        self._answer.set_result(answer)
+        return True
+
+    async def _wait_for_answer(self, kind: str, prompt: str) -> str:
+        self._answer = asyncio.get_running_loop().create_future()
+        self.prompt = {"kind": kind, "prompt": prompt}
+        self.waiting.set()
+        try:
+            return (await self._answer).strip()
+        finally:
+            self._answer = None
+
+    async def ask(self, prompt: str) -> str:
+        return await self._wait_for_answer("ask", prompt)
+
+    async def info(self, msg: str) -> None:
+        self.messages.append({"kind": "info", "text": msg})
+
+    async def warn(self, msg: str) -> None:
+        self.messages.append({"kind": "warn", "text": msg})
+
+    async def confirm(self, prompt: str) -> bool:
+        ans = await self._wait_for_answer("confirm", prompt)
+        return ans.lower() in {"y", "yes", "true"}
+
+    async def list_events(self, events: Iterable, tz: str) -> None:
+        shown: List[Dict[str, Any]] = []
+        total = 0
+        for e in events:
+            total += 1
+            if len(shown) < MAX_EVENTS:
+                shown.append(event_json(e))
+        self.messages.append({"kind": "events", "tz": tz, "events": shown, "total": total})
+
+    async def review_summary(self, summary: dict) -> None:
+        self.messages.append({"kind": "review", "summary": summary})
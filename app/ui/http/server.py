@@ -0,0 +1,258 @@
+# app/ui/http/server.py
+"""
+Long-lived scheduling service: a small asyncio HTTP/1.1 JSON API.
+
+The graph, LLM client, prompts and calendar are built once at startup and
+shared by every session, so a request only pays for its own work.
+
+    POST   /sessions               {"text": ..., "owner"?: ..., "tz"?: ...}
+    POST   /sessions/{id}/reply    {"answer": ...}
+    DELETE /sessions/{id}
+    GET    /events?owner=...
+    GET    /health
+    GET    /metrics                Prometheus text (when telemetry is enabled)
+
+Each session is an AsyncSchedulerRunner talking to a SessionIO. A session
+call returns as soon as the runner either needs input or finishes:
+
+    {"session": id, "status": "ask" | "confirm" | "done",
+     "prompt": ..., "messages": [...], "result": {...}}
+
+A clarify question or "Book this?" is answered with /reply. Sessions idle for
+longer than session_ttl_s are cancelled, which also releases their slot hold.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from app.application.async_runner import AsyncSchedulerRunner
+from app.application.ports import Calendar
+from app.domain.models import DEFAULT_OWNER
+from app.ui.http.io import MAX_EVENTS, SessionIO, event_json
+
+if TYPE_CHECKING:
+    from app.infra.telemetry.tracing import Telemetry
+
+_MAX_BODY = 64 * 1024
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+            500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+@dataclass
+class Session:
+    id: str
+    io: SessionIO
+    task: asyncio.Task
+    owner: str
+    seen: float = field(default_factory=time.monotonic)
+
+def result_json(result: Dict[str, Any]) -> Dict[str, Any]:
+    """The JSON-safe part of a final graph state."""
+    meeting = result.get("meeting")
+    return {
+        "meeting": meeting.model_dump(mode="json") if meeting else None,
+        "conflict": result.get("conflict"),
+        "clarify": result.get("clarify"),
+        "errors": [str(e)[:500] for e in result.get("errors") or []],
+    }
+
+class SchedulingServer:
+    def __init__(self, graph, calendar: Calendar, tz: str = "America/Chicago", *,
+                 owner: str = DEFAULT_OWNER, session_ttl_s: float = 600.0,
+                 telemetry: Optional[Telemetry] = None):
+        """
+        Args:
+            graph: compiled LangGraph (must expose .ainvoke); shared by all sessions
+            calendar: Calendar port
+            tz: default IANA timezone for sessions that don't name one
+            owner: default calendar owner for sessions that don't name one
+            session_ttl_s: idle time after which a session is cancelled
+            telemetry: served as a Prometheus snapshot at /metrics
+        """
+        self.graph = graph
+        self.calendar = calendar
+        self.tz = tz
+        self.owner = owner
+        self.session_ttl_s = session_ttl_s
+        self.telemetry = telemetry
+        self.sessions: Dict[str, Session] = {}
+
+    # ---- sessions ----
+
+    async def _turn(self, s: Session) -> Dict[str, Any]:
+        """Wait until the runner asks something or finishes; report what happened."""
+        waiting = asyncio.ensure_future(s.io.waiting.wait())
+        try:
+            await asyncio.wait({s.task, waiting}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiting.cancel()
+        s.seen = time.monotonic()
+        out: Dict[str, Any] = {"session": s.id, "owner": s.owner}
+        if s.task.done():
+            self.sessions.pop(s.id, None)
+            out["status"] = "done"
+            out["messages"] = s.io.drain()
+            if s.task.cancelled():
+                out["status"] = "cancelled"
+            elif s.task.exception() is not None:
+                e = s.task.exception()
+                out["status"] = "error"
+                out["errors"] = [f"{type(e).__name__}: {e}"]
+            else:
+                out["result"] = result_json(s.task.result())
+            return out
+        out["status"] = s.io.prompt["kind"]
+        out["prompt"] = s.io.prompt["prompt"]
+        out["messages"] = s.io.drain()
+        return out
+
+    async def start(self, text: str, *, owner: Optional[str] = None, tz: Optional[str] = None) -> Dict[str, Any]:
+        io = SessionIO()
+        owner = owner or self.owner
+        runner = AsyncSchedulerRunner(graph=self.graph, io=io, calendar=self.calendar,
+                                      tz=tz or self.tz, owner=owner)
+        s = Session(id=uuid.uuid4().hex, io=io, task=asyncio.create_task(runner.schedule(text)), owner=owner)
+        self.sessions[s.id] = s
+        return await self._turn(s)
+
+    async def reply(self, session_id: str, answer: str) -> Dict[str, Any]:
+        s = self._get(session_id)
+        if not s.io.reply(answer):
+            raise HTTPError(409, "Session is not waiting for an answer")
+        return await self._turn(s)
+
+    async def cancel(self, session_id: str) -> Dict[str, Any]:
+        s = self._get(session_id)
+        s.task.cancel()
+        return await self._turn(s)
+
+    def _get(self, session_id: str) -> Session:
+        s = self.sessions.get(session_id)
+        if s is None:
+            raise HTTPError(404, f"Unknown session {session_id}")
+        return s
+
+    async def reap(self, every_s: float = 30.0) -> None:
+        """Cancel sessions nobody has answered for session_ttl_s (runs forever)."""
+        while True:
+            await asyncio.sleep(every_s)
+            cutoff = time.monotonic() - self.session_ttl_s
+            for s in [s for s in self.sessions.values() if s.seen < cutoff]:
+                self.sessions.pop(s.id, None)
+                s.task.cancel()
+
+    # ---- HTTP ----
+
+    async def route(self, method: str, target: str, body: Any) -> Tuple[int, Union[Dict[str, Any], str]]:
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        if parts == ["health"] and method == "GET":
+            return 200, {"status": "ok", "sessions": len(self.sessions)}
+        if parts == ["metrics"] and method == "GET" and self.telemetry is not None:
+            return 200, self.telemetry.snapshot()
+        if parts == ["events"] and method == "GET":
+            owner = parse_qs(url.query).get("owner", [self.owner])[0]
+            events = [event_json(e) for _, e in zip(range(MAX_EVENTS), self.calendar.list_all(owner=owner))]
+            return 200, {"owner": owner, "events": events}
+        if parts == ["sessions"] and method == "POST":
+            text = body.get("text") if isinstance(body, dict) else None
+            if not isinstance(text, str) or not text.strip():
+                raise HTTPError(400, 'Body must be a JSON object with a non-empty "text"')
+            return 201, await self.start(text, owner=body.get("owner"), tz=body.get("tz"))
+        if len(parts) == 3 and parts[0] == "sessions" and parts[2] == "reply" and method == "POST":
+            answer = body.get("answer") if isinstance(body, dict) else None
+            if not isinstance(answer, str):
+                raise HTTPError(400, 'Body must be a JSON object with a string "answer"')
+            return 200, await self.reply(parts[1], answer)
+        if len(parts) == 2 and parts[0] == "sessions" and method == "DELETE":
+            return 200, await self.cancel(parts[1])
+        if parts and parts[0] in {"health", "events", "sessions"}:
+            raise HTTPError(405, f"{method} not allowed on {url.path}")
+        raise HTTPError(404, f"No route for {url.path}")
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+        headers: Dict[str, str] = {}
+        while True:
+            h = await reader.readline()
+            if h in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = h.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > _MAX_BODY:
+            raise HTTPError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, payload: Union[Dict[str, Any], str],
+                     keep_alive: bool) -> None:
+        if isinstance(payload, str):
+            data, ctype = payload.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            ctype = "application/json; charset=utf-8"
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {ctype}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """One connection; HTTP/1.1 keep-alive, requests served in order."""
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    req = await self._read_request(reader)
+                    if req is None:
+                        return
+                    method, target, headers, raw = req
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    try:
+                        body = json.loads(raw) if raw else {}
+                    except json.JSONDecodeError as e:
+                        raise HTTPError(400, f"Invalid JSON: {e}")
+                    status, payload = await self.route(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._write(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        reaper = asyncio.create_task(self.reap())
+        addrs = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Scheduling service listening on {addrs}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            reaper.cancel()
@@ -1,24 +1,45 @@
 # app/workflows/schedule/graph.py
 from __future__ import annotations
 from functools import partial
-from typing import List
+from typing import List, Optional
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
 
 from .state import ScheduleState
-from .nodes.extract import ExtractNode          # unchanged
+from .nodes.fastpath import FastPathNode, route_after_fast_path
+from .nodes.extract import ExtractNode, Speculation
 from .nodes.validate import validate_node       # unchanged
 from .nodes.repair import RepairNode            # unchanged
+from .nodes.local_repair import local_repair_node, parse_errors
 from .nodes.clarify import clarify_node         # unchanged
-from .nodes.conflict import conflict_node       # unchanged
+from .nodes.answer import ClarifyAnswerNode, route_from_start, route_after_answer
+from .nodes.conflict import ConflictNode
 from .nodes.review import ReviewNode            # <-- NEW import
+from .nodes.escalate import EscalateNode, TierFeedback
 
+from app.application.ports import Calendar
+from app.contracts.extraction import MeetingRequest
+from app.prompts.loader import compile_options
 from app.infra.llm.types import LLMClient, ExtractOptions
+from app.infra.telemetry.tracing import Telemetry
 
 
 # ---------- Routing helpers (unchanged except for target name) ----------
 
+# pydantic v2 error types an LLM can fix by reshaping its JSON. Date/time
+# parse failures (value_error) and non-positive durations are semantic and
+# go to clarify instead.
+_STRUCTURAL_TYPES = {
+    "missing", "extra_forbidden", "int_parsing", "int_type", "int_from_float",
+    "string_type", "string_too_short", "list_type", "dict_type", "model_type",
+    "model_attributes_type", "literal_error",
+}
+
 def _is_fixable(errors: List[str]) -> bool:
+    parsed = parse_errors(errors)
+    if parsed:
+        return all(e.get("type") in _STRUCTURAL_TYPES for e in parsed)
     blob = " ".join(errors).lower()
     structural = any(k in blob for k in [
         "extra fields", "field required", "type_error", "value is not a valid"
@@ -28,13 +49,31 @@ def _is_fixable(errors: List[str]) -> bool:
     ])
     return structural and not semantic
 
+def _can_escalate(state: ScheduleState) -> bool:
+    """The draft came from a cascade tier with a bigger model above it."""
+    tier = state.get("tier")
+    return tier is not None and tier < (state.get("top_tier") or 0)
+
+def _route_llm_repair(state: ScheduleState) -> str:
+    if state["errors"] and _is_fixable(state["errors"]):
+        # A small model's malformed JSON goes to the next tier, not back to itself
+        if _can_escalate(state):
+            return "escalate"
+        if state["attempts"] < 2:
+            return "repair"
+    return "clarify"
+
 def route_after_validate(state: ScheduleState) -> str:
     # If we have a normalized Meeting, go to REVIEW first (not straight to conflict)
     if state["meeting"] is not None:
         return "review"
-    if state["errors"] and _is_fixable(state["errors"]) and state["attempts"] < 2:
-        return "repair"
-    return "clarify"
+    # Deterministic fixes first, unless this draft already came out of them
+    if state["errors"] and not state.get("local_fixed"):
+        return "local_repair"
+    return _route_llm_repair(state)
+
+def route_after_local_repair(state: ScheduleState) -> str:
+    return "validate" if state.get("local_fixed") else _route_llm_repair(state)
 
 def route_after_conflict(state: ScheduleState) -> str:
     return "end" if state["conflict"] else "end"  # we still END after conflict; booking happens outside
@@ -42,34 +81,90 @@ def route_after_conflict(state: ScheduleState) -> str:
 
 # ---------- Graph assembly ----------
 
-def build_graph(llm: LLMClient, options: ExtractOptions):
+def _dual(node, name: str) -> RunnableLambda:
+    """Expose a node's sync __call__ and async acall so both invoke and ainvoke work."""
+    return RunnableLambda(node, afunc=node.acall, name=name)
+
+def build_graph(llm: LLMClient, options: ExtractOptions, calendar: Calendar,
+                fast_path: Optional[FastPathNode] = None, checkpointer=None,
+                telemetry: Optional[Telemetry] = None, speculation: Optional[Speculation] = None):
+    """
+    Conflict checks and holds go to `calendar` (the same port the runner
+    commits to). Pass your own FastPathNode to read its hit-rate/latency stats afterwards.
+    With a checkpointer (e.g. InMemorySaver) callers must pass a thread_id and
+    can resume a clarify round by invoking with just {"answer": ...}.
+    With telemetry every node call and graph invocation is traced and timed.
+    With speculation, extract races several model requests (see Speculation).
+    With a CascadingLLMClient, drafts carry their tier and fixable failures
+    below the top tier are re-extracted one tier up ("escalate").
+    """
     g = StateGraph(ScheduleState)
+    fast_path = fast_path or FastPathNode()
 
-    # Nodes
-    g.add_node("extract", ExtractNode(llm, options))
-    g.add_node("validate", validate_node)
-    g.add_node("repair",  RepairNode(llm, options))
-    g.add_node("clarify", clarify_node)
-    g.add_node("review",  ReviewNode())
-    g.add_node("conflict", conflict_node)
+    def add_node(name: str, node) -> None:
+        if telemetry is not None:
+            node = telemetry.wrap_node(node, name)
+        elif hasattr(node, "acall"):
+            node = _dual(node, name)
+        g.add_node(name, node)
 
-    # Entrypoint
-    g.add_edge(START, "extract")
+    # Prompts and schema are rendered once here, not per LLM call
+    if options.prefix is None:
+        options = compile_options(options, MeetingRequest.model_json_schema())
+
+    # Nodes
+    add_node("fast_path", fast_path)
+    add_node("extract", ExtractNode(llm, options, on_latency=fast_path.record_llm, speculation=speculation))
+    tiered = hasattr(llm, "extract_at")
+    add_node("validate", TierFeedback(validate_node, llm) if tiered else validate_node)
+    add_node("local_repair", local_repair_node)
+    add_node("repair",  RepairNode(llm, options))
+    add_node("clarify", clarify_node)
+    add_node("answer", ClarifyAnswerNode(llm, options))
+    add_node("review",  ReviewNode())
+    if tiered:
+        add_node("escalate", EscalateNode(llm, options))
+    add_node("conflict", ConflictNode(calendar))
+
+    # Entrypoint: a clarify answer resumes the draft; otherwise rule-based
+    # fast path, LLM extract only when it can't cope
+    g.add_conditional_edges(START, route_from_start, {
+        "answer": "answer",
+        "fast_path": "fast_path",
+    })
+    g.add_conditional_edges("answer", route_after_answer, {
+        "validate": "validate",
+        "fast_path": "fast_path",
+    })
+    g.add_conditional_edges("fast_path", route_after_fast_path, {
+        "validate": "validate",
+        "extract": "extract",
+    })
 
     # Flow: extract -> validate
     g.add_edge("extract", "validate")
 
-    # After validate: review | repair | clarify
+    # After validate: review | local_repair | escalate | repair | clarify
+    llm_path = {"repair": "repair", "clarify": "clarify"}
+    if tiered:
+        llm_path["escalate"] = "escalate"
+        g.add_edge("escalate", "validate")
     g.add_conditional_edges(
         "validate",
         route_after_validate,
         {
             "review": "review",
-            "repair": "repair",
-            "clarify": "clarify",
+            "local_repair": "local_repair",
+            **llm_path,
         },
     )
 
+    # After local repair: validate again if the draft changed, else the LLM path
+    g.add_conditional_edges("local_repair", route_after_local_repair, {
+        "validate": "validate",
+        **llm_path,
+    })
+
     # After review: always check conflicts
     g.add_edge("review", "conflict")           # <-- NEW edge
 
@@ -85,4 +180,5 @@ def build_graph(llm: LLMClient, options: ExtractOptions):
         "clarify": "clarify",
     })
 
-    return g.compile()
+    compiled = g.compile(checkpointer=checkpointer)
+    return telemetry.wrap_graph(compiled) if telemetry is not None else compiled
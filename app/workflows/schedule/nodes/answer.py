@@ -0,0 +1,149 @@
+# app/workflows/schedule/nodes/answer.py
+"""
+Resume a clarify round without re-extracting the whole request.
+
+clarify_node records which field it asked about (state["clarify_field"]).
+When the caller resumes the graph with state["answer"], this node fills just
+that field of the existing draft — deterministically for times, durations
+and titles, otherwise with a single-field LLM extraction — and the graph
+continues at validate.
+"""
+from __future__ import annotations
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Optional
+import asyncio
+
+from app.contracts.extraction import MeetingRequest
+from app.infra.llm.types import LLMClient, ExtractOptions
+from app.prompts.loader import compile_options
+from app.domain.temporal import DATE_RX as _DATE, TIME_RX as _TIME
+from app.workflows.schedule.nodes.local_repair import parse_duration_min
+from app.workflows.schedule.state import Reset, ScheduleState
+
+# Fields clarify can ask about, and therefore the ones we can fill from an answer
+ANSWERABLE = ("starts_at", "duration_min", "title", "location")
+
+
+def _time_of(starts_at: str) -> Optional[str]:
+    """The time of day a draft's starts_at already names ("tomorrow 1pm", "2026-10-20T13:00"), if any."""
+    try:
+        dt = datetime.fromisoformat(starts_at)
+    except ValueError:
+        m = _TIME.search(starts_at)
+        return m.group(0) if m else None
+    return f"{dt:%H:%M}" if len(starts_at) > 10 else None    # a bare date has no time
+
+
+def parse_answer(field: str, answer: str, draft: Dict[str, Any]) -> Optional[Any]:
+    """Deterministic value for `field` from a clarify answer, or None if unsure."""
+    answer = answer.strip()
+    if field == "duration_min":
+        return parse_duration_min(answer)
+    if field == "starts_at":
+        old = draft.get("starts_at")
+        old = old.strip() if isinstance(old, str) else ""
+        if _DATE.search(answer):
+            # "Friday" answers a day question; keep the time of day we already had
+            at = None if _TIME.search(answer) else _time_of(old)
+            return f"{answer} {at}" if at else answer
+        if _TIME.search(answer):
+            # "3pm" answers a time question; keep the day we already had
+            return f"{old} {answer}" if old else answer
+        return None
+    if field in ("title", "location"):
+        return answer if len(answer) >= 3 else None
+    return None
+
+
+def _field_schema(field: str) -> Dict[str, Any]:
+    full = MeetingRequest.model_json_schema()
+    schema = {
+        "type": "object",
+        "properties": {field: full["properties"][field]},
+        "required": [field],
+        "additionalProperties": False,
+    }
+    if "$defs" in full:
+        schema["$defs"] = full["$defs"]
+    return schema
+
+
+class ClarifyAnswerNode:
+    """
+    Returns a PATCH that consumes state["answer"]:
+      - known field → merged draft (→ validate)
+      - otherwise   → answer appended to user_text, draft cleared (→ full re-extract)
+    """
+
+    def __init__(self, llm: LLMClient, options: ExtractOptions):
+        self.llm = llm
+        # One compiled, single-field prompt per answerable field (built once)
+        self.fields = {}
+        for field in ANSWERABLE:
+            schema = _field_schema(field)
+            opts = replace(
+                options,
+                instructions=(
+                    f"The TEXT answers a follow-up question about the meeting's `{field}`. "
+                    f"Return only that field."
+                ),
+                prefix=None,
+            )
+            self.fields[field] = (schema, compile_options(opts, schema))
+
+    def _patch(self, state: ScheduleState, field: Optional[str], value: Any) -> Dict[str, Any]:
+        answer = (state.get("answer") or "").strip()
+        patch: Dict[str, Any] = {
+            "answer": None,
+            "clarify": None,
+            "clarify_field": None,
+            "meeting": None,
+            "errors": [],
+            "local_fixed": None,
+            # each round gets a fresh repair budget
+            "attempts": Reset(0),
+            "user_text": (state["user_text"] + " " + answer).strip(),
+        }
+        if field is None or value is None or state.get("draft") is None:
+            patch["draft"] = None
+            patch["tier"] = None
+        else:
+            patch["draft"] = {**state["draft"], field: value}
+        return patch
+
+    def _deterministic(self, state: ScheduleState):
+        field = state.get("clarify_field")
+        if field not in self.fields or state.get("draft") is None:
+            return None, None, False
+        value = parse_answer(field, state.get("answer") or "", state["draft"])
+        return field, value, value is not None
+
+    def __call__(self, state: ScheduleState) -> Dict[str, Any]:
+        field, value, done = self._deterministic(state)
+        if field is not None and not done:
+            schema, opts = self.fields[field]
+            data = self.llm.structured_extract(user_text=state["answer"], schema=schema, options=opts)
+            value = data.get(field) if isinstance(data, dict) else None
+        return self._patch(state, field, value)
+
+    async def acall(self, state: ScheduleState) -> Dict[str, Any]:
+        field, value, done = self._deterministic(state)
+        if field is not None and not done:
+            schema, opts = self.fields[field]
+            if hasattr(self.llm, "astructured_extract"):
+                data = await self.llm.astructured_extract(user_text=state["answer"], schema=schema, options=opts)
+            else:
+                data = await asyncio.to_thread(
+                    self.llm.structured_extract, user_text=state["answer"], schema=schema, options=opts)
+            value = data.get(field) if isinstance(data, dict) else None
+        return self._patch(state, field, value)
+
+
+def route_from_start(state: ScheduleState) -> str:
+    """A pending clarify answer resumes the graph; anything else is a fresh request."""
+    return "answer" if state.get("answer") else "fast_path"
+
+
+def route_after_answer(state: ScheduleState) -> str:
+    return "validate" if state.get("draft") is not None else "fast_path"
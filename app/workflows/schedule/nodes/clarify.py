@@ -1,7 +1,8 @@
 # app/workflows/schedule/nodes/clarify.py
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.workflows.schedule.state import ScheduleState
+from app.workflows.schedule.nodes.local_repair import parse_errors
 
 MISSING_KEYS_HINTS = {
     "ambiguous_datetime": "The date/time is ambiguous—what should I use?",
@@ -29,11 +30,29 @@ def _pick_clarify_question(errors: List[str]) -> str:
     # generic
     return "I’m missing something—could you clarify the date/time or duration?"
 
+# Ask about the most important failing field first
+_FIELD_ORDER = ("starts_at", "duration_min", "title", "location")
+
+def _pick_clarify_field(errors: List[str]) -> Optional[str]:
+    """The single field to ask about, from the structured pydantic errors (if any)."""
+    failing = {str(e["loc"][0]) for e in parse_errors(errors) if e.get("loc")}
+    return next((f for f in _FIELD_ORDER if f in failing), None)
+
+_FIELD_QUESTIONS = {
+    "starts_at": "I couldn’t resolve the date/time—what should I use?",
+    "duration_min": "How long should it be (in minutes)?",
+    "title": "What should I title this?",
+    "location": "Where should it be?",
+}
+
 def clarify_node(state: ScheduleState) -> Dict[str, Any]:
     """
     Populate a short 'clarify' question based on validation errors so the caller (CLI/UI)
-    can ask the user and re-run the graph with the updated text.
+    can ask the user and resume the graph with the answer. clarify_field names the
+    field being asked about so the answer can be merged into the draft directly.
     """
-    question = _pick_clarify_question(state.get("errors", []))
+    errors = state.get("errors", [])
+    field = _pick_clarify_field(errors)
+    question = _FIELD_QUESTIONS[field] if field else _pick_clarify_question(errors)
     # Return a PATCH (don’t overwrite unrelated keys)
-    return {"clarify": question}
+    return {"clarify": question, "clarify_field": field}
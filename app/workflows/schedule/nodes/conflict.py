@@ -1,8 +1,16 @@
 # app/workflows/schedule/nodes/conflict.py
+from app.application.ports import Calendar
+from app.domain.models import DEFAULT_OWNER
 from app.workflows.schedule.state import ScheduleState
-from app.infra.calendar.service import first_conflict
+from app.infra.calendar.holds import DEFAULT_TTL_S
 
-def conflict_node(state: ScheduleState) -> ScheduleState:
-    conflict = first_conflict(state["meeting"])
-    return {**state, "conflict": conflict}
+class ConflictNode:
+    """Check the slot in the injected Calendar port and hold it until the runner commits or releases it."""
+    def __init__(self, calendar: Calendar, hold_ttl_s: float = DEFAULT_TTL_S):
+        self.calendar = calendar
+        self.hold_ttl_s = hold_ttl_s
 
+    def __call__(self, state: ScheduleState) -> ScheduleState:
+        h = self.calendar.hold(state["meeting"], owner=state.get("owner", DEFAULT_OWNER),
+                               ttl_s=self.hold_ttl_s)
+        return {"conflict": h.conflict, "hold": h.id}
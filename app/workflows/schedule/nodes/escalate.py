@@ -0,0 +1,47 @@
+# nodes/escalate.py
+from typing import Any, Callable, Dict
+from app.infra.llm.cascade import CascadingLLMClient
+from app.infra.llm.types import ExtractOptions
+from app.contracts.extraction import MeetingRequest
+from app.workflows.schedule.state import ScheduleState
+
+class EscalateNode:
+    """
+    Re-extract from scratch with the next cascade tier after the current
+    tier's draft failed validation in a way a bigger model should fix.
+    The failing tier is charged with an escalation in the cascade stats.
+    """
+
+    def __init__(self, llm: CascadingLLMClient, options: ExtractOptions):
+        self.llm = llm
+        self.options = options
+        self.schema = MeetingRequest.model_json_schema()
+
+    def _patch(self, data: Dict[str, Any], tier: int) -> Dict[str, Any]:
+        # errors stay until validate replaces them; local_fixed reset so the new draft gets its own pass
+        return {"draft": data, "tier": tier, "top_tier": self.llm.top_tier, "local_fixed": False}
+
+    def __call__(self, state: ScheduleState) -> Dict[str, Any]:
+        self.llm.record(state["tier"], valid=False)
+        data, tier = self.llm.extract_at(self.llm.next_tier(state["tier"]), user_text=state["user_text"],
+                                         schema=self.schema, options=self.options)
+        return self._patch(data, tier)
+
+    async def acall(self, state: ScheduleState) -> Dict[str, Any]:
+        self.llm.record(state["tier"], valid=False)
+        data, tier = await self.llm.aextract_at(self.llm.next_tier(state["tier"]), user_text=state["user_text"],
+                                                schema=self.schema, options=self.options)
+        return self._patch(data, tier)
+
+class TierFeedback:
+    """validate_node that credits the cascade tier whose draft validated."""
+
+    def __init__(self, validate: Callable[[ScheduleState], Dict[str, Any]], llm: CascadingLLMClient):
+        self.validate = validate
+        self.llm = llm
+
+    def __call__(self, state: ScheduleState) -> Dict[str, Any]:
+        patch = self.validate(state)
+        if patch["meeting"] is not None and state.get("tier") is not None:
+            self.llm.record(state["tier"], valid=True)
+        return patch
@@ -1,16 +1,147 @@
 # nodes/extract.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from app.infra.llm.types import LLMClient, ExtractOptions
 from app.contracts.extraction import MeetingRequest
+from app.workflows.schedule.nodes.validate import validate_draft
+
+@dataclass(frozen=True)
+class Candidate:
+    """One extra extraction raced against the primary (e.g. another temperature)."""
+    llm: LLMClient
+    options: Optional[ExtractOptions] = None    # None = the node's own prompt
+
+@dataclass(frozen=True)
+class Speculation:
+    """
+    Speculative extraction: up to `budget` requests (the primary plus the
+    first budget-1 variants) run at once. Each draft is validated as it
+    arrives; the first valid one wins and the rest are cancelled. With no
+    valid draft the primary's answer goes on to repair as usual.
+    """
+    variants: Sequence[Candidate] = ()
+    budget: int = 2
 
 class ExtractNode:
-    def __init__(self, llm: LLMClient, options: ExtractOptions):
+    def __init__(self, llm: LLMClient, options: ExtractOptions,
+                 on_latency: Optional[Callable[[float], None]] = None,
+                 speculation: Optional[Speculation] = None):
         self.llm = llm
         self.options = options
+        self.schema = MeetingRequest.model_json_schema()  # once, at graph-build time
+        self.on_latency = on_latency  # e.g. FastPathNode.record_llm
+        self.candidates: List[Tuple[LLMClient, ExtractOptions]] = [(llm, options)]
+        if speculation is not None:
+            extra = [(c.llm, c.options or options) for c in speculation.variants]
+            self.candidates = [*self.candidates, *extra][:max(1, speculation.budget)]
+
+    @staticmethod
+    def _valid(data: Any, state) -> bool:
+        return isinstance(data, dict) and validate_draft(data, state["now"], state["tz"])[0] is not None
+
+    @staticmethod
+    def _pick(results: Dict[int, Any], errors: Dict[int, BaseException]) -> Dict[str, Any]:
+        """No candidate validated: fall back to the earliest-listed answer (the primary's if it has one)."""
+        if results:
+            return results[min(results)]
+        raise errors[min(errors)]
+
+    def _extract(self, state) -> Dict[str, Any]:
+        if len(self.candidates) == 1:
+            return self.llm.structured_extract(
+                user_text=state["user_text"],
+                schema=self.schema,
+                options=self.options,
+            )
+        # Threads can't be interrupted: losers are abandoned, not awaited
+        pool = ThreadPoolExecutor(max_workers=len(self.candidates), thread_name_prefix="extract")
+        futures = {
+            pool.submit(llm.structured_extract, user_text=state["user_text"], schema=self.schema, options=opts): i
+            for i, (llm, opts) in enumerate(self.candidates)
+        }
+        results: Dict[int, Any] = {}
+        errors: Dict[int, BaseException] = {}
+        try:
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    data = fut.result()
+                except Exception as e:
+                    errors[i] = e
+                    continue
+                if self._valid(data, state):
+                    return data
+                results[i] = data
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return self._pick(results, errors)
+
+    def _tiered(self) -> bool:
+        """A model cascade (CascadingLLMClient) without speculation: record which tier answered."""
+        return len(self.candidates) == 1 and hasattr(self.llm, "extract_at")
 
     def __call__(self, state):
-        data = self.llm.structured_extract(
+        t0 = time.perf_counter()
+        if self._tiered():
+            data, tier = self.llm.extract_at(self.llm.start_tier(), user_text=state["user_text"],
+                                             schema=self.schema, options=self.options)
+            patch = {"draft": data, "tier": tier, "top_tier": self.llm.top_tier}
+        else:
+            patch = {"draft": self._extract(state)}
+        if self.on_latency is not None:
+            self.on_latency(time.perf_counter() - t0)
+        return patch
+
+    async def _aextract_one(self, llm: LLMClient, options: ExtractOptions, state) -> Dict[str, Any]:
+        if not hasattr(llm, "astructured_extract"):
+            return await asyncio.to_thread(
+                llm.structured_extract, user_text=state["user_text"], schema=self.schema, options=options)
+        return await llm.astructured_extract(
             user_text=state["user_text"],
-            schema=MeetingRequest.model_json_schema(),
-            options=self.options,
+            schema=self.schema,
+            options=options,
         )
-        return {"draft": data}
+
+    async def _arace(self, state) -> Dict[str, Any]:
+        async def attempt(i: int, llm: LLMClient, options: ExtractOptions):
+            try:
+                return i, await self._aextract_one(llm, options, state), None
+            except Exception as e:
+                return i, None, e
+
+        tasks = [asyncio.create_task(attempt(i, llm, opts)) for i, (llm, opts) in enumerate(self.candidates)]
+        results: Dict[int, Any] = {}
+        errors: Dict[int, BaseException] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, data, err = await next_done
+                if err is not None:
+                    errors[i] = err
+                elif self._valid(data, state):
+                    return data
+                else:
+                    results[i] = data
+        finally:
+            for t in tasks:
+                t.cancel()     # closes the losers' HTTP requests
+        return self._pick(results, errors)
+
+    async def acall(self, state):
+        """Async variant for graph.ainvoke; sync-only clients run in a worker thread."""
+        if len(self.candidates) == 1 and not hasattr(self.llm, "astructured_extract"):
+            return await asyncio.to_thread(self, state)
+        t0 = time.perf_counter()
+        if self._tiered():
+            data, tier = await self.llm.aextract_at(self.llm.start_tier(), user_text=state["user_text"],
+                                                    schema=self.schema, options=self.options)
+            patch = {"draft": data, "tier": tier, "top_tier": self.llm.top_tier}
+        elif len(self.candidates) == 1:
+            patch = {"draft": await self._aextract_one(self.llm, self.options, state)}
+        else:
+            patch = {"draft": await self._arace(state)}
+        if self.on_latency is not None:
+            self.on_latency(time.perf_counter() - t0)
+        return patch
@@ -0,0 +1,182 @@
+# app/workflows/schedule/nodes/fastpath.py
+"""
+Rule-based extractor for the common one-line shape:
+
+    "<title> [with <names>] <date> <time> for <duration> [at|in <location>]"
+
+e.g. "Lunch with Sarah tomorrow 1pm for 90 minutes at the office".
+
+It either produces a draft that already passes MeetingRequest → Meeting
+validation (and the graph skips the LLM), or reports a miss and the graph
+falls through to ExtractNode. Anything it doesn't fully account for counts
+as a miss: it never guesses.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+import time
+
+from pydantic import ValidationError
+from app.contracts.extraction import MeetingRequest
+from app.domain.models import Meeting
+from app.domain.temporal import DATE_RX as _DATE, TIME_RX as _TIME, clock as _clock, day as _day
+from app.workflows.schedule.state import ScheduleState
+
+_DURATION = re.compile(
+    r"\bfor\s+(?:(?P<one>an?|one)\s+hour|(?P<half>half\s+an\s+hour)|"
+    r"(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>minutes?|mins?|m|hours?|hrs?|h)\b)",
+    re.IGNORECASE,
+)
+# Matched only at the end of the last date/time/duration token: "... 1pm for 30 minutes at the office"
+_LOCATION = re.compile(r"[\s,]*(?:at|in)\s+(?:the\s+)?(?P<loc>[A-Za-z][^,;]*?)\s*$", re.IGNORECASE)
+_WITH = re.compile(r"\bwith\s+(?P<names>[A-Z][a-z]+(?:\s*(?:,|and|&)\s*[A-Z][a-z]+)*)")
+
+# Words that mean the sentence carries information this grammar doesn't model.
+_UNSUPPORTED = re.compile(
+    r"\d|\b(?:morning|afternoon|evening|tonight|week|month|every|each|between|or|before|after|"
+    r"until|from|around|about|ish|at|on|in)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class FastPathStats:
+    hits: int = 0
+    misses: int = 0
+    parse_s: float = 0.0        # total time spent in the fast path
+    llm_calls: int = 0
+    llm_s: float = 0.0          # total time spent in LLM extraction
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_s(self) -> float:
+        """Estimated LLM time avoided: hits × mean observed LLM extract latency."""
+        if not self.llm_calls:
+            return 0.0
+        return self.hits * (self.llm_s / self.llm_calls)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "parse_ms_avg": round(1000 * self.parse_s / max(1, self.hits + self.misses), 3),
+            "llm_ms_avg": round(1000 * self.llm_s / max(1, self.llm_calls), 1),
+            "saved_s_est": round(self.saved_s, 2),
+        }
+
+
+def _duration_min(m: re.Match) -> Optional[int]:
+    if m.group("one"):
+        return 60
+    if m.group("half"):
+        return 30
+    value = float(m.group("num"))
+    minutes = value * 60 if m.group("unit").lower().startswith("h") else value
+    return int(round(minutes)) if minutes > 0 else None
+
+
+def _single(rx: re.Pattern, text: str) -> Optional[re.Match]:
+    """The one match of rx in text; None if it's missing or ambiguous."""
+    found = list(rx.finditer(text))
+    return found[0] if len(found) == 1 else None
+
+
+def _cut(text: str, m: re.Match) -> str:
+    return text[:m.start()] + " " + text[m.end():]
+
+
+def parse_simple_request(text: str, today: date) -> Optional[Dict[str, Any]]:
+    """Return a MeetingRequest-shaped dict, or None when the text isn't fully understood."""
+    rest = " ".join(text.split())
+
+    # A location is the trailing clause after every date/time/duration token;
+    # an "at"/"in" anywhere else stays in the title and makes it a miss
+    location = None
+    tail = max((m.end() for rx in (_DURATION, _TIME, _DATE) for m in rx.finditer(rest)), default=0)
+    loc_m = _LOCATION.match(rest, tail)
+    if loc_m:
+        location = loc_m.group("loc").strip(" .")
+        rest = rest[:tail]
+
+    dur_m = _single(_DURATION, rest)
+    if not dur_m or (duration := _duration_min(dur_m)) is None:
+        return None
+    rest = _cut(rest, dur_m)
+
+    time_m = _single(_TIME, rest)
+    if not time_m or (clock := _clock(time_m)) is None:
+        return None
+    rest = _cut(rest, time_m)
+
+    date_m = _single(_DATE, rest)
+    if not date_m or (day := _day(date_m, today)) is None:
+        return None
+    rest = _cut(rest, date_m)
+
+    title = " ".join(rest.split()).strip(" ,.;-")
+    if len(title) < 3 or _UNSUPPORTED.search(title):
+        return None
+
+    attendees: List[Dict[str, str]] = []
+    with_m = _WITH.search(title)
+    if with_m:
+        names = re.split(r"\s*(?:,|\band\b|&)\s*", with_m.group("names"))
+        attendees = [{"name": n} for n in names if n]
+
+    return {
+        "title": title,
+        "starts_at": f"{day.isoformat()} {clock[0]:02d}:{clock[1]:02d}",
+        "duration_min": duration,
+        "location": location,
+        "attendees": attendees,
+    }
+
+
+class FastPathNode:
+    """
+    Graph node placed before ExtractNode. Returns a PATCH:
+      - hit:  {"draft": {...}, "fast_path": True}  → route straight to validate
+      - miss: {"fast_path": False}                 → fall through to the LLM
+    """
+
+    def __init__(self):
+        self.stats = FastPathStats()
+        self._lock = threading.Lock()
+
+    def record_llm(self, seconds: float) -> None:
+        """ExtractNode reports its latency here so saved time can be estimated."""
+        with self._lock:
+            self.stats.llm_calls += 1
+            self.stats.llm_s += seconds
+
+    def __call__(self, state: ScheduleState) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        draft = parse_simple_request(state["user_text"], state["now"].date())
+        if draft is not None:
+            # Only claim the request if it survives the same validation as the LLM path
+            try:
+                req = MeetingRequest.model_validate(draft)
+                Meeting.model_validate(req.model_dump(), context={"now": state["now"], "tz": state["tz"]})
+            except (ValidationError, ValueError):
+                draft = None
+        with self._lock:
+            self.stats.parse_s += time.perf_counter() - t0
+            if draft is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        if draft is None:
+            return {"fast_path": False}
+        return {"draft": draft, "fast_path": True}
+
+
+def route_after_fast_path(state: ScheduleState) -> str:
+    return "validate" if state.get("fast_path") else "extract"
@@ -0,0 +1,192 @@
+# app/workflows/schedule/nodes/local_repair.py
+"""
+Deterministic repair of a draft from pydantic's structured errors.
+
+validate_node stores ValidationError.json() in state["errors"]; each entry
+carries a `loc` and a `type`. Most failures on the LLM path are mechanical
+(renamed or extra keys, "90" / "1.5 hours" for duration_min, attendees as
+plain strings, nulls for list fields), so they are fixed here and the draft
+goes back to validate. Only what's left reaches RepairNode (an LLM call).
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Set
+import json
+import re
+
+from app.contracts.extraction import MeetingRequest
+from app.workflows.schedule.state import ScheduleState
+
+_FIELDS = set(MeetingRequest.model_fields)
+
+# Keys models commonly use instead of ours
+_ALIASES = {
+    "starts_at": ("start", "start_time", "starts", "start_at", "when", "time", "datetime", "date_time"),
+    "duration_min": ("duration", "duration_minutes", "minutes", "length", "length_min", "mins"),
+    "title": ("name", "subject", "summary", "event", "meeting"),
+    "location": ("place", "where", "venue", "room"),
+    "attendees": ("participants", "people", "guests", "invitees", "with"),
+    "recurrence": ("rrule", "repeat", "repeats", "recurring", "recurrence_rule"),
+}
+
+_PRIORITY = {"medium": "normal", "med": "normal", "default": "normal", "urgent": "high",
+             "important": "high", "critical": "high", "minor": "low"}
+
+_DURATION_PART = re.compile(
+    r"(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>hours?|hrs?|h|minutes?|mins?|m)?(?![a-z])", re.IGNORECASE
+)
+_WORD_DURATIONS = {"half an hour": 30, "an hour": 60, "one hour": 60, "a quarter hour": 15,
+                   "an hour and a half": 90, "hour and a half": 90}
+
+
+def parse_errors(errors: List[str]) -> List[Dict[str, Any]]:
+    """Decode the ValidationError.json() strings in state["errors"]; skip anything else."""
+    out: List[Dict[str, Any]] = []
+    for blob in errors or []:
+        try:
+            items = json.loads(blob)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(items, list):
+            out.extend(i for i in items if isinstance(i, dict) and "loc" in i)
+    return out
+
+
+def offending_fields(errors: List[str]) -> Set[str]:
+    """Top-level draft keys named by the structured errors."""
+    return {str(e["loc"][0]) for e in parse_errors(errors) if e.get("loc")}
+
+
+def parse_duration_min(value: Any) -> Optional[int]:
+    """90, "90", "90 min", "1.5 hours", "1h30", "half an hour" → minutes."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(round(value)) if value > 0 else None
+    if not isinstance(value, str):
+        return None
+    text = value.strip().lower()
+    if text in _WORD_DURATIONS:
+        return _WORD_DURATIONS[text]
+    total = 0.0
+    matched = False
+    for m in _DURATION_PART.finditer(text):
+        matched = True
+        num = float(m.group("num"))
+        unit = (m.group("unit") or "").lower()
+        # unitless numbers are minutes, including the "30" in "1h30"
+        total += num * 60 if unit.startswith("h") else num
+    if not matched or total <= 0:
+        return None
+    return int(round(total))
+
+
+def _attendee(value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if "@" in value and " " not in value:
+            return {"name": value.split("@", 1)[0], "email": value}
+        return {"name": value}
+    if isinstance(value, dict):
+        name = value.get("name") or value.get("full_name") or value.get("display_name")
+        email = value.get("email") or value.get("mail")
+        if not name and isinstance(email, str):
+            name = email.split("@", 1)[0]
+        if not name:
+            return None
+        return {"name": str(name), "email": str(email) if email else None}
+    return None
+
+
+def _attendees(value: Any) -> List[Dict[str, Any]]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [p for p in re.split(r"\s*(?:,|;|\band\b|&)\s*", value) if p]
+    if isinstance(value, dict):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [a for a in (_attendee(v) for v in value) if a is not None]
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(str(v) for v in value.values() if v is not None) or None
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value if v is not None) or None
+    return str(value)
+
+
+def _normalize(fixed: Dict[str, Any], key: str) -> None:
+    """Coerce one top-level field toward the MeetingRequest shape, in place."""
+    if key == "duration_min":
+        minutes = parse_duration_min(fixed.get(key))
+        if minutes is not None:
+            fixed[key] = minutes
+    elif key == "attendees":
+        fixed[key] = _attendees(fixed.get(key))
+    elif key in ("title", "starts_at", "location", "recurrence"):
+        text = _text(fixed.get(key))
+        if text is not None:
+            fixed[key] = text.strip()
+        elif key in ("location", "recurrence"):
+            fixed[key] = None
+    elif key == "priority":
+        value = str(fixed.get(key) or "").strip().lower()
+        value = _PRIORITY.get(value, value)
+        if value in ("low", "normal", "high"):
+            fixed[key] = value
+        else:
+            fixed.pop(key, None)   # fall back to the schema default
+
+
+def repair_draft(draft: Dict[str, Any], errors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a corrected copy of `draft`, touching only fields named in `errors`."""
+    fixed = dict(draft or {})
+    touched: List[str] = []
+    for err in errors:
+        loc = err.get("loc") or ()
+        if not loc:
+            continue
+        key, etype = str(loc[0]), err.get("type", "")
+
+        if etype == "extra_forbidden" and key not in _FIELDS:
+            value = fixed.pop(key, None)
+            # A renamed field: move it over if ours is missing
+            for field, aliases in _ALIASES.items():
+                if key.lower() in aliases and fixed.get(field) is None and value is not None:
+                    fixed[field] = value
+                    touched.append(field)
+        elif etype == "missing" and len(loc) == 1:
+            for alias in _ALIASES.get(key, ()):
+                if draft.get(alias) is not None:
+                    fixed[key] = draft[alias]
+                    touched.append(key)
+                    break
+        else:
+            # Includes nested errors, e.g. ("attendees", 0, "name") normalizes the whole list
+            touched.append(key)
+
+    for key in dict.fromkeys(touched):
+        if key in _FIELDS:
+            _normalize(fixed, key)
+    return fixed
+
+
+def local_repair_node(state: ScheduleState) -> Dict[str, Any]:
+    """
+    Returns a PATCH: the repaired draft when something changed (→ validate
+    again), or just local_fixed=False so routing falls through to the LLM
+    repair / clarify path.
+    """
+    draft = state.get("draft") or {}
+    fixed = repair_draft(draft, parse_errors(state.get("errors", [])))
+    if fixed == draft:
+        return {"local_fixed": False}
+    return {"draft": fixed, "local_fixed": True}
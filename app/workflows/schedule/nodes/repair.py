@@ -1,12 +1,36 @@
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Set, Tuple
 from app.infra.llm.types import LLMClient, ExtractOptions
 from app.contracts.extraction import MeetingRequest
 from app.workflows.schedule.state import ScheduleState
+from app.workflows.schedule.nodes.local_repair import parse_errors
+
+def _focus(state: ScheduleState) -> Tuple[Dict[str, Any], List[str], Set[str]]:
+    """
+    Narrow the repair request to the fields that still fail after local_repair:
+    the previous JSON holds only those keys and each error is one "loc: msg"
+    line. Falls back to the whole draft when errors aren't structured.
+    """
+    draft = state["draft"] or {}
+    parsed = parse_errors(state["errors"])
+    fields = {str(e["loc"][0]) for e in parsed if e.get("loc")}
+    if not fields:
+        return draft, state["errors"], set()
+    previous = {k: draft.get(k) for k in sorted(fields)}
+    errors = [f"{'.'.join(str(p) for p in e['loc'])}: {e.get('msg', e.get('type'))}" for e in parsed]
+    return previous, errors, fields
+
+def _merge(draft: Dict[str, Any], fixed: Dict[str, Any], fields: Set[str]) -> Dict[str, Any]:
+    """Put the model's answer for the offending fields back into the draft."""
+    merged = {k: v for k, v in (draft or {}).items() if k not in fields}
+    merged.update(fixed or {})
+    return merged
 
 class RepairNode:
     def __init__(self, llm: LLMClient, options: ExtractOptions):
         self.llm = llm
         self.options = options
+        self.schema = MeetingRequest.model_json_schema()  # same schema extract uses, built once
 
     def __call__(self, state: ScheduleState) -> Dict[str, Any]:
         """
@@ -14,17 +38,34 @@ class RepairNode:
         the Pydantic error messages back to the LLM, along with the SAME prompt
         framing (system + guardrail) so it can correct the JSON to the schema.
         """
-        # 1) Build/obtain the same schema used in extract
-        schema = MeetingRequest.model_json_schema()
+        # 1) The same schema used in extract (built once in __init__)
+        schema = self.schema
+
+        # 2) Only the fields local_repair couldn't fix, with their errors
+        previous, errors, fields = _focus(state)
 
-        # 2) Call adapter's repair using the injected prompts
+        # 3) Call adapter's repair using the injected prompts
         fixed = self.llm.repair_to_schema(
-            previous=state["draft"] or {},  # last LLM JSON (might be None on weird runs)
-            errors=state["errors"],  # Pydantic errors from validate_node
+            previous=previous,  # offending fields of the last draft
+            errors=errors,  # Pydantic errors from validate_node, one line per field
             schema=schema,
             options=self.options,  # <- this carries system + guardrail (+ examples/instructions if you want)
         )
 
-        # 3) Return a *patch*: bump attempts by +1 and replace the draft
-        #    (attempts is Annotated[int, operator.add] in the TypedDict, so +1 is merged additively)
-        return {"attempts": 1, "draft": fixed}
\ No newline at end of file
+        # 4) Return a *patch*: bump attempts by +1 and replace the draft
+        #    (attempts is Annotated[int, add_or_reset] in the TypedDict, so +1 is merged additively).
+        #    local_fixed is reset so the new draft gets a deterministic pass too.
+        return {"attempts": 1, "draft": _merge(state["draft"], fixed, fields), "local_fixed": False}
+
+    async def acall(self, state: ScheduleState) -> Dict[str, Any]:
+        """Async variant for graph.ainvoke; sync-only clients run in a worker thread."""
+        if not hasattr(self.llm, "arepair_to_schema"):
+            return await asyncio.to_thread(self, state)
+        previous, errors, fields = _focus(state)
+        fixed = await self.llm.arepair_to_schema(
+            previous=previous,
+            errors=errors,
+            schema=self.schema,
+            options=self.options,
+        )
+        return {"attempts": 1, "draft": _merge(state["draft"], fixed, fields), "local_fixed": False}
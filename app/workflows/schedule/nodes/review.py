@@ -25,6 +25,7 @@ class ReviewNode:
             "when": start_local.isoformat(timespec="minutes"),
             "duration_min": meeting.duration_min,
             "location": meeting.location,
+            "recurrence": meeting.recurrence,
         }
 
         return {"review": summary}
@@ -1,13 +1,19 @@
 # app/workflows/schedule/nodes/validate.py
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import ValidationError
 from app.contracts.extraction import MeetingRequest
 from app.domain.models import Meeting
 from app.workflows.schedule.state import ScheduleState
 
-def validate_node(state: ScheduleState) -> ScheduleState:
+def validate_draft(draft: Dict[str, Any], now, tz: str) -> Tuple[Optional[Meeting], List[str]]:
+    """MeetingRequest → Meeting; (meeting, []) or (None, [pydantic errors JSON])."""
     try:
-        draft = MeetingRequest.model_validate(state["draft"])
-        meeting = Meeting.model_validate(draft.model_dump(), context={"now": state["now"], "tz": state["tz"]})
-        return {**state, "meeting": meeting, "errors": []}
+        req = MeetingRequest.model_validate(draft)
+        return Meeting.model_validate(req.model_dump(), context={"now": now, "tz": tz}), []
     except ValidationError as e:
-        return {**state, "meeting": None, "errors": [e.json()]}
+        return None, [e.json()]
+
+def validate_node(state: ScheduleState) -> ScheduleState:
+    # Return a PATCH: echoing the whole state would re-add `attempts` (an additive channel)
+    meeting, errors = validate_draft(state["draft"], state["now"], state["tz"])
+    return {"meeting": meeting, "errors": errors}
@@ -2,16 +2,30 @@ from typing import TypedDict, Optional, Dict, Any, List
 from datetime import datetime
 from app.domain.models import Meeting
 from typing_extensions import Annotated
-import operator
+
+class Reset(int):
+    """An `attempts` update that sets the count instead of adding to it: {"attempts": Reset(0)}."""
+
+def add_or_reset(current: int, update: int) -> int:
+    """attempts reducer: plain ints add up (repair sends 1), a Reset replaces the count."""
+    return int(update) if isinstance(update, Reset) else current + update
 
 class ScheduleState(TypedDict):
     user_text: str             # NL input
     now: datetime              # anchor "today/now"
     tz: str                    # e.g. "America/Chicago"
+    owner: str                 # whose calendar: user or resource id
     draft: Optional[Dict[str, Any]]   # raw JSON from the LLM
     meeting: Optional[Meeting]        # normalized domain object
     errors: List[str]          # validation errors (replace semantics)
-    attempts: Annotated[int, operator.add]  # <-- additive merge
+    attempts: Annotated[int, add_or_reset]  # additive merge; a Reset starts over
     conflict: Optional[str]    # text description or None
+    hold: Optional[str]        # id of the slot hold placed by conflict (commit or release it)
     clarify: Optional[str]     # when we need more info, nodes set a short, direct question here
-    review: Optional[Dict[str, Any]]
\ No newline at end of file
+    review: Optional[Dict[str, Any]]
+    fast_path: Optional[bool]  # True when the rule-based extractor produced the draft
+    tier: Optional[int]        # cascade tier that produced the draft (None without a cascade)
+    top_tier: Optional[int]    # highest tier of that cascade; below it, failures escalate
+    local_fixed: Optional[bool]  # True when local_repair changed the current draft
+    clarify_field: Optional[str] # the draft field the clarify question is about
+    answer: Optional[str]        # user's reply to `clarify`; set by the caller to resume
\ No newline at end of file
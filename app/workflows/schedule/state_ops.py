@@ -5,10 +5,38 @@ Each function returns a PATCH (dict of keys to update), not a whole state.
 """
 
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from app.domain.models import Meeting
+from app.domain.models import Meeting, DEFAULT_OWNER
+from app.workflows.schedule.state import Reset
+
+# ----- Initial state -----
+
+def initial_state(user_text: str, tz: str, now: Optional[datetime] = None,
+                  owner: str = DEFAULT_OWNER) -> Dict[str, Any]:
+    """
+    Build a fresh ScheduleState dict (the one exception to the PATCH rule).
+    """
+    return {
+        "user_text": user_text,
+        "now": now or datetime.now(ZoneInfo(tz)),
+        "tz": tz,
+        "owner": owner,
+        "draft": None,
+        "meeting": None,
+        "errors": [],
+        "attempts": 0,
+        "conflict": None,
+        "hold": None,
+        "clarify": None,
+        "fast_path": None,
+        "tier": None,
+        "top_tier": None,
+        "local_fixed": None,
+        "clarify_field": None,
+        "answer": None,
+    }
 
 # ----- Clarify / retry helpers -----
 
@@ -30,19 +58,31 @@ def clear_transients_for_retry() -> Dict[str, Any]:
         "draft": None,
         "meeting": None,
         "errors": [],
-        "attempts": 0,
+        "attempts": Reset(0),
         "clarify": None,
+        "fast_path": None,
+        "tier": None,
+        "top_tier": None,
+        "local_fixed": None,
     }
 
 def prepare_retry_patch(user_text: str, answer: str) -> Dict[str, Any]:
     """
-    One-stop shop for the clarify loop: append the answer and clear transients.
+    Full restart of the clarify loop: append the answer and clear transients
+    (the graph re-extracts from scratch). Prefer resume_with_answer.
     """
     patch = {}
     patch.update(append_answer_to_text(user_text, answer))
     patch.update(clear_transients_for_retry())
     return patch
 
+def resume_with_answer(answer: str) -> Dict[str, Any]:
+    """
+    Resume the graph after a clarify question: the answer node merges the reply
+    into the existing draft and continues at validate.
+    """
+    return {"answer": (answer or "").strip(), "clarify": None}
+
 # ----- Optional: confirmation / review helpers -----
 
 def summarize_for_review(meeting: Meeting, tz: str = "America/Chicago") -> Dict[str, Any]:
@@ -0,0 +1,89 @@
+# benchmarks/bench_startup.py
+"""
+Startup budget for subcommands that don't talk to the model.
+
+    python -m benchmarks.bench_startup [--budget-ms 40] [--runs 5]
+
+Each command runs under `python -X importtime`. The check fails (exit 1) if
+  - the command imports a heavy module it shouldn't (langchain, langgraph,
+    ollama, pydantic, numpy, dateparser), or
+  - the imports it adds on top of a bare interpreter take longer than the
+    budget (best of --runs, so a noisy machine doesn't flap).
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+import argparse
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+FORBIDDEN = ("langchain", "langchain_core", "langchain_ollama", "langgraph", "ollama",
+             "pydantic", "numpy", "dateparser")
+
+
+def _importtime(argv: List[str]) -> Tuple[Dict[str, int], Set[str]]:
+    """
+    One run of `python -X importtime argv`: (top-level module → cumulative
+    import µs, every module imported).
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=ROOT,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"{' '.join(argv)} failed:\n{proc.stderr[-2000:]}")
+    roots: Dict[str, int] = {}
+    seen: Set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue    # header line
+        seen.add(name.strip())
+        # Nested imports are indented under their parent; keep only the roots
+        if name[1:2] != " ":
+            roots[name.strip()] = int(cumulative)
+    return roots, seen
+
+
+def _measure(argv: List[str], baseline: Dict[str, int], runs: int) -> Tuple[float, List[str]]:
+    """(best added import ms over runs, forbidden top-level packages seen)."""
+    best = float("inf")
+    heavy: List[str] = []
+    for _ in range(runs):
+        roots, seen = _importtime(argv)
+        added = sum(us for name, us in roots.items() if name not in baseline)
+        best = min(best, added / 1000)
+        heavy = sorted({n.split(".")[0] for n in seen if n.split(".")[0] in FORBIDDEN} | set(heavy))
+    return best, heavy
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Import-time budget for non-LLM subcommands")
+    ap.add_argument("--budget-ms", type=float, default=40.0, help="max import time added by main.py")
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    baseline, _ = _importtime(["-c", "pass"])
+    with tempfile.TemporaryDirectory() as tmp:
+        db = str(Path(tmp) / "cal.db")
+        commands = {
+            "list": ["main.py", "list"],
+            "list --db": ["main.py", "list", "--db", db],
+            "schedule --help": ["main.py", "schedule", "--help"],
+        }
+        failed = False
+        width = max(map(len, commands))
+        for label, argv in commands.items():
+            ms, heavy = _measure(argv, baseline, args.runs)
+            ok = ms <= args.budget_ms and not heavy
+            failed |= not ok
+            note = f"  imports {', '.join(heavy)}" if heavy else ""
+            print(f"{label:<{width}}  {ms:7.1f} ms  {'ok' if ok else 'OVER'}{note}")
+    print(f"budget: {args.budget_ms:.0f} ms of imports on top of a bare interpreter")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
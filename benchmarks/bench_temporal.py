@@ -0,0 +1,83 @@
+# benchmarks/bench_temporal.py
+"""
+Throughput of app.domain.temporal.resolve over a corpus of phrasings.
+
+    python -m benchmarks.bench_temporal [--n 20000] [--tz America/Chicago]
+
+Reports ops/sec per tier (ISO, grammar cold/warm, fallback) alongside the
+historical dateutil-only parse, plus the grammar LRU statistics.
+"""
+from __future__ import annotations
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import argparse
+import time
+
+from dateutil import parser as dateparse
+
+from app.domain import temporal
+
+CORPUS = {
+    "iso": [
+        "2026-10-20T13:00", "2026-10-20 13:00", "2026-11-02T09:30:00-06:00", "2026-12-01",
+    ],
+    "grammar": [
+        "tomorrow 1pm", "today at 3:30pm", "next Tue 9:30", "next Tuesday", "friday at noon",
+        "on monday 10am", "in 2 hours", "in 30 minutes", "in an hour", "tomorrow midnight",
+        "wed 14:00", "9:15 a.m.",
+    ],
+    "fallback": [
+        "the day after tomorrow at 3pm", "Oct 30 2pm", "December 5th at 10", "in 3 days at noon",
+    ],
+}
+
+
+def _rate(fn, items, n: int) -> float:
+    """ops/sec for n calls cycling through items."""
+    k = len(items)
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(items[i % k])
+    return n / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Temporal resolver throughput")
+    ap.add_argument("--n", type=int, default=20000, help="calls per measured tier")
+    ap.add_argument("--tz", default="America/Chicago")
+    args = ap.parse_args()
+
+    tz = args.tz
+    now = datetime.now(ZoneInfo(tz))
+    baseline = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def resolve(s):
+        return temporal.resolve(s, now=now, tz=tz)
+
+    def legacy(s):
+        try:
+            dt = dateparse.parse(s, default=baseline, fuzzy=True)
+        except ValueError:
+            return None     # e.g. "in an hour": the old path simply failed
+        return dt.replace(tzinfo=ZoneInfo(tz)) if dt.tzinfo is None else dt.astimezone(ZoneInfo(tz))
+
+    # Fallback pays for dateparser's import once; keep that out of the numbers
+    resolve(CORPUS["fallback"][0])
+
+    rows = []
+    rows.append(("iso", _rate(resolve, CORPUS["iso"], args.n)))
+    temporal._grammar.cache_clear()
+    rows.append(("grammar (cold)", _rate(resolve, CORPUS["grammar"], len(CORPUS["grammar"]))))
+    rows.append(("grammar (warm)", _rate(resolve, CORPUS["grammar"], args.n)))
+    rows.append(("fallback", _rate(resolve, CORPUS["fallback"], max(1, args.n // 100))))
+    everything = [s for items in CORPUS.values() for s in items if s not in CORPUS["fallback"]]
+    rows.append(("legacy dateutil", _rate(legacy, everything, max(1, args.n // 10))))
+
+    width = max(len(name) for name, _ in rows)
+    for name, ops in rows:
+        print(f"{name:<{width}}  {ops:>12,.0f} ops/s")
+    print(f"grammar LRU: {temporal.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/fakes.py
+"""
+Stand-in LLM client for driving build_graph without Ollama.
+
+ScriptedLLM answers extract/repair calls from a script (cycled), optionally
+sleeping `latency_s` per call so runs can mimic a real model's wait while
+still measuring only the workflow around it.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import asyncio
+import itertools
+import time
+
+from app.infra.llm.types import ExtractOptions
+
+Script = Union[Sequence[Dict[str, Any]], Callable[[str], Dict[str, Any]]]
+
+
+class ScriptedLLM:
+    """
+    LLMClient + AsyncLLMClient whose answers come from `extract` / `repair`.
+
+    Each script is either a sequence of drafts, replayed in a cycle, or a
+    function of the user text (extract) / previous draft as JSON text (repair).
+    """
+
+    def __init__(self, extract: Script, repair: Optional[Script] = None, *, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.calls = 0
+        self._extract = self._player(extract)
+        self._repair = self._player(repair if repair is not None else extract)
+
+    @staticmethod
+    def _player(script: Script) -> Callable[[str], Dict[str, Any]]:
+        if callable(script):
+            return script
+        it = itertools.cycle(script)
+        return lambda _text: dict(next(it))
+
+    def _answer(self, play: Callable[[str], Dict[str, Any]], text: str) -> Dict[str, Any]:
+        self.calls += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return play(text)
+
+    async def _aanswer(self, play: Callable[[str], Dict[str, Any]], text: str) -> Dict[str, Any]:
+        self.calls += 1
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return play(text)
+
+    def structured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                           options: ExtractOptions) -> Dict[str, Any]:
+        return self._answer(self._extract, user_text)
+
+    def repair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                         schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        return self._answer(self._repair, str(previous))
+
+    async def astructured_extract(self, *, user_text: str, schema: Dict[str, Any],
+                                  options: ExtractOptions) -> Dict[str, Any]:
+        return await self._aanswer(self._extract, user_text)
+
+    async def arepair_to_schema(self, *, previous: Dict[str, Any], errors: List[str],
+                                schema: Dict[str, Any], options: ExtractOptions) -> Dict[str, Any]:
+        return await self._aanswer(self._repair, str(previous))
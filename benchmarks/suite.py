@@ -0,0 +1,260 @@
+# benchmarks/suite.py
+"""
+Offline benchmark suite: no Ollama, no network.
+
+    python -m benchmarks.suite [--quick] [--json results.json]
+                               [--baseline benchmarks/baseline.json] [--update-baseline]
+                               [--tolerance 0.3] [--only calendar]
+
+Measures, in µs per operation (lower is better):
+  graph.*      build_graph driven by ScriptedLLM (fast path, LLM path, LLM
+               repair path, cascade escalation, async LLM path): pure
+               workflow overhead
+  validate.*   validate_node on a valid and an invalid draft
+  temporal.*   app.domain.temporal.resolve per tier (corpus of bench_temporal)
+  calendar.*   InMemoryCalendar insert / first_conflict / list_events / busy
+               at 10^3..10^6 events (--quick stops at 10^5; the full run
+               takes minutes, most of it filling the 10^6 calendar)
+
+Every number is the best of --repeat timed batches. Results are printed as
+a table and, with --json, written as {"meta": ..., "results": {name: {...}}}.
+When a baseline file exists, any benchmark slower than baseline × (1 +
+tolerance) is reported as a regression and the exit status is 1.
+"""
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.domain import temporal
+from app.domain.models import Meeting
+from app.infra.calendar.adapters import InMemoryCalendarAdapter
+from app.infra.calendar.service import InMemoryCalendar
+from app.infra.llm.cascade import CascadingLLMClient
+from app.infra.llm.types import ExtractOptions
+from app.workflows.schedule.graph import build_graph
+from app.workflows.schedule.nodes.validate import validate_node
+from app.workflows.schedule.state_ops import initial_state
+from benchmarks.bench_temporal import CORPUS
+from benchmarks.fakes import ScriptedLLM
+
+BASELINE = Path(__file__).with_name("baseline.json")
+TZ = "America/Chicago"
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=ZoneInfo(TZ))
+VALID = {"title": "Quarterly planning", "starts_at": "2026-10-20 13:00", "duration_min": 45}
+NO_DURATION = {"title": "Quarterly planning", "starts_at": "2026-10-20 13:00"}
+
+Results = Dict[str, Dict[str, Any]]
+
+
+def _time(fn: Callable[[], Any], n: int, repeat: int) -> float:
+    """Best µs per call of fn over `repeat` batches of n calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / n)
+    return best * 1e6
+
+
+def _record(out: Results, name: str, us: float, n: int) -> None:
+    out[name] = {"us_per_op": round(us, 3), "n": n}
+
+
+# ---- graph ----
+
+def bench_graph(out: Results, scale: int, repeat: int) -> None:
+    calendar = InMemoryCalendarAdapter()
+    options = ExtractOptions(system="You extract meetings.", instructions="Return JSON.")
+
+    def runner(llm, text: str):
+        graph = build_graph(llm, options, calendar)
+
+        def once():
+            result = graph.invoke(initial_state(text, TZ, now=NOW, owner="bench"))
+            calendar.release_hold(result.get("hold"), owner="bench")
+            return result
+        return once
+
+    n = max(10, scale // 10)
+    _record(out, "graph.fast_path", _time(runner(ScriptedLLM([VALID]), "Lunch with Sarah tomorrow 1pm for 30 minutes"),
+                                          n, repeat), n)
+    _record(out, "graph.llm", _time(runner(ScriptedLLM([VALID]), "plan the quarter with the team"), n, repeat), n)
+    _record(out, "graph.llm_repair", _time(runner(ScriptedLLM([NO_DURATION], [VALID]), "plan the quarter"),
+                                           n, repeat), n)
+    # Tier 0 answers with a wrong-typed duration every time → escalate to tier 1
+    # (min_samples is out of reach so the failing tier is never skipped)
+    cascade = CascadingLLMClient([("small", ScriptedLLM([{**VALID, "duration_min": "long"}])),
+                                  ("large", ScriptedLLM([VALID]))], min_samples=10**9)
+    _record(out, "graph.cascade_escalate", _time(runner(cascade, "plan the quarter"), n, repeat), n)
+
+    graph = build_graph(ScriptedLLM([VALID]), options, calendar, checkpointer=InMemorySaver())
+
+    async def batch(k: int) -> None:
+        for i in range(k):
+            config = {"configurable": {"thread_id": f"bench-{i}"}}
+            result = await graph.ainvoke(initial_state("plan the quarter", TZ, now=NOW, owner="bench"), config)
+            calendar.release_hold(result.get("hold"), owner="bench")
+            await graph.checkpointer.adelete_thread(f"bench-{i}")
+
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        asyncio.run(batch(n))
+        best = min(best, (time.perf_counter() - t0) / n)
+    _record(out, "graph.ainvoke_checkpointed", best * 1e6, n)
+
+
+# ---- validate ----
+
+def bench_validate(out: Results, scale: int, repeat: int) -> None:
+    valid = {"draft": VALID, "now": NOW, "tz": TZ}
+    invalid = {"draft": NO_DURATION, "now": NOW, "tz": TZ}
+    n = scale
+    _record(out, "validate.valid", _time(lambda: validate_node(valid), n, repeat), n)
+    _record(out, "validate.invalid", _time(lambda: validate_node(invalid), n, repeat), n)
+
+
+# ---- temporal ----
+
+def bench_temporal(out: Results, scale: int, repeat: int) -> None:
+    for tier in ("iso", "grammar", "fallback"):
+        items = CORPUS[tier]
+        k = len(items)
+        n = scale if tier != "fallback" else max(k, scale // 100)
+        it = iter(range(10**12))
+        _record(out, f"temporal.{tier}",
+                _time(lambda: temporal.resolve(items[next(it) % k], now=NOW, tz=TZ), n, repeat), n)
+
+
+# ---- calendar ----
+
+def _meetings(count: int, rng: random.Random) -> List[Meeting]:
+    """`count` 30-minute meetings on half-hour boundaries, about half the time busy."""
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    slots = 2 * count
+    return [
+        Meeting.model_construct(title=f"event {i}", starts_at=t0 + timedelta(minutes=30 * rng.randrange(slots)),
+                                duration_min=30, location=None, attendees=[], priority="normal",
+                                recurrence=None)
+        for i in range(count)
+    ]
+
+
+def bench_calendar(out: Results, sizes: List[int], repeat: int) -> None:
+    rng = random.Random(7)
+    for size in sizes:
+        cal = InMemoryCalendar(owner="bench")
+        meetings = _meetings(size, rng)
+        t0 = time.perf_counter()
+        for m in meetings:
+            cal.create_event(m)
+        _record(out, f"calendar.insert[n={size}]", (time.perf_counter() - t0) / size * 1e6, size)
+
+        probes = _meetings(1000, rng)
+        probes = [p.model_copy(update={"starts_at": p.starts_at + timedelta(minutes=30 * rng.randrange(size))})
+                  for p in probes]
+        it = iter(range(10**12))
+        k = len(probes)
+        _record(out, f"calendar.first_conflict[n={size}]",
+                _time(lambda: cal.first_conflict(probes[next(it) % k]), k, repeat), k)
+
+        day = timedelta(days=1)
+        _record(out, f"calendar.list_day[n={size}]",
+                _time(lambda: cal.list_events(p := probes[next(it) % k].starts_at, p + day), k, repeat), k)
+        week = timedelta(days=7)
+        _record(out, f"calendar.busy_week[n={size}]",
+                _time(lambda: cal.busy(p := probes[next(it) % k].starts_at, p + week), k // 10, repeat), k // 10)
+
+
+# ---- reporting ----
+
+def compare(results: Results, baseline: Results, tolerance: float) -> List[str]:
+    """Names of benchmarks slower than baseline × (1 + tolerance)."""
+    return [name for name, r in results.items()
+            if name in baseline and r["us_per_op"] > baseline[name]["us_per_op"] * (1 + tolerance)]
+
+
+def report(results: Results, baseline: Optional[Results], regressions: List[str], stream=sys.stdout) -> None:
+    width = max(map(len, results))
+    for name, r in results.items():
+        line = f"{name:<{width}}  {r['us_per_op']:>12,.2f} µs/op"
+        if baseline and name in baseline:
+            ratio = r["us_per_op"] / baseline[name]["us_per_op"]
+            line += f"  {ratio:6.2f}× baseline"
+            if name in regressions:
+                line += "  REGRESSION"
+        print(line, file=stream)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Offline benchmark suite (fake LLM, no network)")
+    ap.add_argument("--quick", action="store_true", help="smaller batches; calendar sizes up to 10^5")
+    ap.add_argument("--only", choices=["graph", "validate", "temporal", "calendar"], action="append",
+                    help="run only these groups (repeatable)")
+    ap.add_argument("--repeat", type=int, default=3, help="timed batches per benchmark (best is kept)")
+    ap.add_argument("--json", default=None, help="write results here ('-' for stdout)")
+    ap.add_argument("--baseline", default=str(BASELINE), help="baseline results to compare against")
+    ap.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    ap.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown vs baseline (0.3 = 30%%)")
+    args = ap.parse_args()
+
+    groups = args.only or ["graph", "validate", "temporal", "calendar"]
+    scale = 1000 if args.quick else 5000
+    sizes = [10**3, 10**4, 10**5] + ([] if args.quick else [10**6])
+
+    results: Results = {}
+    if "graph" in groups:
+        bench_graph(results, scale, args.repeat)
+    if "validate" in groups:
+        bench_validate(results, scale, args.repeat)
+    if "temporal" in groups:
+        bench_temporal(results, scale, args.repeat)
+    if "calendar" in groups:
+        bench_calendar(results, sizes, args.repeat)
+
+    doc = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists() and not args.update_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+
+    # With --json - stdout carries only the JSON document
+    report(results, baseline, regressions, sys.stderr if args.json == "-" else sys.stdout)
+    if args.json == "-":
+        json.dump(doc, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        Path(args.json).write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {baseline_path}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
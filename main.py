@@ -1,68 +1,325 @@
 from __future__ import annotations
 import argparse
-from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, Optional, Union
 
-from app.application.scheduler_runner import SchedulerRunner
-# Graph & LLM
-from app.workflows.schedule.graph import build_graph
-from app.infra.llm.ollama_client import OllamaClient
-from app.infra.llm.types import ExtractOptions
+from app.domain.owners import DEFAULT_OWNER
 
-# Ports & runner
-from app.ui.cli.io import CLIIO
-from app.infra.calendar.adapters import InMemoryCalendarAdapter
+# Subcommands import what they use when they run: `list` must not pay for
+# langchain/langgraph/Ollama (see benchmarks/bench_startup.py for the budget).
+if TYPE_CHECKING:
+    from app.application.scheduler_runner import SchedulerRunner
+    from app.infra.llm.cache import CachingLLMClient
+    from app.infra.llm.cascade import CascadingLLMClient
+    from app.infra.llm.pool import ClientPool
+    from app.infra.telemetry.tracing import Telemetry
+    from app.workflows.schedule.nodes.extract import Speculation
 
-# ---- prompt loading (assembly-time, not business logic) ----
-PROMPTS_DIR = Path("app/prompts")
+def build_calendar(db: Optional[str]):
+    """In-memory calendar by default; a SQLite file when --db is given."""
+    from app.infra.calendar.adapters import InMemoryCalendarAdapter, SQLiteCalendarAdapter
 
-def _read(p: Path, default: str = "") -> str:
-    try:
-        return p.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return default
-
-def load_extract_options() -> ExtractOptions:
-    system = _read(PROMPTS_DIR / "schedule" / "system.md",
-                   "You are a precise extraction assistant for scheduling.")
-    instructions = _read(PROMPTS_DIR / "schedule" / "extract.md",
-                         "Extract meeting fields per the provided JSON Schema.")
-    guardrail = _read(PROMPTS_DIR / "_fragments" / "json_only.md",
-                      "Return ONLY a single JSON object that matches the schema; no extra keys.")
-    return ExtractOptions(system=system, instructions=instructions, guardrail=guardrail)
-
-def build_runner(tz: str, model: str, temperature: float) -> SchedulerRunner:
-    # LLM + options
-    llm = OllamaClient(model=model, temperature=temperature)
-    options = load_extract_options()
-
-    # Compile workflow graph with DI
-    graph = build_graph(llm, options)
+    if db:
+        return SQLiteCalendarAdapter(db)
+    return InMemoryCalendarAdapter()
+
+def build_telemetry(args) -> Optional[Telemetry]:
+    """Tracing/metrics only when asked for (--trace, --metrics); otherwise nothing is wrapped."""
+    if not (args.trace or args.metrics):
+        return None
+    import logging
+    from app.infra.telemetry.tracing import Telemetry
+
+    if args.trace:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        trace_log = logging.getLogger("scheduler.trace")
+        trace_log.addHandler(handler)
+        trace_log.setLevel(logging.INFO)
+    return Telemetry(log_spans=args.trace)
+
+def write_metrics(telemetry: Optional[Telemetry], path: Optional[str]) -> None:
+    if telemetry is not None and path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(telemetry.snapshot())
+
+def build_pool(args) -> ClientPool:
+    """Shared Ollama connections with per-model in-flight limits and a call deadline."""
+    from app.infra.llm.pool import ClientPool
+
+    return ClientPool(max_in_flight=args.max_in_flight, max_waiting=args.queue_limit,
+                      timeout_s=args.llm_timeout)
+
+def warm_models(pool: ClientPool, model: str, keep_alive: Optional[str]) -> None:
+    """Load every model up front so the first request doesn't pay for it."""
+    loaded = pool.warmup([m.strip() for m in model.split(",") if m.strip()], keep_alive)
+    print("warmup: " + ", ".join(f"{m} {t}s" if isinstance(t, float) else f"{m} {t}" for m, t in loaded.items()),
+          file=sys.stderr)
+
+def build_llm(model: str, temperature: float, llm_cache: Optional[str] = None,
+              stream: bool = False, keep_alive: Optional[str] = None,
+              telemetry: Optional[Telemetry] = None,
+              pool: Optional[ClientPool] = None) -> Union[CachingLLMClient, CascadingLLMClient]:
+    """One model, or a cascade for a comma-separated list (cheapest first, e.g. "qwen2.5:1.5b,mistral:7b")."""
+    from app.infra.llm.cache import CachingLLMClient
+    from app.infra.llm.ollama_client import OllamaClient
+
+    # Ollama client + response cache (disk tier only when a path is given), per model
+    models = [m.strip() for m in model.split(",") if m.strip()]
+    clients = [
+        CachingLLMClient(OllamaClient(model=m, temperature=temperature, stream=stream,
+                                      keep_alive=keep_alive, telemetry=telemetry, pool=pool),
+                         disk_path=llm_cache)
+        for m in models
+    ]
+    if len(clients) == 1:
+        return clients[0]
+    from app.infra.llm.cascade import CascadingLLMClient
+    return CascadingLLMClient(list(zip(models, clients)))
+
+def build_speculation(model: str, temperature: float, budget: int, spread: float,
+                      stream: bool = False, keep_alive: Optional[str] = None,
+                      telemetry: Optional[Telemetry] = None,
+                      pool: Optional[ClientPool] = None) -> Optional[Speculation]:
+    """budget-1 uncached variants of the (first) extract model at rising temperatures; None when budget <= 1."""
+    if budget <= 1:
+        return None
+    model = model.split(",")[0].strip()
+    from app.infra.llm.ollama_client import OllamaClient
+    from app.workflows.schedule.nodes.extract import Candidate, Speculation
+
+    variants = [
+        Candidate(OllamaClient(model=model, temperature=min(1.0, temperature + spread * i), stream=stream,
+                               keep_alive=keep_alive, telemetry=telemetry, pool=pool))
+        for i in range(1, budget)
+    ]
+    return Speculation(variants=variants, budget=budget)
+
+def build_schedule_graph(model: str, temperature: float, calendar=None, llm_cache: Optional[str] = None,
+                         stream: bool = False, keep_alive: Optional[str] = None,
+                         telemetry: Optional[Telemetry] = None, speculate: int = 1, spread: float = 0.3,
+                         pool: Optional[ClientPool] = None):
+    from langgraph.checkpoint.memory import InMemorySaver
+    from app.prompts.loader import load_options
+    from app.workflows.schedule.graph import build_graph
+
+    llm = build_llm(model, temperature, llm_cache, stream, keep_alive, telemetry, pool)
+    options = load_options("schedule")
+
+    speculation = build_speculation(model, temperature, speculate, spread, stream, keep_alive, telemetry, pool)
+
+    # Compile workflow graph with DI; checkpointed so clarify answers resume the draft
+    return build_graph(llm, options, calendar, checkpointer=InMemorySaver(), telemetry=telemetry,
+                       speculation=speculation)
+
+def build_runner(tz: str, model: str, temperature: float, db: Optional[str] = None,
+                 llm_cache: Optional[str] = None, stream: bool = False,
+                 owner: str = DEFAULT_OWNER, telemetry: Optional[Telemetry] = None,
+                 speculate: int = 1, spread: float = 0.3, keep_alive: Optional[str] = None,
+                 pool: Optional[ClientPool] = None) -> SchedulerRunner:
+    from app.application.scheduler_runner import SchedulerRunner
+    from app.ui.cli.io import CLIIO
 
     # IO & Calendar adapters
     io = CLIIO()
-    calendar = InMemoryCalendarAdapter()
+    calendar = build_calendar(db)
+
+    graph = build_schedule_graph(model, temperature, calendar, llm_cache, stream, keep_alive,
+                                 telemetry=telemetry, speculate=speculate, spread=spread, pool=pool)
+
+    return SchedulerRunner(graph=graph, io=io, calendar=calendar, tz=tz, owner=owner)
+
+def run_list(args) -> None:
+    """Print the owner's events; needs the calendar and nothing else."""
+    from app.ui.cli.presenter import print_events
+
+    print_events(build_calendar(args.db).list_all(owner=args.owner), args.tz)
 
-    return SchedulerRunner(graph=graph, io=io, calendar=calendar, tz=tz)
+def _progress_printer(verb: str):
+    """A progress callback that prints at most one line a second to stderr."""
+    last = 0.0
+
+    def show(stats) -> None:
+        nonlocal last
+        if stats.seconds - last >= 1.0:
+            last = stats.seconds
+            skipped = f" ({stats.skipped} skipped)" if stats.skipped else ""
+            print(f"{verb}: {stats.events:,} events{skipped}, {stats.rate:,.0f}/s", file=sys.stderr)
+    return show
+
+def run_import(args) -> None:
+    """Bulk-load an .ics file into the owner's calendar (no model, no conflict checks)."""
+    from app.application.ics_transfer import import_ics
+
+    def skipped(s) -> None:
+        print(f"skipped VEVENT at line {s.line}: {s.reason}", file=sys.stderr)
+
+    calendar = build_calendar(args.db)
+    stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8-sig")
+    with stream:
+        stats = import_ics(calendar, stream, tz=args.tz, owner=args.owner, batch_size=args.batch_size,
+                           progress=None if args.quiet else _progress_printer("import"),
+                           on_skip=None if args.quiet else skipped)
+    print(f"imported {stats.stored:,} of {stats.events:,} events ({stats.skipped} skipped) "
+          f"in {stats.seconds:.1f}s, {stats.rate:,.0f}/s", file=sys.stderr)
+
+def run_export(args) -> None:
+    """Write the owner's calendar as iCalendar."""
+    from app.application.ics_transfer import export_ics
+
+    calendar = build_calendar(args.db)
+    stream = sys.stdout if args.file == "-" else open(args.file, "w", encoding="utf-8", newline="")
+    try:
+        stats = export_ics(calendar, stream, tz=args.tz, owner=args.owner,
+                           progress=None if args.quiet else _progress_printer("export"))
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    print(f"exported {stats.events:,} events in {stats.seconds:.1f}s", file=sys.stderr)
+
+def run_batch(args) -> None:
+    """Stream NDJSON results for a JSONL file of requests (non-interactive)."""
+    from app.application.batch_runner import BatchRunner
+    from app.contracts.extraction import MeetingRequest
+    from app.prompts.loader import compile_options, load_options, prompt_info
+    from app.ui.cli.ndjson import read_requests, write_result
+    from app.workflows.schedule.graph import build_graph
+    from app.workflows.schedule.nodes.fastpath import FastPathNode
+
+    telemetry = build_telemetry(args)
+    calendar = build_calendar(args.db)
+    pool = build_pool(args)
+    if args.warmup:
+        warm_models(pool, args.model, args.keep_alive)
+    llm = build_llm(args.model, args.temp, args.llm_cache, args.stream, args.keep_alive, telemetry, pool)
+    options = compile_options(load_options("schedule"), MeetingRequest.model_json_schema())
+    fast_path = FastPathNode()
+    speculation = build_speculation(args.model, args.temp, args.speculate, args.spread, args.stream,
+                                    args.keep_alive, telemetry, pool)
+    runner = BatchRunner(
+        graph=build_graph(llm, options, calendar, fast_path, telemetry=telemetry, speculation=speculation),
+        calendar=calendar,
+        tz=args.tz,
+        policy=args.policy,
+        workers=args.workers,
+        owner=args.owner,
+    )
+    stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    with stream:
+        for result in runner.run(read_requests(stream), ordered=not args.unordered):
+            write_result(sys.stdout, result)
+    write_result(sys.stderr, {
+        "prompt": prompt_info(options),
+        **({"cascade": llm.cascade_stats()} if hasattr(llm, "cascade_stats") else {"llm_cache": llm.cache_stats()}),
+        "fast_path": fast_path.stats.snapshot(),
+        "pool": pool.pool_stats(),
+    })
+    write_metrics(telemetry, args.metrics)
+
+def run_server(args) -> None:
+    """Build the graph once and serve scheduling sessions over HTTP until interrupted."""
+    import asyncio
+    from app.ui.http.server import SchedulingServer
+
+    telemetry = build_telemetry(args)
+    calendar = build_calendar(args.db)
+    pool = build_pool(args)
+    if args.warmup:
+        warm_models(pool, args.model, args.keep_alive)
+    graph = build_schedule_graph(args.model, args.temp, calendar, args.llm_cache, args.stream,
+                                 keep_alive=args.keep_alive, telemetry=telemetry,
+                                 speculate=args.speculate, spread=args.spread, pool=pool)
+    server = SchedulingServer(graph, calendar, tz=args.tz, owner=args.owner,
+                              session_ttl_s=args.session_ttl, telemetry=telemetry)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        write_metrics(telemetry, args.metrics)
 
 def main():
     ap = argparse.ArgumentParser(prog="scheduler")
     sub = ap.add_subparsers(dest="cmd", required=True)
 
-    p_sched = sub.add_parser("schedule", help="Schedule from natural language")
+    # Options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--tz", default="America/Chicago")
+    common.add_argument("--db", default=None, help="SQLite calendar file (default: in-memory)")
+    common.add_argument("--owner", default=DEFAULT_OWNER, help="whose calendar (user or resource id)")
+
+    # Options for subcommands that talk to the model
+    llm_opts = argparse.ArgumentParser(add_help=False)
+    llm_opts.add_argument("--model", default="mistral:7b",
+                          help="model, or a comma-separated cascade cheapest first (escalates on invalid drafts)")
+    llm_opts.add_argument("--temp", type=float, default=0.2)
+    llm_opts.add_argument("--llm-cache", default=None, help="SQLite file for the persistent LLM response cache")
+    llm_opts.add_argument("--stream", action="store_true", help="stream tokens and stop at the first complete JSON object")
+    llm_opts.add_argument("--speculate", type=int, default=1, metavar="K",
+                          help="race K extract requests, first valid draft wins (1 = off)")
+    llm_opts.add_argument("--spread", type=float, default=0.3,
+                          help="temperature step between speculative variants")
+    llm_opts.add_argument("--keep-alive", default=None, help="how long Ollama keeps the model loaded between calls")
+    llm_opts.add_argument("--warmup", action=argparse.BooleanOptionalAction, default=False,
+                          help="load the model(s) before the first request")
+    llm_opts.add_argument("--max-in-flight", type=int, default=4, help="concurrent requests per model; the rest queue")
+    llm_opts.add_argument("--queue-limit", type=int, default=None,
+                          help="queued requests per model before failing fast (default: unbounded)")
+    llm_opts.add_argument("--llm-timeout", type=float, default=None,
+                          help="seconds per model call, queueing included; the request is aborted after that")
+    llm_opts.add_argument("--trace", action="store_true", help="log a JSON line per node/model span to stderr")
+    llm_opts.add_argument("--metrics", default=None, help="write a Prometheus text snapshot here on exit")
+
+    p_sched = sub.add_parser("schedule", parents=[common, llm_opts], help="Schedule from natural language")
     p_sched.add_argument("text", nargs="+", help='e.g. "Lunch with Sarah tomorrow 1pm for 90 minutes at the office"')
-    p_sched.add_argument("--tz", default="America/Chicago")
-    p_sched.add_argument("--model", default="mistral:7b")
-    p_sched.add_argument("--temp", type=float, default=0.2)
 
-    sub.add_parser("list", help="List events")
+    sub.add_parser("list", parents=[common], help="List events")
 
-    args = ap.parse_args()
-    runner = build_runner(tz=args.tz, model=getattr(args, "model", "mistral:7b"), temperature=getattr(args, "temp", 0.2))
+    p_batch = sub.add_parser("batch", parents=[common, llm_opts], help="Schedule a JSONL file of requests, NDJSON out")
+    p_batch.add_argument("file", help='JSONL of {"text": ...} objects or strings; "-" for stdin')
+    p_batch.add_argument("--workers", type=int, default=4, help="max requests in flight")
+    p_batch.add_argument("--policy", choices=["dry-run", "auto-book"], default="dry-run")
+    p_batch.add_argument("--unordered", action="store_true", help="emit results as they complete")
 
-    if args.cmd == "schedule":
-        runner.schedule(" ".join(args.text))
-    elif args.cmd == "list":
-        runner.list_events()
+    p_import = sub.add_parser("import", parents=[common], help="Bulk-load an iCalendar (.ics) file")
+    p_import.add_argument("file", help='.ics file; "-" for stdin')
+    p_import.add_argument("--batch-size", type=int, default=5000, help="events per lock/transaction")
+    p_import.add_argument("--quiet", action="store_true", help="no progress or skipped-event lines")
+
+    p_export = sub.add_parser("export", parents=[common], help="Write the calendar as iCalendar (.ics)")
+    p_export.add_argument("file", nargs="?", default="-", help='output file; "-" (default) for stdout')
+    p_export.add_argument("--quiet", action="store_true", help="no progress lines")
+
+    p_serve = sub.add_parser("serve", parents=[common, llm_opts], help="Run the HTTP/JSON scheduling service")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8080)
+    p_serve.set_defaults(keep_alive="30m", warmup=True, llm_timeout=120.0)
+    p_serve.add_argument("--session-ttl", type=float, default=600.0, help="seconds before an idle session is cancelled")
+
+    args = ap.parse_args()
+    if args.cmd == "list":
+        run_list(args)
+    elif args.cmd == "batch":
+        run_batch(args)
+    elif args.cmd == "import":
+        run_import(args)
+    elif args.cmd == "export":
+        run_export(args)
+    elif args.cmd == "serve":
+        run_server(args)
+    elif args.cmd == "schedule":
+        telemetry = build_telemetry(args)
+        pool = build_pool(args)
+        if args.warmup:
+            warm_models(pool, args.model, args.keep_alive)
+        runner = build_runner(tz=args.tz, model=args.model, temperature=args.temp, db=args.db,
+                              llm_cache=args.llm_cache, stream=args.stream, owner=args.owner,
+                              telemetry=telemetry, speculate=args.speculate, spread=args.spread,
+                              keep_alive=args.keep_alive, pool=pool)
+        try:
+            runner.schedule(" ".join(args.text))
+        finally:
+            write_metrics(telemetry, args.metrics)
 
 if __name__ == "__main__":
     main()